@@ -0,0 +1,97 @@
+"""Asynchronous ``frame_callback`` dispatch.
+
+A ``frame_callback`` that runs a neural net takes far longer than a frame
+interval.  Called inline from the main loop it stalls frame consumption and
+display for every camera.  ``CallbackDispatcher`` runs callbacks on a small
+thread pool instead, with at most one callback in flight per camera.  Frames
+arriving for a camera whose callback is still running replace each other in a
+one-slot pending buffer (drop-oldest), so a slow callback sees the newest
+frame next and never builds a backlog.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Set
+
+import cv2
+
+
+def umat_callback(
+    callback: Callable[[Any, Any], None],
+) -> Callable[[Any, Any], None]:
+    """Wrap ``callback`` so it receives frames as ``cv2.UMat``.
+
+    OpenCV functions called on a UMat go through the Transparent API and run
+    as OpenCL kernels on the GPU when one is available (plain CPU code
+    otherwise).  The upload happens in the calling thread, i.e. on a
+    dispatcher worker, and only for frames the callback actually gets.
+    """
+
+    def call(camera_id: Any, frame: Any):
+        callback(camera_id, cv2.UMat(frame))
+
+    return call
+
+
+class CallbackDispatcher:
+    def __init__(
+        self,
+        callback: Callable[[Any, Any], None],
+        max_workers: int,
+        logger: logging.Logger,
+    ):
+        """
+        Run a frame callback on a worker pool, newest frame per camera
+
+        Args:
+            callback: Called as ``callback(camera_id, frame)``
+            max_workers: Worker threads shared by all cameras
+            logger: Logger for callback exceptions
+        """
+        self.callback = callback
+        self.logger = logger
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="frame-callback"
+        )
+        self._lock = threading.Lock()
+        self._busy: Set[Any] = set()
+        self._pending: Dict[Any, Any] = {}
+        self._closed = False
+
+    def submit(self, camera_id: Any, frame: Any):
+        """Schedule ``callback(camera_id, frame)`` without blocking the caller."""
+        with self._lock:
+            if self._closed:
+                return
+            if camera_id in self._busy:
+                # Replace any older frame still waiting for this camera
+                self._pending[camera_id] = frame
+                return
+            self._busy.add(camera_id)
+        self._executor.submit(self._run, camera_id, frame)
+
+    def _run(self, camera_id: Any, frame: Any):
+        """Invoke the callback, then keep going while newer frames are pending."""
+        while True:
+            try:
+                self.callback(camera_id, frame)
+            except Exception as e:
+                self.logger.error(
+                    "Frame callback error for camera %s: %s", camera_id, e
+                )
+            with self._lock:
+                if camera_id not in self._pending or self._closed:
+                    self._busy.discard(camera_id)
+                    return
+                frame = self._pending.pop(camera_id)
+
+    def shutdown(self, wait: bool = False):
+        """Drop pending frames and stop the worker pool."""
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,135 @@
+"""HighGUI helpers shared by the manager and sequential display loops."""
+
+import math
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+
+# Cleared once the OpenCV build turns out to lack OpenGL windows (the
+# opencv-python wheels do), so the attempt isn't repeated for every window
+_opengl_windows = True
+
+
+def create_window(title: str):
+    """Create ``title`` as an OpenGL window where the OpenCV build allows.
+
+    ``imshow`` into an OpenGL window uploads the frame as a texture and
+    lets the GPU scale and draw it instead of converting and blitting it
+    on the CPU.  Without OpenGL support nothing is created and the first
+    ``imshow`` opens an ordinary window, as before.
+    """
+    global _opengl_windows
+    if not _opengl_windows:
+        return
+    try:
+        cv2.namedWindow(title, cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+    except cv2.error:
+        _opengl_windows = False
+
+
+def poll_key() -> int:
+    """Pump HighGUI events once and return the pressed key (-1 if none).
+
+    ``cv2.waitKey(1)`` always sleeps: a whole scheduler tick on Windows
+    (~15 ms), which caps the display loop at ~60 iterations/s no matter how
+    fast the cameras deliver, and at least a millisecond elsewhere.
+    ``cv2.pollKey()`` (OpenCV >= 4.5) returns immediately, so it is used
+    when available; callers pace their loop by waiting for frames.
+    """
+    if hasattr(cv2, "pollKey"):
+        return cv2.pollKey()
+    return cv2.waitKey(1)
+
+
+def to_bgr(frame: np.ndarray) -> Optional[np.ndarray]:
+    """Convert a raw capture frame (``frame_format="raw"``) to BGR for display.
+
+    Handles packed YUYV (``H x W x 2``) and compressed MJPEG byte buffers;
+    BGR frames are returned as is.  Returns None for formats it can't show.
+    """
+    if frame.ndim == 3 and frame.shape[2] == 3:
+        return frame
+    if frame.ndim == 3 and frame.shape[2] == 2:
+        return cv2.cvtColor(frame, cv2.COLOR_YUV2BGR_YUYV)
+    if frame.ndim <= 2 and frame.dtype == np.uint8 and min(frame.shape) == 1:
+        return cv2.imdecode(frame.reshape(-1), cv2.IMREAD_COLOR)
+    return None
+
+
+def grid_shape(count: int, cols: Optional[int] = None) -> Tuple[int, int]:
+    """Return ``(rows, cols)`` of the most square grid that fits ``count`` tiles."""
+    count = max(1, count)
+    cols = cols or math.ceil(math.sqrt(count))
+    return math.ceil(count / cols), cols
+
+
+class Mosaic:
+    """Reusable grid canvas that all cameras are shown on with one ``imshow``.
+
+    The canvas is allocated once per grid layout and every frame is copied
+    straight into its tile slice, instead of concatenating rows and then
+    the rows into a new image (two full copies and fresh allocations on
+    every display tick).
+    """
+
+    def __init__(self, tile_size: Tuple[int, int], cols: Optional[int] = None):
+        """
+        Args:
+            tile_size: ``(width, height)`` of one tile; frames of another
+                size are resized to it
+            cols: Number of grid columns (default: as square as possible)
+        """
+        self.tile_size = tile_size
+        self.cols = cols
+        self._canvas: Optional[np.ndarray] = None
+        self._layout: Optional[Tuple[int, int]] = None
+        self._used = 0
+
+    def render(self, frames: List[np.ndarray]) -> np.ndarray:
+        """Copy frames (in display order) into the canvas and return it.
+
+        The returned array is reused by the next call.
+        """
+        width, height = self.tile_size
+        layout = grid_shape(len(frames), self.cols)
+        if layout != self._layout:
+            rows, cols = layout
+            self._canvas = np.zeros((rows * height, cols * width, 3), np.uint8)
+            self._layout = layout
+            self._used = 0
+
+        for index, frame in enumerate(frames):
+            tile = self.tile(index)
+            if frame.shape[:2] != (height, width):
+                # Resize straight into the tile; OpenCV only allocates a new
+                # array when the frame's type doesn't match the canvas.
+                frame = cv2.resize(frame, (width, height), dst=tile)
+                if frame is tile:
+                    continue
+            tile[...] = frame
+        # Blank tiles left over from cameras that went away
+        for index in range(len(frames), self._used):
+            self.tile(index).fill(0)
+        self._used = len(frames)
+        return self._canvas
+
+    def tile(self, index: int) -> np.ndarray:
+        """Return the canvas view of tile ``index`` (row-major)."""
+        width, height = self.tile_size
+        row, col = divmod(index, self._layout[1])
+        return self._canvas[
+            row * height : (row + 1) * height, col * width : (col + 1) * width
+        ]
+
+
+def build_mosaic(
+    frames: List[np.ndarray],
+    tile_size: Tuple[int, int],
+    cols: Optional[int] = None,
+) -> np.ndarray:
+    """Tile frames into a new image; see :class:`Mosaic` for repeated use."""
+    return Mosaic(tile_size, cols).render(frames)
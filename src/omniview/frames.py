@@ -0,0 +1,135 @@
+"""Latest-frame hand-off between capture threads and the consumer.
+
+A ``queue.Queue`` between camera threads and the main loop lets stale
+frames pile up (a slow consumer sees frames seconds old) and makes every
+producer block on a full queue.  ``LatestFrameSlots`` keeps exactly one
+slot per camera instead: a producer overwrites its own slot, the
+consumer always reads the newest frame, and producers never block.
+The consumer can sleep in ``wait``/``get`` until any camera delivers
+instead of polling.
+
+It exposes the subset of the ``queue.Queue`` API the producers and
+consumers in this package use (``put``, ``put_nowait``, ``get_nowait``,
+``get``, ``empty``, ``qsize``), so capture threads, ``MultiplexGroup`` and
+``SequentialController`` can write into it unchanged.
+"""
+
+import queue
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+
+# Sampling stride of frame_signature(): every 16th pixel of every 16th row,
+# i.e. a 40x30 grid (3.6 KB) of a 640x480 BGR frame
+SIGNATURE_STEP = 16
+
+
+def frame_signature(frame: Any) -> int:
+    """Cheap fingerprint of a frame from a sparse grid of its pixels.
+
+    Equal signatures mean the sampled pixels are byte-identical, which is
+    what a decoder produces for a static scene; a change confined to
+    pixels between the samples goes unnoticed.
+    """
+    step = slice(None, None, SIGNATURE_STEP)
+    return hash(frame[(step,) * min(frame.ndim, 2)].tobytes())
+
+
+def put_latest(frame_queue: Any, item: Tuple[Any, Any]):
+    """Put without blocking, evicting the oldest item if the queue is full.
+
+    Producers write into either a ``LatestFrameSlots`` (never full) or a
+    caller-supplied bounded ``queue.Queue``.  A blocking ``put`` on the
+    latter stalls the capture thread whenever the consumer falls behind;
+    for live video the stale head of the queue is the frame to lose.
+    """
+    try:
+        frame_queue.put_nowait(item)
+        return
+    except queue.Full:
+        pass
+    try:
+        frame_queue.get_nowait()
+    except queue.Empty:
+        pass
+    try:
+        frame_queue.put_nowait(item)
+    except queue.Full:
+        # Another producer refilled the slot first; this frame is dropped
+        pass
+
+
+class LatestFrameSlots:
+    """One overwrite-on-put frame slot per source (camera ID).
+
+    Items are ``(source, frame)`` tuples, the same shape producers put into
+    a ``queue.Queue``.  Each slot also records the capture timestamp.
+    """
+
+    def __init__(self):
+        self._slots: Dict[Any, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+
+    def put(self, item: Tuple[Any, Any], block: bool = True, timeout=None):
+        """Store a frame, replacing any unread frame from the same source.
+
+        ``block`` and ``timeout`` are accepted for ``queue.Queue``
+        compatibility; a slot is never full, so ``put`` never waits.
+        """
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Tuple[Any, Any]):
+        source, frame = item
+        with self._lock:
+            # Waiters only sleep while every slot is empty, so only the put
+            # that ends that state has anyone to wake
+            wake = not self._slots
+            self._slots[source] = (frame, time.time())
+            if wake:
+                self._ready.notify_all()
+
+    def get_nowait(self) -> Tuple[Any, Any]:
+        """Pop the unread frame of one source as ``(source, frame)``.
+
+        Raises:
+            queue.Empty: no source has an unread frame
+        """
+        return self.get(block=False)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        """Pop one unread frame, waiting up to ``timeout`` for one to arrive.
+
+        Raises:
+            queue.Empty: no frame arrived in time (or at once if not block)
+        """
+        with self._lock:
+            if block and not self._ready.wait_for(lambda: self._slots, timeout):
+                raise queue.Empty
+            if not self._slots:
+                raise queue.Empty
+            source = next(iter(self._slots))
+            frame, _ = self._slots.pop(source)
+        return source, frame
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until some source has an unread frame; False on timeout."""
+        with self._lock:
+            return bool(self._ready.wait_for(lambda: self._slots, timeout))
+
+    def drain(self) -> Dict[Any, Tuple[Any, float]]:
+        """Take every unread frame at once as ``{source: (frame, timestamp)}``."""
+        with self._lock:
+            slots, self._slots = self._slots, {}
+        return slots
+
+    def qsize(self) -> int:
+        with self._lock:
+            return len(self._slots)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
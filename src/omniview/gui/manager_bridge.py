@@ -27,7 +27,6 @@ share a single ``frame_queue``.  IP camera IDs are offset by
 from __future__ import annotations
 
 import logging
-import queue
 import threading
 import time
 from typing import Any, Dict, Optional, Set
@@ -35,6 +34,7 @@ from typing import Any, Dict, Optional, Set
 import numpy as np
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
 
+from omniview.frames import LatestFrameSlots
 from omniview.managers import IPCameraManager
 from omniview.managers import USBCameraManager
 from omniview.sequential import SequentialController
@@ -118,8 +118,8 @@ class ManagerBridge(QObject):
         self._ip_manager: Optional[IPCameraManager] = None
         self._ip_monitor_thread: Optional[threading.Thread] = None
 
-        # Shared frame queue (created once, passed to both managers)
-        self._frame_queue: queue.Queue = queue.Queue(maxsize=30)
+        # Shared latest-frame slots (created once, passed to both managers)
+        self._frame_queue: LatestFrameSlots = LatestFrameSlots()
 
         # Log handlers (one per manager)
         self._log_handlers: list[QLogHandler] = []
@@ -227,14 +227,8 @@ class ManagerBridge(QObject):
             if mgr is not None:
                 mgr.stop()
 
-        # Now drain + join until all threads are dead.
-        # Camera threads use blocking frame_queue.put(). When the
-        # queue is full and the poll timer (the only consumer) is
-        # already stopped, a thread can be stuck inside put()
-        # indefinitely — it never checks stop_event, cap.release()
-        # never runs, and V4L2 devices stay locked.  Continuously
-        # draining the queue unblocks those threads so they notice
-        # stop_event and exit.
+        # Now join until all threads are dead.  Frame slots never block
+        # put(), so threads notice stop_event without the consumer running.
         monitor_threads = [
             t
             for t in (self._usb_monitor_thread, self._ip_monitor_thread)
@@ -246,19 +240,8 @@ class ManagerBridge(QObject):
         for t in all_threads:
             remaining = max(0.05, deadline - time.time())
             t.join(timeout=remaining)
-            # Drain between joins to unblock other threads stuck on put()
-            while not self._frame_queue.empty():
-                try:
-                    self._frame_queue.get_nowait()
-                except queue.Empty:
-                    break
 
-        # Final aggressive drain
-        while not self._frame_queue.empty():
-            try:
-                self._frame_queue.get_nowait()
-            except queue.Empty:
-                break
+        self._frame_queue.drain()
 
         self._usb_manager = None
         self._ip_manager = None
@@ -302,8 +285,8 @@ class ManagerBridge(QObject):
                 self._pending_attrs = attrs
                 self._prev_camera_ids = set()
                 self._cached_frames.clear()
-                # Recreate the shared queue to discard stale frames
-                self._frame_queue = queue.Queue(maxsize=30)
+                # Recreate the shared slots to discard stale frames
+                self._frame_queue = LatestFrameSlots()
                 # Give V4L2 devices time to fully release after old
                 # threads exit.  Without this, the new manager's
                 # _get_available_devices() probe finds devices busy
@@ -412,6 +395,17 @@ class ManagerBridge(QObject):
                     fps=ip_mgr.fps,
                     min_uptime=ip_mgr.min_uptime,
                     hw_acceleration=ip_mgr.hw_acceleration,
+                    sample_every=ip_mgr.sample_every,
+                    target_fps=ip_mgr.target_fps,
+                    reuse_buffers=ip_mgr.reuse_buffers,
+                    frame_format=ip_mgr.frame_format,
+                    cpu_affinity=ip_mgr._thread_cpu(camera_id),
+                    output_width=ip_mgr.output_width,
+                    output_height=ip_mgr.output_height,
+                    cuda_decode=ip_mgr.cuda_decode,
+                    gstreamer=ip_mgr.gstreamer,
+                    gpu_frames=ip_mgr.gpu_frames,
+                    rtsp_transport=ip_mgr.rtsp_transport,
                 )
                 return thread
 
@@ -484,25 +478,20 @@ class ManagerBridge(QObject):
     @pyqtSlot()
     def _poll(self) -> None:
         """Called by the poll timer: drain frames + detect camera changes."""
-        # 1) Drain shared frame queue directly
+        # 1) Take the newest frame of every camera from the shared slots
         frames: Dict[int, np.ndarray] = {}
-        while True:
-            try:
-                dev_id, frame = self._frame_queue.get_nowait()
-                if frame is not None and len(frame.shape) == 3:
-                    frames[dev_id] = frame
-                    self._cached_frames[dev_id] = frame
-            except queue.Empty:
-                break
+        for dev_id, (frame, _) in self._frame_queue.drain().items():
+            if frame is not None and len(frame.shape) == 3:
+                frames[dev_id] = frame
+                self._cached_frames[dev_id] = frame
 
         # 2) Merge with cached frames (show last known frame for idle cams)
         for mgr in (self._usb_manager, self._ip_manager):
             if mgr is None:
                 continue
-            with mgr.lock:
-                for dev_id in list(mgr.cameras.keys()):
-                    if dev_id not in frames and dev_id in self._cached_frames:
-                        frames[dev_id] = self._cached_frames[dev_id]
+            for dev_id, _ in mgr.cameras.snapshot():
+                if dev_id not in frames and dev_id in self._cached_frames:
+                    frames[dev_id] = self._cached_frames[dev_id]
 
         # 2b) Merge multiplexed camera frames (from scheduler, not from threads)
         mpx_scheduler = (
@@ -561,8 +550,7 @@ class ManagerBridge(QObject):
         all_known: Set[int] = set()
         for mgr in (self._usb_manager, self._ip_manager):
             if mgr is not None:
-                with mgr.lock:
-                    all_known.update(mgr.cameras.keys())
+                all_known.update(dev_id for dev_id, _ in mgr.cameras.snapshot())
         if mpx_scheduler is not None:
             all_known.update(mpx_scheduler.get_multiplex_cameras())
         # In sequential mode, the controller's sources are the known
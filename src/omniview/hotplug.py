@@ -0,0 +1,127 @@
+"""Event-driven ``/dev/videoN`` hot-plug notifications (Linux inotify).
+
+The USB manager's monitor rescans devices every few seconds, so a camera
+plugged in right after a scan waits up to one full interval to appear.
+``DeviceNodeWatcher`` watches ``/dev`` with inotify (through libc, no extra
+dependency) and fires a callback as soon as udev creates, removes or
+re-permissions a video node; the monitor then rescans immediately.  The
+periodic scan stays as the fallback and keeps restarting dead threads.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from typing import Callable
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_IN_ATTRIB = 0x00000004  # udev applies the device permissions after creation
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc():
+    if sys.platform != "linux":
+        return None
+    try:
+        libc = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+        )
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+def parse_events(buffer: bytes):
+    """Yield ``(mask, name)`` for every inotify event in a read buffer."""
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(buffer):
+        _, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+        offset += _EVENT_HEADER.size
+        name = buffer[offset : offset + length].rstrip(b"\0")
+        offset += length
+        yield mask, name
+
+
+class DeviceNodeWatcher:
+    """Call ``on_change()`` whenever a matching device node appears or goes."""
+
+    def __init__(
+        self,
+        on_change: Callable[[], None],
+        directory: str = "/dev",
+        prefix: str = "video",
+    ):
+        """
+        Args:
+            on_change: Called from the watcher thread on every relevant event
+            directory: Directory holding the device nodes
+            prefix: Node name prefix to react to
+        """
+        self.on_change = on_change
+        self.directory = directory
+        self.prefix = prefix.encode()
+        self._fd: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """Start watching; returns False where inotify is unavailable."""
+        libc = _load_libc()
+        if libc is None:
+            return False
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            logger.warning("inotify_init1 failed: %s", os.strerror(ctypes.get_errno()))
+            return False
+        mask = _IN_CREATE | _IN_DELETE | _IN_ATTRIB
+        if libc.inotify_add_watch(fd, self.directory.encode(), mask) < 0:
+            logger.warning(
+                "Cannot watch %s: %s", self.directory, os.strerror(ctypes.get_errno())
+            )
+            os.close(fd)
+            return False
+
+        self._fd = fd
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="device-node-watcher", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            # Short select timeout so stop() is noticed promptly
+            ready, _, _ = select.select([self._fd], [], [], 0.5)
+            if not ready:
+                continue
+            try:
+                buffer = os.read(self._fd, 4096)
+            except BlockingIOError:
+                continue
+            except OSError:
+                return
+            if any(name.startswith(self.prefix) for _, name in parse_events(buffer)):
+                self.on_change()
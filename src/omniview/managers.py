@@ -1,11 +1,11 @@
 import logging
 import os
-import queue
 import sys
 import threading
 import time
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -15,8 +15,18 @@ from typing import Set
 
 import cv2
 
+from .callbacks import CallbackDispatcher
+from .callbacks import umat_callback
+from .display import Mosaic
+from .display import create_window
+from .display import poll_key
+from .display import to_bgr
+from .frames import LatestFrameSlots
+from .frames import frame_signature
+from .hotplug import DeviceNodeWatcher
 from .multiplex import MultiplexScheduler
 from .sequential import SequentialController
+from .shared import SharedFramePublisher
 from .threads import BaseCameraThread
 from .threads import IPCameraThread
 from .threads import USBCameraThread
@@ -25,7 +35,66 @@ from .usb_topology import present_capture_devices
 from .usb_topology import present_video_devices
 
 
+class CameraTable(dict):
+    """``dev_id -> camera state`` dict with a lock-free read snapshot.
+
+    Cameras are added and removed rarely (hot-plug), but the display loop
+    reads the table every iteration.  Every mutation rebuilds an immutable
+    tuple of ``(dev_id, state)`` pairs; ``snapshot()`` just returns it, so
+    readers need neither the manager's lock nor a fresh list copy.  Writers
+    still mutate the table under the manager's lock.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._snapshot: tuple = tuple(self.items())
+
+    def snapshot(self) -> tuple:
+        return self._snapshot
+
+    def _refresh(self):
+        self._snapshot = tuple(self.items())
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._refresh()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._refresh()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._refresh()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._refresh()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._refresh()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._refresh()
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._refresh()
+        return value
+
+
 class BaseCameraManager(ABC):
+    GRID_WINDOW_TITLE = "OmniView"
+    FRAME_FORMATS = ("bgr", "raw")
+    # How long the main loop sleeps waiting for a frame: short with a GUI so
+    # HighGUI events keep being pumped, longer headless (a frame wakes it)
+    GUI_FRAME_WAIT = 0.01
+    HEADLESS_FRAME_WAIT = 0.1
+
     def __init__(
         self,
         show_gui: bool = False,
@@ -38,6 +107,20 @@ class BaseCameraManager(ABC):
         frame_callback: Optional[Callable[[int, Any], None]] = None,
         exit_keys: tuple = (ord("q"), 27),
         hw_acceleration: bool = True,
+        sample_every: int = 1,
+        target_fps: Optional[float] = None,
+        reuse_buffers: bool = False,
+        grid_view: bool = False,
+        callback_workers: int = 0,
+        frame_format: str = "bgr",
+        shared_frames: Optional[Any] = None,
+        pin_threads: bool = False,
+        umat_frames: bool = False,
+        skip_static_frames: bool = False,
+        umat_display: bool = False,
+        output_width: Optional[int] = None,
+        output_height: Optional[int] = None,
+        single_opencv_thread: bool = False,
     ):
         """
         Base manager for handling multiple camera streams
@@ -54,7 +137,54 @@ class BaseCameraManager(ABC):
             exit_keys: Keyboard keys to exit the application
             hw_acceleration: Request GPU-accelerated decoding when available
                 (uses D3D11 on Windows, VAAPI on Linux); falls back to software
+            sample_every: Decode only every Nth captured frame per camera
+            target_fps: Optional cap on decoded frames per second per camera
+            reuse_buffers: Decode into a small pool of reused arrays per
+                camera instead of allocating every frame; a buffer is reused
+                only once no frame reference to it is left
+            grid_view: Show all cameras tiled in a single window instead of
+                one window per camera
+            callback_workers: Threads running frame_callback. 0 (default)
+                calls it inline on the main loop for every frame; with a pool
+                each camera has at most one callback in flight and only its
+                newest frame waits, so frames can be dropped and the callback
+                must be thread-safe
+            frame_format: "bgr" (default) or "raw" to hand callbacks the
+                camera's native YUYV/MJPEG data without colour conversion;
+                the GUI converts raw frames for display only
+            shared_frames: Optional ``multiprocessing.Queue``; every frame is
+                copied into per-camera shared memory and only a small
+                descriptor is put on the queue (read it with
+                ``SharedFrameReader``), so other processes get frames
+                without pickling them
+            pin_threads: Pin each capture thread to one CPU core (camera ID
+                modulo core count) and raise its priority where permitted
+            umat_frames: Hand frame_callback ``cv2.UMat`` frames so the
+                OpenCV calls it makes run through OpenCL (on the GPU when
+                one is available); display and shared_frames keep ndarrays
+            skip_static_frames: Treat a frame whose sparse pixel sample
+                matches the camera's previous frame as a repeat: it is not
+                passed to frame_callback or shared_frames, and the window
+                keeps the previous image (see ``frame_signature``)
+            umat_display: Caption and show per-camera windows from a
+                ``cv2.UMat`` copy of the frame, so ``putText`` and ``imshow``
+                run through OpenCL; only pays off for large (720p+) frames
+                with show_camera_id
+            output_width: With output_height, capture threads scale frames
+                to this size before handing them over (callbacks, display
+                and shared_frames all get the smaller frame); BGR only
+            output_height: See output_width
+            single_opencv_thread: Call ``cv2.setNumThreads(1)`` on start so
+                OpenCV's worker pool doesn't contend with the capture threads
+                for cores; the setting is process-wide and also applies to
+                frame_callback and any other OpenCV code in the process
         """
+        if frame_format not in self.FRAME_FORMATS:
+            raise ValueError(
+                f"frame_format must be one of {self.FRAME_FORMATS}, got {frame_format!r}"
+            )
+        if (output_width is None) != (output_height is None):
+            raise ValueError("output_width and output_height must be set together")
         self._setup_logging()
 
         self.show_gui = show_gui
@@ -67,12 +197,59 @@ class BaseCameraManager(ABC):
         self.frame_callback = frame_callback
         self.exit_keys = exit_keys
         self.hw_acceleration = hw_acceleration
+        self.sample_every = sample_every
+        self.target_fps = target_fps
+        self.reuse_buffers = reuse_buffers
+        self.grid_view = grid_view
+        self.frame_format = frame_format
+        self.pin_threads = pin_threads
+        self.umat_frames = umat_frames
+        self.skip_static_frames = skip_static_frames
+        self.umat_display = umat_display
+        self.output_width = output_width
+        self.output_height = output_height
+        self.single_opencv_thread = single_opencv_thread
+        self._mosaic = Mosaic(
+            (output_width or self.frame_width, output_height or self.frame_height)
+        )
+        self.callback_workers = callback_workers
+        # What frames are actually delivered to: frame_callback itself or
+        # its UMat-converting wrapper
+        self._callback = frame_callback
+        if frame_callback and umat_frames:
+            if not cv2.ocl.haveOpenCL():
+                self.logger.info("OpenCL unavailable, UMat frames stay on the CPU")
+            self._callback = umat_callback(frame_callback)
+        self._callback_dispatcher: Optional[CallbackDispatcher] = None
+        if self.frame_callback and self.callback_workers > 0:
+            self._callback_dispatcher = CallbackDispatcher(
+                self._callback, self.callback_workers, self.logger
+            )
 
-        self.active_windows = set()
+        self._frame_publisher: Optional[SharedFramePublisher] = None
+        if shared_frames is not None:
+            self._frame_publisher = SharedFramePublisher(shared_frames)
+
+        # dev_id -> window title (None for the grid window); the title is
+        # built once when the window opens, not on every frame
+        self.active_windows: Dict[Optional[int], str] = {}
+        # dev_id -> frame object last imshow()n (None: the grid's frames);
+        # HighGUI keeps showing it, so the same object isn't sent again
+        self._shown_frames: Dict[Optional[int], Any] = {}
+        # dev_id -> "Camera N" caption, formatted once per camera
+        self._id_labels: Dict[int, str] = {}
+        # Cameras whose windows are closed by the main loop (removed cameras)
+        self._windows_to_close: Set[int] = set()
         self.lock = threading.Lock()
         self.stop_event = threading.Event()
-        self.cameras: dict[int, dict] = {}
-        self.frame_queue = queue.Queue(maxsize=self.max_cameras * 2)
+        # Set to make the monitor thread rescan devices immediately
+        self._device_change = threading.Event()
+        self.cameras: CameraTable = CameraTable()
+        # One newest-frame slot per camera: producers never block and the
+        # main loop never sees a backlog of stale frames.
+        self.frame_queue = LatestFrameSlots()
+        # Cameras whose frame format has been checked (see process_frames)
+        self._validated_cameras: Set[int] = set()
 
         if self.show_gui and sys.platform == "linux":
             # Force the xcb (X11/XWayland) Qt plugin bundled with opencv-python
@@ -110,6 +287,8 @@ class BaseCameraManager(ABC):
 
     def start(self):
         """Start the camera manager and begin processing"""
+        if self.single_opencv_thread:
+            cv2.setNumThreads(1)
         self.monitor_thread = threading.Thread(
             target=self._monitor_cameras, daemon=True
         )
@@ -119,6 +298,7 @@ class BaseCameraManager(ABC):
     def stop(self):
         """Stop all camera processing and clean up resources"""
         self.stop_event.set()
+        self._device_change.set()
 
         scheduler = getattr(self, "_multiplex_scheduler", None)
         if scheduler is not None:
@@ -131,6 +311,11 @@ class BaseCameraManager(ABC):
         if hasattr(self, "monitor_thread"):
             self.monitor_thread.join(timeout=1.0)
 
+        if self._callback_dispatcher is not None:
+            self._callback_dispatcher.shutdown()
+        if self._frame_publisher is not None:
+            self._frame_publisher.close()
+
         self._cleanup_gui_resources()
 
     def _cleanup_gui_resources(self):
@@ -138,13 +323,32 @@ class BaseCameraManager(ABC):
         if not self.show_gui:
             return
 
-        for window in list(self.active_windows):
+        for window in list(self.active_windows.values()):
             try:
                 cv2.destroyWindow(window)
-                cv2.waitKey(1)
             except Exception:
                 pass
         self.active_windows.clear()
+        self._windows_to_close.clear()
+        self._shown_frames.clear()
+        # The main loop has exited, so flush the destroy requests here.
+        poll_key()
+
+    def notify_device_change(self):
+        """Wake the monitor thread to rescan devices without waiting for its timer.
+
+        Call this from a hot-plug notification (udev, WM_DEVICECHANGE, ...).
+        """
+        self._device_change.set()
+
+    def _wait_for_device_change(self, timeout: Optional[float]) -> bool:
+        """Sleep until the rescan timeout (None: none), a device change or stop.
+
+        Returns True if woken early by notify_device_change() or stop().
+        """
+        woken = self._device_change.wait(timeout)
+        self._device_change.clear()
+        return woken
 
     def _monitor_cameras(self):
         """Continuously monitor and update camera connections"""
@@ -154,7 +358,7 @@ class BaseCameraManager(ABC):
             with self.lock:
                 self._update_camera_connections(current_devices)
 
-            time.sleep(3)
+            self._wait_for_device_change(3)
 
     def _update_camera_connections(self, current_devices: List[int]):
         """Add or remove cameras based on availability"""
@@ -180,7 +384,7 @@ class BaseCameraManager(ABC):
         if dev_id in self.cameras:
             return
 
-        self.logger.info(f"Adding camera {dev_id}")
+        self.logger.info("Adding camera %s", dev_id)
 
         try:
             stop_event = threading.Event()
@@ -196,86 +400,154 @@ class BaseCameraManager(ABC):
 
             thread.start()
         except Exception as e:
-            self.logger.error(f"Error adding camera {dev_id}: {str(e)}")
+            self.logger.error("Error adding camera %s: %s", dev_id, e)
 
     def _remove_camera(self, dev_id: int):
         """Stop and remove a camera thread"""
-        if dev_id not in self.cameras:
+        camera = self.cameras.get(dev_id)
+        if camera is None:
             return
 
-        source = self.cameras[dev_id]["source"]
         try:
-            self.logger.info(f"Removing camera {source}")
-            self.cameras[dev_id]["stop_event"].set()
-            self.cameras[dev_id]["thread"].join(timeout=1.0)
+            self.logger.info("Removing camera %s", camera["source"])
+            camera["stop_event"].set()
+            camera["thread"].join(timeout=1.0)
 
             # HighGUI (Qt) is not thread-safe: destroying a window off the
             # main thread triggers "QObject::killTimer/startTimer: Timers
             # cannot be (stopped|started) from another thread" and can
             # SIGSEGV. _remove_camera runs both on the main thread (stop())
             # and on the background _monitor_cameras thread (hot-plug
-            # removal), so only touch GUI when on the main thread. Windows
-            # orphaned by a background removal are reaped by the main loop's
-            # _cleanup_inactive_windows / _cleanup_gui_resources.
-            if self.show_gui and threading.current_thread() is threading.main_thread():
-                window_title = self._get_window_title(dev_id)
-                if window_title in self.active_windows:
-                    cv2.destroyWindow(window_title)
-                    self.active_windows.remove(window_title)
-                    cv2.waitKey(1)
+            # removal), so it never touches the GUI: the window is queued
+            # and the main loop closes all queued windows in one batch
+            # (flushed by its single key poll), or _cleanup_gui_resources
+            # does on shutdown.
+            if self.show_gui:
+                self._windows_to_close.add(dev_id)
 
         except Exception as e:
-            self.logger.error(f"Error removing camera {dev_id}: {str(e)}")
+            self.logger.error("Error removing camera %s: %s", dev_id, e)
         finally:
+            self._validated_cameras.discard(dev_id)
             if dev_id in self.cameras:
                 del self.cameras[dev_id]
 
+    def _thread_cpu(self, camera_id: int) -> Optional[int]:
+        """CPU core for a camera's capture thread, or None if not pinned"""
+        if not self.pin_threads:
+            return None
+        return camera_id % (os.cpu_count() or 1)
+
     def _get_window_title(self, dev_id: int) -> str:
         camera_type = self.__class__.__name__.replace("CameraManager", "")
-        source = (
-            self.cameras[dev_id]["source"] if dev_id in self.cameras else str(dev_id)
-        )
+        # Called from the display loop without the lock: one get() can't race
+        # with the monitor removing the camera between a check and a lookup
+        camera = self.cameras.get(dev_id)
+        source = camera["source"] if camera is not None else str(dev_id)
         return f"Camera {dev_id} ({camera_type}): {source}"
 
     def process_frames(self) -> Dict[int, Any]:
         """Process all available frames from the queue"""
         frames = {}
 
-        while not self.frame_queue.empty():
-            try:
-                dev_id, frame = self.frame_queue.get_nowait()
-                if frame is not None and len(frame.shape) == 3:
-                    frames[dev_id] = frame
-                    self._update_camera_state(dev_id, frame)
-            except queue.Empty:
-                break
+        for dev_id, (frame, captured_at) in self.frame_queue.drain().items():
+            if frame is None:
+                continue
+            # A capture keeps its format once it delivers a valid frame, so
+            # only the first frame of each camera is shape-checked.
+            if dev_id not in self._validated_cameras:
+                if not self._is_valid_frame(frame):
+                    continue
+                self._validated_cameras.add(dev_id)
+            if self.skip_static_frames and self._is_repeated_frame(
+                dev_id, frame, captured_at
+            ):
+                continue
+            frames[dev_id] = frame
+            self._update_camera_state(dev_id, frame, captured_at)
 
         self._add_cached_frames(frames)
         return frames
 
-    def _update_camera_state(self, dev_id: int, frame: Any):
+    def camera_stats(self) -> Dict[int, Dict[str, float]]:
+        """Capture counters and decode latency of every camera thread.
+
+        See ``BaseCameraThread.stats()``; multiplexed cameras have no thread
+        and are not included.
+        """
+        return {
+            dev_id: camera["thread"].stats()
+            for dev_id, camera in self.cameras.snapshot()
+        }
+
+    def latest_frame(self, dev_id: int) -> Optional[Any]:
+        """Return the newest frame processed for a camera, without blocking.
+
+        None if the camera is unknown or hasn't delivered a frame yet.
+        """
+        camera = self.cameras.get(dev_id)
+        return camera["last_frame"] if camera is not None else None
+
+    def _is_repeated_frame(
+        self, dev_id: int, frame: Any, captured_at: Optional[float]
+    ) -> bool:
+        """True if ``frame`` looks identical to the camera's previous frame.
+
+        A repeat only refreshes ``last_update``, so _add_cached_frames keeps
+        returning the previous (same-looking) frame for display.
+        """
+        camera = self.cameras.get(dev_id)
+        if camera is None:
+            return False
+        signature = frame_signature(frame)
+        if camera.get("signature") == signature and camera["last_frame"] is not None:
+            camera["last_update"] = captured_at or time.time()
+            return True
+        camera["signature"] = signature
+        return False
+
+    def _is_valid_frame(self, frame: Any) -> bool:
+        """BGR frames must be H x W x C; raw frames just non-empty"""
+        if frame is None:
+            return False
+        if self.frame_format == "raw":
+            return frame.size > 0
+        if isinstance(frame, cv2.cuda.GpuMat):
+            return frame.channels() == 3
+        return len(frame.shape) == 3
+
+    def _update_camera_state(
+        self, dev_id: int, frame: Any, captured_at: Optional[float] = None
+    ):
         """Update camera state with new frame"""
-        if dev_id not in self.cameras:
-            # Frame from a multiplexed camera — scheduler manages its state
-            if self.frame_callback:
-                self.frame_callback(dev_id, frame)
+        camera = self.cameras.get(dev_id)
+        if camera is not None:
+            camera["last_frame"] = frame
+            camera["last_update"] = captured_at or time.time()
+        # else: frame from a multiplexed camera — scheduler manages its state
+
+        if self._frame_publisher is not None:
+            self._frame_publisher.publish(dev_id, frame, captured_at)
+        self._dispatch_frame_callback(dev_id, frame)
+
+    def _dispatch_frame_callback(self, dev_id: int, frame: Any):
+        """Hand a frame to frame_callback, on the worker pool if enabled"""
+        if not self.frame_callback:
             return
-        self.cameras[dev_id]["last_frame"] = frame
-        self.cameras[dev_id]["last_update"] = time.time()
-
-        if self.frame_callback:
-            self.frame_callback(dev_id, frame)
+        if self._callback_dispatcher is None:
+            self._callback(dev_id, frame)
+            return
+        self._callback_dispatcher.submit(dev_id, frame)
 
     def _add_cached_frames(self, frames: Dict[int, Any]):
         """Add cached frames from inactive cameras"""
-        with self.lock:
-            for dev_id in list(self.cameras.keys()):
-                if (
-                    dev_id not in frames
-                    and self.cameras[dev_id]["last_frame"] is not None
-                    and time.time() - self.cameras[dev_id]["last_update"] < 5.0
-                ):
-                    frames[dev_id] = self.cameras[dev_id]["last_frame"]
+        now = time.time()
+        for dev_id, camera in self.cameras.snapshot():
+            if dev_id in frames:
+                continue
+            last_frame = camera["last_frame"]
+            if last_frame is not None and now - camera["last_update"] < 5.0:
+                frames[dev_id] = last_frame
 
     def _main_loop(self):
         """Main processing loop"""
@@ -284,8 +556,8 @@ class BaseCameraManager(ABC):
                 try:
                     self._process_frame_iteration()
                 except Exception as e:
-                    self.logger.error(f"Main loop error: {e}")
-                    time.sleep(1)
+                    self.logger.error("Main loop error: %s", e)
+                    self.stop_event.wait(1)
         except KeyboardInterrupt:
             pass
         finally:
@@ -293,6 +565,11 @@ class BaseCameraManager(ABC):
 
     def _process_frame_iteration(self):
         """Process one iteration of the main loop"""
+        # Sleep until a camera delivers instead of spinning on an empty
+        # queue (pollKey and the headless loop never block)
+        self.frame_queue.wait(
+            self.GUI_FRAME_WAIT if self.show_gui else self.HEADLESS_FRAME_WAIT
+        )
         frames = self.process_frames()
 
         if self.show_gui:
@@ -301,11 +578,29 @@ class BaseCameraManager(ABC):
         if self._check_exit_condition():
             self.stop_event.set()
 
+        if self._windows_to_close:
+            self._close_pending_windows()
+
+    def _close_pending_windows(self):
+        """Destroy windows of removed cameras (main thread only)"""
+        while self._windows_to_close:
+            dev_id = self._windows_to_close.pop()
+            self._shown_frames.pop(dev_id, None)
+            window_title = self.active_windows.pop(dev_id, None)
+            if window_title is not None:
+                try:
+                    cv2.destroyWindow(window_title)
+                except Exception:
+                    pass
+
     def _show_camera_id_in_frame(self, frame, camera_id: int):
         """Adds a caption with the camera number to the frame"""
+        label = self._id_labels.get(camera_id)
+        if label is None:
+            label = self._id_labels[camera_id] = f"Camera {camera_id}"
         cv2.putText(
             frame,
-            f"Camera {camera_id}",
+            label,
             (10, 30),
             cv2.FONT_HERSHEY_SIMPLEX,
             1,
@@ -315,36 +610,95 @@ class BaseCameraManager(ABC):
 
     def _update_gui_windows(self, frames: Dict[int, Any]):
         """Update all GUI windows with current frames"""
+        if self.frame_format == "raw":
+            frames = self._frames_for_display(frames)
+        if self.grid_view:
+            self._update_grid_window(frames)
+            return
+
         for dev_id, frame in frames.items():
             try:
-                window_title = self._get_window_title(dev_id)
+                window_title = self.active_windows.get(dev_id)
+                if window_title is None:
+                    window_title = self._get_window_title(dev_id)
+                    create_window(window_title)
+                elif self._shown_frames.get(dev_id) is frame:
+                    # Cached frame of an idle camera, already on screen
+                    continue
+                self._shown_frames[dev_id] = frame
                 if self.show_camera_id:
+                    # Draw on a copy: the frame may be in use by a callback.
+                    # A UMat is that copy too, uploaded for OpenCL drawing.
+                    if self.umat_display:
+                        frame = cv2.UMat(frame)
+                    else:
+                        frame = frame.copy()
                     self._show_camera_id_in_frame(frame, dev_id)
                 cv2.imshow(window_title, frame)
-                self.active_windows.add(window_title)
+                self.active_windows[dev_id] = window_title
             except Exception as e:
-                self.logger.error(f"Display error for camera {dev_id}: {e}")
+                self.logger.error("Display error for camera %s: %s", dev_id, e)
 
         self._cleanup_inactive_windows(frames.keys())
 
+    def _frames_for_display(self, frames: Dict[int, Any]) -> Dict[int, Any]:
+        """Convert raw frames to BGR, dropping ones that can't be shown"""
+        converted = {}
+        for dev_id, frame in frames.items():
+            bgr = to_bgr(frame)
+            if bgr is not None:
+                converted[dev_id] = bgr
+        return converted
+
+    def _update_grid_window(self, frames: Dict[int, Any]):
+        """Show all current frames tiled in one window (one imshow per tick)"""
+        if not frames:
+            return
+        try:
+            dev_ids = sorted(frames)
+            tiles = [frames[dev_id] for dev_id in dev_ids]
+            shown = self._shown_frames.get(None)
+            if (
+                None in self.active_windows
+                and shown is not None
+                and len(shown) == len(tiles)
+                and all(a is b for a, b in zip(shown, tiles))
+            ):
+                return
+            self._shown_frames[None] = tiles
+            if None not in self.active_windows:
+                create_window(self.GRID_WINDOW_TITLE)
+            mosaic = self._mosaic.render(tiles)
+            if self.show_camera_id:
+                # Captions go on the canvas, never on the shared frames
+                for index, dev_id in enumerate(dev_ids):
+                    self._show_camera_id_in_frame(self._mosaic.tile(index), dev_id)
+            cv2.imshow(self.GRID_WINDOW_TITLE, mosaic)
+            self.active_windows[None] = self.GRID_WINDOW_TITLE
+        except Exception as e:
+            self.logger.error("Grid display error: %s", e)
+
     def _cleanup_inactive_windows(self, active_ids: set):
-        """Remove windows for inactive cameras"""
-        for window_title in list(self.active_windows):
-            dev_id = int(window_title.split()[1])
-            if dev_id not in active_ids:
-                try:
-                    cv2.destroyWindow(window_title)
-                    self.active_windows.remove(window_title)
-                    cv2.waitKey(1)
-                except Exception:
-                    pass
+        """Remove windows for inactive cameras.
+
+        Destroy requests are flushed by the single key poll at the end of the
+        main loop iteration rather than one key poll per closed window.
+        """
+        # Usually empty: a set difference, not a copy of every window entry
+        for dev_id in self.active_windows.keys() - active_ids:
+            self._shown_frames.pop(dev_id, None)
+            try:
+                cv2.destroyWindow(self.active_windows[dev_id])
+                del self.active_windows[dev_id]
+            except Exception:
+                pass
 
     def _check_exit_condition(self) -> bool:
         """Check if exit condition is met"""
         if not self.show_gui:
             return False
 
-        key = cv2.waitKey(1)
+        key = poll_key()
         return key in self.exit_keys
 
 
@@ -384,12 +738,16 @@ class SequentialCameraMixin:
             self.logger.error("No USB cameras found")
             return
 
-        self.logger.info(f"Available cameras: {cameras_list}")
+        self.logger.info("Available cameras: %s", cameras_list)
 
         self._seq_controller = SequentialController(
             sources=cameras_list,
             switch_interval=self.switch_interval,
-            frame_callback=self.frame_callback,
+            frame_callback=(
+                self._callback_dispatcher.submit
+                if self._callback_dispatcher is not None
+                else self._callback
+            ),
             width=self.frame_width,
             height=self.frame_height,
             fps=self.fps,
@@ -422,6 +780,20 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         frame_callback: Callback function for frame processing
         exit_keys: Keyboard keys to exit the application
         hw_acceleration: Request GPU-accelerated decoding when available
+        sample_every: Decode only every Nth captured frame per camera
+        target_fps: Optional cap on decoded frames per second per camera
+        reuse_buffers: Decode into a pool of reused arrays per camera
+        grid_view: Show all cameras tiled in a single window
+        callback_workers: Threads running frame_callback (0 = inline on the main loop)
+        frame_format: "bgr" (default) or "raw" for the camera's native YUYV/MJPEG data
+        shared_frames: multiprocessing.Queue to receive frames via shared memory
+        pin_threads: Pin each capture thread to one CPU core
+        umat_frames: Hand frame_callback cv2.UMat frames (OpenCL Transparent API)
+        skip_static_frames: Drop frames identical to the camera's previous one
+        umat_display: Caption and show windows from cv2.UMat frames (OpenCL)
+        output_width: Scale frames to this width in the capture threads
+        output_height: Scale frames to this height in the capture threads
+        single_opencv_thread: Limit OpenCV to one worker thread (process-wide)
         sequential_mode: Method to show the cameras one by one
         switch_interval: The time after which the cameras will change. Only works if sequential_mode is selected
         multiplex_mode: How to handle USB bus contention:
@@ -433,6 +805,10 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         multiplex_settle: Pause after releasing a camera before opening next (default 0.2)
         multiplex_backend: Rotation backend - "v4l2" (STREAMON/OFF) or "opencv" (release/open)
         multiplex_fourcc: Pixel format for V4L2 backend (default "MJPG")
+        v4l2_on_demand: Linux only: capture each frame on demand through raw
+            V4L2 with one queued buffer (no stale driver-queued frames)
+        fourcc: Pixel format requested from the cameras (default "MJPG";
+            None keeps the driver's default)
     """
 
     def __init__(
@@ -446,6 +822,8 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         multiplex_settle: float = 0.2,
         multiplex_backend: str = "v4l2",
         multiplex_fourcc: str = "MJPG",
+        v4l2_on_demand: bool = False,
+        fourcc: Optional[str] = "MJPG",
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -460,10 +838,20 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         self.multiplex_settle = multiplex_settle
         self.multiplex_backend = multiplex_backend
         self.multiplex_fourcc = multiplex_fourcc
+        self.v4l2_on_demand = v4l2_on_demand
+        self.fourcc = fourcc
 
         # Multiplex scheduler (created in start() after device discovery)
         self._multiplex_scheduler: Optional[MultiplexScheduler] = None
 
+        # inotify on /dev: wakes the monitor as soon as a camera node is
+        # created or removed instead of waiting for the next periodic scan
+        self._device_watcher: Optional[DeviceNodeWatcher] = None
+
+        # Workers for the cv2.VideoCapture device probe (platforms without
+        # sysfs); created on first use and kept across monitor scans
+        self._probe_pool: Optional[ThreadPoolExecutor] = None
+
         # Per-camera thread restart counter (sysfs-based detection never
         # removes a present device, so dead threads must be restarted;
         # cap prevents infinite ENOSPC restart loop on a congested hub).
@@ -489,6 +877,9 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         if self.sequential_mode:
             self._sequential_main_loop()
         else:
+            watcher = DeviceNodeWatcher(self.notify_device_change)
+            if watcher.start():
+                self._device_watcher = watcher
             super().start()
 
     def stop(self):
@@ -499,7 +890,15 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         if ctrl is not None:
             ctrl.stop()
             self._seq_controller = None
+        if self._device_watcher is not None:
+            self._device_watcher.stop()
+            self._device_watcher = None
         super().stop()
+        # After stop_event is set (by super().stop()) no scan submits probes
+        with self.lock:
+            if self._probe_pool is not None:
+                self._probe_pool.shutdown(wait=False)
+                self._probe_pool = None
 
     def _monitor_cameras(self):
         """Continuously monitor and update camera connections.
@@ -521,12 +920,15 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         (endless open failures + restart loops) and miscounts cameras in
         the USB topology grouping.
 
-        Sysfs scanning is cheap (no device opens), so it runs every 3 s
-        alongside the multiplex topology re-evaluation.
+        Sysfs scanning is cheap (no device opens), so it runs every 3 s,
+        or right away after ``notify_device_change()``; the multiplex
+        topology is re-evaluated only when the device set changed.
         """
         mpx_initialized = False
         last_scan = 0.0
         cached_present: List[int] = []
+        last_present: Optional[List[int]] = None
+        rescan = False
 
         while not self.stop_event.is_set():
             now = time.time()
@@ -537,7 +939,7 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
             # present_capture_devices() reads /sys/class/video4linux and
             # keeps only capture-capable nodes — a non-intrusive presence
             # check that never fights open V4L2 fds and skips metadata nodes.
-            if not mpx_initialized or now - last_scan >= 3.0:
+            if not mpx_initialized or rescan or now - last_scan >= 3.0:
                 sysfs_present = present_capture_devices()
                 if sysfs_present is not None:
                     # Linux: use sysfs (always reliable, never conflicts)
@@ -546,24 +948,30 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
                     # Non-Linux fallback: probe with cv2.VideoCapture
                     cached_present = self._get_available_devices()
                 last_scan = now
+                changed = cached_present != last_present
+                last_present = cached_present
 
                 with self.lock:
                     if not mpx_initialized:
                         self._init_multiplex(cached_present)
                         mpx_initialized = True
-                    else:
-                        # Re-evaluate multiplex topology on each scan so
-                        # hot-plugged cameras on a congested hub are
-                        # picked up by the scheduler instead of spawning
-                        # per-camera threads that hit ENOSPC.
+                    elif changed:
+                        # Re-evaluate multiplex topology when the device set
+                        # changes so hot-plugged cameras on a congested hub
+                        # are picked up by the scheduler instead of spawning
+                        # per-camera threads that hit ENOSPC.  The topology
+                        # of an unchanged set is the same, so skip the
+                        # sysfs walk otherwise.
                         self._reconfigure_multiplex(cached_present)
+                    # Always runs: it also restarts dead camera threads.
                     self._update_camera_connections(cached_present)
 
                 # Drop multiplexed cameras whose device nodes vanished
                 # (e.g. the USB hub was unplugged).  Done on the slow scan
                 # cadence so cameras disappear "after a certain time".
                 # Reuse the sysfs present set we already read above.
-                self._prune_disconnected_multiplex(sysfs_present)
+                if changed:
+                    self._prune_disconnected_multiplex(sysfs_present)
 
             # Poll the multiplex scheduler (grab frames + rotate windows)
             if self._multiplex_scheduler is not None:
@@ -571,7 +979,10 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
 
             # When multiplex is active, poll at 50 ms for responsive
             # rotation. Otherwise 3 s is fine (just hot-plug detection).
-            time.sleep(0.05 if self._multiplex_scheduler is not None else 3)
+            # notify_device_change() and stop() cut the wait short.
+            rescan = self._wait_for_device_change(
+                0.05 if self._multiplex_scheduler is not None else 3
+            )
 
     def process_frames(self) -> Dict[int, Any]:
         """Drain queued frames, then merge multiplex-scheduler frames.
@@ -600,18 +1011,65 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
 
         return frames
 
+    def latest_frame(self, dev_id: int) -> Optional[Any]:
+        """Return the newest frame of a camera, multiplexed ones included."""
+        frame = super().latest_frame(dev_id)
+        scheduler = self._multiplex_scheduler
+        if frame is None and scheduler is not None:
+            frame = scheduler.get_all_frames().get(dev_id)
+        return frame
+
     def _get_available_devices(self) -> List[int]:
-        devices = []
-        backend_key = "linux" if sys.platform == "linux" else "default"
-        backend = BaseCameraThread.DEFAULT_BACKENDS[backend_key][0]
+        # Linux: sysfs lists the capture-capable /dev/videoN nodes without
+        # opening a single device
+        present = present_capture_devices()
+        if present is not None:
+            return sorted(i for i in present if i < self.max_cameras)
+
+        backend = BaseCameraThread.PLATFORM_BACKENDS[0]
+
+        # A camera with a live capture thread is known to be present;
+        # probing it would reopen a busy device (slow, and on DSHOW it
+        # fails while the stream is open).
+        live = {i for i in range(self.max_cameras) if self._has_live_thread(i)}
+        candidates = [i for i in range(self.max_cameras) if i not in live]
+        found = {}
+        if backend == cv2.CAP_V4L2:
+            # V4L2 without sysfs: cameras share USB hubs, and concurrent opens
+            # exhaust the hub bandwidth (ENOSPC), so probe one at a time and
+            # let _probe_camera's settle pause free it between devices.
+            found = {i: self._probe_camera(i, backend) for i in candidates}
+        elif candidates:
+            # Elsewhere each probe mostly waits in the driver (an absent
+            # index can take hundreds of ms on DSHOW), so they run concurrently.
+            # Submitting under the lock keeps stop() from shutting the pool
+            # down in between (or this scan recreating it afterwards).
+            with self.lock:
+                if self.stop_event.is_set():
+                    return []
+                if self._probe_pool is None:
+                    self._probe_pool = ThreadPoolExecutor(
+                        max_workers=min(self.max_cameras, 8),
+                        thread_name_prefix="camera-probe",
+                    )
+                probes = {
+                    i: self._probe_pool.submit(self._probe_camera, i, backend)
+                    for i in candidates
+                }
+            found = {i: probe.result() for i, probe in probes.items()}
 
+        devices = []
         for i in range(self.max_cameras):
-            if self._probe_camera(i, backend):
+            if i in live or found.get(i):
                 devices.append(i)
             else:
-                self.logger.info(f"The camera with index {i} is not available")
+                self.logger.info("The camera with index %s is not available", i)
         return devices
 
+    def _has_live_thread(self, index: int) -> bool:
+        camera = self.cameras.get(index)
+        return camera is not None and camera["thread"].is_alive()
+
     def _probe_camera(self, index: int, backend: int) -> bool:
         """Return True if a camera index can be opened, retrying once.
 
@@ -705,7 +1163,7 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         removed = scheduler.sync_available(sysfs_present)
         if removed:
             self.logger.info(
-                f"Removed disconnected multiplexed cameras {sorted(removed)}"
+                "Removed disconnected multiplexed cameras %s", sorted(removed)
             )
             # Reset announcement so a re-plugged camera is logged again.
             self._multiplex_announced.difference_update(removed)
@@ -744,7 +1202,7 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
                 if dev_id in self.cameras:
                     self._remove_camera(dev_id)
                     self.logger.info(
-                        f"Camera {dev_id} stopped for new multiplex scheduler"
+                        "Camera %s stopped for new multiplex scheduler", dev_id
                     )
                 # The scheduler will own this camera now — un-condemn it.
                 self._condemned_cameras.discard(dev_id)
@@ -763,7 +1221,7 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
             if dev_id in self.cameras:
                 self._remove_camera(dev_id)
                 self.logger.info(
-                    f"Camera {dev_id} handed off to multiplex scheduler"
+                    "Camera %s handed off to multiplex scheduler", dev_id
                 )
             # The scheduler now owns this camera — un-condemn it so it
             # won't be skipped if it ever leaves the scheduler later.
@@ -815,15 +1273,18 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
                     if restarts < self._MAX_THREAD_RESTARTS:
                         self._thread_restarts[dev_id] = restarts + 1
                         self.logger.info(
-                            f"Camera {dev_id} thread dead, restarting "
-                            f"(attempt {restarts + 1}/{self._MAX_THREAD_RESTARTS})"
+                            "Camera %s thread dead, restarting (attempt %d/%d)",
+                            dev_id,
+                            restarts + 1,
+                            self._MAX_THREAD_RESTARTS,
                         )
                         self._remove_camera(dev_id)
                         self._add_camera(dev_id)
                     else:
                         self.logger.info(
-                            f"Camera {dev_id} thread dead, max restarts "
-                            f"reached — condemning (multiplex will claim it)"
+                            "Camera %s thread dead, max restarts "
+                            "reached — condemning (multiplex will claim it)",
+                            dev_id,
                         )
                         self._remove_camera(dev_id)
                         self._condemned_cameras.add(dev_id)
@@ -839,7 +1300,7 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         if (self._multiplex_scheduler is not None
                 and dev_id in self._multiplex_scheduler.get_multiplex_cameras()):
             if dev_id not in self._multiplex_announced:
-                self.logger.info(f"Camera {dev_id} managed by multiplex scheduler")
+                self.logger.info("Camera %s managed by multiplex scheduler", dev_id)
                 self._multiplex_announced.add(dev_id)
             return
         # Skip condemned cameras — they exceeded the restart limit and
@@ -847,7 +1308,7 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
         if dev_id in self._condemned_cameras:
             return
 
-        self.logger.info(f"Adding camera {dev_id}")
+        self.logger.info("Adding camera %s", dev_id)
 
         try:
             stop_event = threading.Event()
@@ -863,7 +1324,7 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
 
             thread.start()
         except Exception as e:
-            self.logger.error(f"Error adding camera {dev_id}: {str(e)}")
+            self.logger.error("Error adding camera %s: %s", dev_id, e)
 
     def _remove_camera(self, dev_id: int):
         """Stop and remove a camera thread, clearing its restart counter."""
@@ -885,6 +1346,15 @@ class USBCameraManager(SequentialCameraMixin, BaseCameraManager):
             fps=self.fps,
             min_uptime=self.min_uptime,
             hw_acceleration=self.hw_acceleration,
+            sample_every=self.sample_every,
+            target_fps=self.target_fps,
+            reuse_buffers=self.reuse_buffers,
+            frame_format=self.frame_format,
+            cpu_affinity=self._thread_cpu(camera_id),
+            output_width=self.output_width,
+            output_height=self.output_height,
+            v4l2_on_demand=self.v4l2_on_demand,
+            fourcc=self.fourcc,
         )
 
 
@@ -903,15 +1373,79 @@ class IPCameraManager(BaseCameraManager):
         frame_callback: Callback function for frame processing
         exit_keys: Keyboard keys to exit the application
         hw_acceleration: Request GPU-accelerated decoding when available
+        sample_every: Decode only every Nth captured frame per camera
+        target_fps: Optional cap on decoded frames per second per camera
+        reuse_buffers: Decode into a pool of reused arrays per camera
+        grid_view: Show all cameras tiled in a single window
+        callback_workers: Threads running frame_callback (0 = inline on the main loop)
+        frame_format: "bgr" (default) or "raw" for the camera's native YUYV/MJPEG data
+        shared_frames: multiprocessing.Queue to receive frames via shared memory
+        pin_threads: Pin each capture thread to one CPU core
+        umat_frames: Hand frame_callback cv2.UMat frames (OpenCL Transparent API)
+        skip_static_frames: Drop frames identical to the camera's previous one
+        umat_display: Caption and show windows from cv2.UMat frames (OpenCL)
+        output_width: Scale frames to this width in the capture threads
+        output_height: Scale frames to this height in the capture threads
+        single_opencv_thread: Limit OpenCV to one worker thread (process-wide)
+        cuda_decode: Decode streams on an NVIDIA GPU (cv2.cudacodec) when available
+        gstreamer: Open streams via a GStreamer pipeline (HW decode, 1-frame appsink)
+        gpu_frames: Decode with cudacodec and hand frame_callback the
+            cv2.cuda.GpuMat without downloading it (headless only; streams
+            that fall back to FFMPEG still deliver ndarrays)
+        rtsp_transport: RTSP transport FFmpeg uses (default "tcp"; "udp" for
+            cameras that only serve RTP over UDP, None for FFmpeg's default).
+            A user-set OPENCV_FFMPEG_CAPTURE_OPTIONS takes precedence
     """
 
-    def __init__(self, rtsp_urls: List[str], *args, **kwargs):
+    def __init__(
+        self,
+        rtsp_urls: List[str],
+        *args,
+        cuda_decode: bool = False,
+        gstreamer: bool = False,
+        gpu_frames: bool = False,
+        rtsp_transport: Optional[str] = "tcp",
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
+        if gpu_frames and (
+            self.show_gui
+            or self.frame_format != "bgr"
+            or self._frame_publisher is not None
+            or self.umat_frames
+            or self.skip_static_frames
+            or self.output_width
+            or self.reuse_buffers
+        ):
+            raise ValueError(
+                "gpu_frames can't be combined with show_gui, frame_format='raw', "
+                "shared_frames, umat_frames, skip_static_frames, output scaling "
+                "or reuse_buffers"
+            )
         self.rtsp_urls = rtsp_urls
+        self.cuda_decode = cuda_decode or gpu_frames
+        self.gstreamer = gstreamer
+        self.gpu_frames = gpu_frames
+        self.rtsp_transport = rtsp_transport
 
     def _get_available_devices(self) -> List[int]:
         return list(range(len(self.rtsp_urls)))
 
+    def _monitor_cameras(self):
+        """Connect every stream once; rescan only on ``notify_device_change()``.
+
+        The URL list is fixed, so rebuilding the device list and diffing it
+        against an unchanged camera table every 3 s is wasted work; between
+        notifications (and stop(), which also sets the event) the thread
+        just blocks.  A capture thread that used up its reconnect attempts
+        stays down, as before.
+        """
+        while not self.stop_event.is_set():
+            current_devices = self._get_available_devices()
+            with self.lock:
+                self._update_camera_connections(current_devices)
+            self._wait_for_device_change(None)
+
     def _create_camera_thread(
         self, camera_id: int, stop_event: threading.Event
     ) -> threading.Thread:
@@ -925,4 +1459,15 @@ class IPCameraManager(BaseCameraManager):
             fps=self.fps,
             min_uptime=self.min_uptime,
             hw_acceleration=self.hw_acceleration,
+            sample_every=self.sample_every,
+            target_fps=self.target_fps,
+            reuse_buffers=self.reuse_buffers,
+            frame_format=self.frame_format,
+            cpu_affinity=self._thread_cpu(camera_id),
+            output_width=self.output_width,
+            output_height=self.output_height,
+            cuda_decode=self.cuda_decode,
+            gstreamer=self.gstreamer,
+            gpu_frames=self.gpu_frames,
+            rtsp_transport=self.rtsp_transport,
         )
@@ -36,6 +36,9 @@ from typing import Dict, List, Optional, Set, Tuple
 import cv2
 import numpy as np
 
+from .frames import put_latest
+from .threads import CAPTURE_ERRORS
+from .threads import request_single_buffer
 from .usb_topology import needs_multiplexing
 from .v4l2_backend import V4L2Camera
 
@@ -189,7 +192,7 @@ class MultiplexGroup:
                 if fr is not None:
                     self._frames[idx] = fr
                     self._last_fresh[idx] = now
-                    self.frame_queue.put((idx, fr))
+                    put_latest(self.frame_queue, (idx, fr))
             for idx in dead:
                 logger.warning("cam%d: grab failed (disconnected?)", idx)
                 self.remove_camera(idx)
@@ -261,7 +264,8 @@ class MultiplexGroup:
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
         cap.set(cv2.CAP_PROP_FPS, self.fps)
-        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if not request_single_buffer(cap):
+            logger.warning("Camera %d ignored CAP_PROP_BUFFERSIZE=1", idx)
         ok, _ = cap.read()
         if not ok:
             cap.release()
@@ -278,13 +282,13 @@ class MultiplexGroup:
                 continue
             try:
                 ok, fr = cap.read()
-            except Exception:
+            except CAPTURE_ERRORS:
                 ok = False
                 dead.append(idx)
             if ok and fr is not None:
                 self._frames[idx] = fr
                 self._last_fresh[idx] = now
-                self.frame_queue.put((idx, fr))
+                put_latest(self.frame_queue, (idx, fr))
         for idx in dead:
             logger.warning("cam%d: read failed (disconnected?)", idx)
             self.remove_camera(idx)
@@ -0,0 +1,70 @@
+"""Reference-counted frame buffer pool.
+
+Decoding every frame into a freshly allocated ndarray (~900 KB at 640x480,
+~6 MB at 1080p) churns the allocator and page-faults at high frame rates.
+``FramePool`` keeps a few decode targets per camera and hands out only those
+nobody else references any more: a frame still held by the frame slot, the
+camera's ``last_frame``, a queued callback or user code is never overwritten,
+so consumers don't have to copy frames they keep.  When every buffer is busy
+the caller lets OpenCV allocate and the new array joins the pool if there is
+room.
+"""
+
+import sys
+from typing import List
+from typing import Optional
+
+import numpy as np
+
+
+def _refs(buffers: List[np.ndarray], index: int) -> int:
+    return sys.getrefcount(buffers[index])
+
+
+# References an otherwise unused pooled buffer has when counted through
+# _refs() (list slot + call arguments); calibrated once so the check does not
+# depend on interpreter details.
+_FREE_REFS = _refs([np.empty(0)], 0)
+
+
+class FramePool:
+    """A small set of reusable decode targets for one camera."""
+
+    def __init__(self, size: int = 4):
+        """
+        Args:
+            size: Maximum number of buffers kept
+        """
+        self.size = max(1, size)
+        self._buffers: List[np.ndarray] = []
+
+    def acquire(self) -> Optional[np.ndarray]:
+        """Return a buffer no consumer references, or None if all are busy."""
+        buffers = self._buffers
+        for index in range(len(buffers)):
+            if _refs(buffers, index) <= _FREE_REFS:
+                return buffers[index]
+        return None
+
+    def release(self, buffer: Optional[np.ndarray], frame: np.ndarray):
+        """Record the array a decode into ``buffer`` actually produced.
+
+        OpenCV reallocates when the buffer doesn't fit the frame (first
+        frame, resolution change); the new array replaces the old one.  A
+        frame decoded without a buffer joins the pool while it has room.
+        """
+        if frame is buffer:
+            return
+        if buffer is not None:
+            for index in range(len(self._buffers)):
+                if self._buffers[index] is buffer:
+                    self._buffers[index] = frame
+                    return
+        if len(self._buffers) < self.size:
+            self._buffers.append(frame)
+
+    def clear(self):
+        self._buffers.clear()
+
+    def __len__(self) -> int:
+        return len(self._buffers)
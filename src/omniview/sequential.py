@@ -17,14 +17,21 @@ never streaming more than two cameras simultaneously.
 from __future__ import annotations
 
 import logging
-import sys
 import threading
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import cv2
 
-from .threads import BaseCameraThread, build_hw_accel_params
+from .display import create_window
+from .display import poll_key
+from .frames import put_latest
+from .threads import CAPTURE_ERRORS
+from .threads import BaseCameraThread
+from .threads import build_hw_accel_params
+from .threads import ffmpeg_capture_options
+from .threads import ffmpeg_low_latency_options
+from .threads import request_single_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +58,8 @@ class SequentialController:
         show_camera_id: If True, overlay the camera ID on the frame.
         window_title: Window title for ``cv2.imshow``.
         exit_keys: Keys that trigger stop.
+        rtsp_transport: FFmpeg RTSP transport for URL sources (None keeps
+            FFmpeg's default).
     """
 
     def __init__(
@@ -69,6 +78,7 @@ class SequentialController:
         show_camera_id: bool = False,
         window_title: str = "Camera Switcher",
         exit_keys: tuple = (ord("q"), 27),
+        rtsp_transport: Optional[str] = "tcp",
     ) -> None:
         self.sources = list(sources)
         self.switch_interval = switch_interval
@@ -83,6 +93,7 @@ class SequentialController:
         self.show_camera_id = show_camera_id
         self.window_title = window_title
         self.exit_keys = exit_keys
+        self.rtsp_transport = rtsp_transport
 
         self.stop_event = threading.Event()
 
@@ -93,6 +104,9 @@ class SequentialController:
         # Which source is currently "active" (displayed) vs "buffer"
         self._active_source: Optional[Any] = None
         self._buffer_source: Optional[Any] = None
+        # Backend that last opened a local camera: the cameras of one
+        # machine share it, so it is tried first on every rotation
+        self._usb_backend: Optional[int] = None
 
         # For the GUI bridge: the currently active source id so it can
         # emit the correct signal.
@@ -114,6 +128,8 @@ class SequentialController:
 
         self._active_idx = 0
         self._open_initial()
+        if self.show_gui:
+            create_window(self.window_title)
 
         try:
             self._loop()
@@ -142,9 +158,11 @@ class SequentialController:
     def _open_camera(self, source: Any) -> Optional[cv2.VideoCapture]:
         """Open a camera with platform-specific backends."""
         if isinstance(source, int):
-            backends = BaseCameraThread.DEFAULT_BACKENDS.get(
-                "linux" if sys.platform == "linux" else "default"
-            )
+            backends = BaseCameraThread.PLATFORM_BACKENDS
+            if self._usb_backend in backends:
+                backends = [self._usb_backend] + [
+                    api for api in backends if api != self._usb_backend
+                ]
             for api in backends:
                 params = build_hw_accel_params(api, self.hw_acceleration)
                 cap = (
@@ -153,7 +171,8 @@ class SequentialController:
                     else cv2.VideoCapture(source, api)
                 )
                 if cap.isOpened():
-                    self._configure_cap(cap)
+                    self._usb_backend = api
+                    self._configure_cap(cap, source)
                     return cap
                 cap.release()
         else:
@@ -167,13 +186,15 @@ class SequentialController:
                 )
             attempts.append((cv2.CAP_FFMPEG, None))
             attempts.append((cv2.CAP_ANY, None))
+            options = ffmpeg_low_latency_options(self.rtsp_transport)
             for backend, params in attempts:
                 try:
-                    if params is not None:
-                        cap = cv2.VideoCapture(source, backend, params)
-                    else:
-                        cap = cv2.VideoCapture(source, backend)
-                except Exception:
+                    with ffmpeg_capture_options(options):
+                        if params is not None:
+                            cap = cv2.VideoCapture(source, backend, params)
+                        else:
+                            cap = cv2.VideoCapture(source, backend)
+                except CAPTURE_ERRORS:
                     continue
                 if cap is not None and cap.isOpened():
                     self._configure_cap(cap)
@@ -182,12 +203,19 @@ class SequentialController:
                     cap.release()
         return None
 
-    def _configure_cap(self, cap: cv2.VideoCapture) -> None:
-        """Set capture parameters."""
+    def _configure_cap(
+        self, cap: cv2.VideoCapture, usb_source: Optional[int] = None
+    ) -> None:
+        """Set capture parameters.
+
+        ``usb_source`` is given for local cameras, whose backends are expected
+        to honor a one-frame buffer; FFmpeg streams never do.
+        """
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
         cap.set(cv2.CAP_PROP_FPS, self.fps)
-        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if not request_single_buffer(cap) and usb_source is not None:
+            logger.warning("Camera %s ignored CAP_PROP_BUFFERSIZE=1", usb_source)
 
     # -- lifecycle helpers ----------------------------------------------------
 
@@ -269,13 +297,14 @@ class SequentialController:
 
             # -- Exit key check (GUI mode) --
             if self.show_gui:
-                key = cv2.waitKey(1)
+                key = poll_key()
                 if key in self.exit_keys:
                     self.stop_event.set()
                     break
 
-            # Small sleep to avoid busy-loop when no frame is ready
-            time.sleep(0.01)
+            # Small wait to avoid busy-loop when no frame is ready;
+            # returns at once when stop() is called
+            self.stop_event.wait(0.01)
 
     def _rotate(self) -> None:
         """Rotate: release active → promote buffer → open new buffer."""
@@ -370,7 +399,7 @@ class SequentialController:
             self.frame_callback(source, frame)
 
         if self.frame_queue is not None:
-            self.frame_queue.put((source, frame))
+            put_latest(self.frame_queue, (source, frame))
 
     # -- thread-safe active id ------------------------------------------------
 
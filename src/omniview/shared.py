@@ -0,0 +1,156 @@
+"""Hand frames to other processes through shared memory.
+
+Putting an ndarray on a ``multiprocessing.Queue`` pickles it: a 640x480 BGR
+frame is ~1 MB serialized, copied through a pipe and unpickled per camera per
+frame.  ``SharedFramePublisher`` instead keeps one double-buffered
+``SharedMemory`` region per camera, copies each frame into the slot not being
+read, and sends only a small message describing where it is::
+
+    (camera_id, shm_name, offset, shape, dtype, timestamp)
+
+A consumer process opens the region by name with ``SharedFrameReader`` and
+views the frame in place.  A slot is overwritten two frames later, so a
+consumer that keeps a frame longer than that must copy it.
+"""
+
+import logging
+import queue
+import sys
+import time
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Regions created by a publisher in this process; a reader here must leave
+# their resource-tracker registration (the publisher's) alone.
+_published_regions: Set[str] = set()
+
+
+class SharedFramePublisher:
+    """Producer side: copy frames into shared memory, announce them on a queue."""
+
+    def __init__(self, message_queue: Any, slots: int = 2):
+        """
+        Args:
+            message_queue: Queue (usually ``multiprocessing.Queue``) that
+                receives one message per published frame
+            slots: Frame buffers per camera, written in turn
+        """
+        self.message_queue = message_queue
+        self.slots = max(1, slots)
+        # camera_id -> (region, slot size in bytes, next slot)
+        self._regions: Dict[Any, Tuple[shared_memory.SharedMemory, int, int]] = {}
+
+    def publish(
+        self, camera_id: Any, frame: np.ndarray, timestamp: Optional[float] = None
+    ):
+        """Copy ``frame`` into the camera's next slot and announce it.
+
+        Never blocks: if the queue is full the message is dropped (the
+        consumer reads the next frame instead).
+        """
+        frame = np.ascontiguousarray(frame)
+        region, slot_size, slot = self._region_for(camera_id, frame.nbytes)
+        offset = slot * slot_size
+        target = np.ndarray(frame.shape, frame.dtype, buffer=region.buf, offset=offset)
+        target[...] = frame
+        self._regions[camera_id] = (region, slot_size, (slot + 1) % self.slots)
+
+        message = (
+            camera_id,
+            region.name,
+            offset,
+            frame.shape,
+            frame.dtype.str,
+            timestamp if timestamp is not None else time.time(),
+        )
+        try:
+            self.message_queue.put_nowait(message)
+        except queue.Full:
+            pass
+
+    def _region_for(self, camera_id: Any, nbytes: int):
+        """Return the camera's region, (re)allocating it if a frame outgrew it."""
+        entry = self._regions.get(camera_id)
+        if entry is not None and entry[1] >= nbytes:
+            return entry
+        if entry is not None:
+            self._unlink(entry[0])
+        region = shared_memory.SharedMemory(create=True, size=nbytes * self.slots)
+        _published_regions.add(region.name)
+        entry = (region, nbytes, 0)
+        self._regions[camera_id] = entry
+        return entry
+
+    def close(self):
+        """Free every region; readers that still have one open keep it alive."""
+        for region, _, _ in self._regions.values():
+            self._unlink(region)
+        self._regions.clear()
+
+    @staticmethod
+    def _unlink(region: shared_memory.SharedMemory):
+        _published_regions.discard(region.name)
+        try:
+            region.unlink()
+            region.close()
+        except (BufferError, FileNotFoundError) as e:
+            logger.warning("Failed to free shared frame region %s: %s", region.name, e)
+
+
+class SharedFrameReader:
+    """Consumer side: turn publisher messages back into arrays."""
+
+    def __init__(self):
+        # camera_id -> region; replaced when the publisher reallocates
+        self._regions: Dict[Any, shared_memory.SharedMemory] = {}
+
+    def read(self, message: tuple) -> Tuple[Any, np.ndarray, float]:
+        """Return ``(camera_id, frame, timestamp)`` for a publisher message.
+
+        The frame is a view into shared memory, valid until the publisher
+        reuses its slot; ``.copy()`` it to keep it.
+        """
+        camera_id, name, offset, shape, dtype, timestamp = message
+        region = self._regions.get(camera_id)
+        if region is None or region.name != name:
+            if region is not None:
+                self._detach(region)
+            region = self._attach(name)
+            self._regions[camera_id] = region
+        frame = np.ndarray(shape, np.dtype(dtype), buffer=region.buf, offset=offset)
+        return camera_id, frame, timestamp
+
+    @staticmethod
+    def _attach(name: str) -> shared_memory.SharedMemory:
+        # The publisher owns the region; before 3.13 an attaching process
+        # also registers it with its resource tracker, which would unlink it
+        # when this process exits, so the registration is dropped again.
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+        region = shared_memory.SharedMemory(name=name)
+        if name not in _published_regions:
+            resource_tracker.unregister(region._name, "shared_memory")
+        return region
+
+    def close(self):
+        """Detach from every region this reader opened."""
+        for region in self._regions.values():
+            self._detach(region)
+        self._regions.clear()
+
+    @staticmethod
+    def _detach(region: shared_memory.SharedMemory):
+        try:
+            region.close()
+        except BufferError:
+            # A frame view the caller still holds keeps the mapping alive
+            pass
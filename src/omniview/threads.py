@@ -1,15 +1,26 @@
+import contextlib
+import functools
 import logging
+import os
 import queue
+import random
 import sys
 import threading
 import time
 from abc import ABC
 from abc import abstractmethod
+from collections import deque
 from typing import Any
+from typing import Dict
 from typing import Optional
+from typing import Sequence
 
 import cv2
 
+from .frames import put_latest
+from .pool import FramePool
+from .v4l2_backend import OnDemandV4L2Capture
+
 # Capture backends that honor the (open-only) CAP_PROP_HW_ACCELERATION property.
 # Other backends (e.g. V4L2, DSHOW) ignore or reject extra params, so the
 # acceleration params must not be passed to them.
@@ -33,6 +44,142 @@ if hasattr(cv2, "VIDEO_ACCELERATION_DRM"):
     _HW_ACCEL_NAMES[cv2.VIDEO_ACCELERATION_DRM] = "drm"
 
 
+# What opening or reading a capture raises when a device or stream fails;
+# OpenCV reports a failed read through the return value, not an exception.
+CAPTURE_ERRORS = (cv2.error, OSError, RuntimeError)
+
+# Recent retrieve() durations kept per thread for the latency percentiles
+LATENCY_SAMPLES = 128
+
+# FFmpeg demuxer options for live streams: don't buffer input and decode with
+# minimal delay.  Network backends ignore CAP_PROP_BUFFERSIZE, so this is the
+# only way to keep them from queueing frames.  The demuxer holds packets back
+# to reorder them, bounded here by max_delay (microseconds).  Stream probing
+# on open is cut from FFmpeg's 5 MB / 5 s to 32 KB / 0.5 s: the SDP already
+# describes the codec, and the default analysis alone delays opening by
+# seconds.
+FFMPEG_LOW_LATENCY_OPTIONS = (
+    "fflags;nobuffer|flags;low_delay|max_delay;500000"
+    "|probesize;32768|analyzeduration;500000"
+)
+
+# OpenCV has no per-capture way to pass FFmpeg options; it reads this variable
+# when a capture is opened.
+FFMPEG_OPTIONS_ENV = "OPENCV_FFMPEG_CAPTURE_OPTIONS"
+
+_ffmpeg_env_changed = threading.Condition()
+# State of the ffmpeg_capture_options() blocks now running: their options,
+# whether the variable is theirs (not the user's) and how many there are
+_ffmpeg_env_options: Optional[str] = None
+_ffmpeg_env_owned = False
+_ffmpeg_env_users = 0
+
+
+def ffmpeg_low_latency_options(rtsp_transport: Optional[str] = "tcp") -> str:
+    """Return the low-latency FFmpeg options for an RTSP transport.
+
+    Over UDP (FFmpeg's first choice) lost packets show up as smeared frames,
+    so RTSP is interleaved over TCP by default; None leaves the transport to
+    FFmpeg for cameras that only serve RTP over UDP.
+    """
+    if rtsp_transport is None:
+        return FFMPEG_LOW_LATENCY_OPTIONS
+    return f"rtsp_transport;{rtsp_transport}|{FFMPEG_LOW_LATENCY_OPTIONS}"
+
+
+@contextlib.contextmanager
+def ffmpeg_capture_options(options: str):
+    """Set the FFmpeg capture options only for captures opened inside the block.
+
+    The environment is process-wide, so it is restored once the last block
+    using it ends, and other FFmpeg captures in the process (the host
+    application's own files and streams) keep their defaults.  Blocks with
+    the same options overlap; a block with other options waits.  Options the
+    user set in the environment are kept.
+    """
+    global _ffmpeg_env_options, _ffmpeg_env_owned, _ffmpeg_env_users
+    with _ffmpeg_env_changed:
+        while _ffmpeg_env_users:
+            if not _ffmpeg_env_owned or _ffmpeg_env_options == options:
+                break
+            _ffmpeg_env_changed.wait()
+        else:
+            _ffmpeg_env_owned = FFMPEG_OPTIONS_ENV not in os.environ
+            if _ffmpeg_env_owned:
+                os.environ[FFMPEG_OPTIONS_ENV] = options
+            _ffmpeg_env_options = options
+        _ffmpeg_env_users += 1
+    try:
+        yield
+    finally:
+        with _ffmpeg_env_changed:
+            _ffmpeg_env_users -= 1
+            if not _ffmpeg_env_users:
+                if _ffmpeg_env_owned:
+                    os.environ.pop(FFMPEG_OPTIONS_ENV, None)
+                _ffmpeg_env_changed.notify_all()
+
+
+def request_single_buffer(cap: cv2.VideoCapture) -> bool:
+    """Ask the driver to queue one frame; return False if the backend refused.
+
+    V4L2/DSHOW keep a 4-frame queue by default, which adds ~130 ms of
+    latency at 30 FPS and makes every read return a stale frame.
+    """
+    try:
+        return bool(cap.set(cv2.CAP_PROP_BUFFERSIZE, 1))
+    except cv2.error:
+        return False
+
+
+def pin_current_thread(cpu: int) -> bool:
+    """Pin the calling thread to one CPU core; return False if unsupported.
+
+    Keeps a capture thread's frame buffers warm in one core's caches instead
+    of letting the scheduler migrate it between cores.
+    """
+    try:
+        if hasattr(os, "sched_setaffinity"):
+            # On Linux pid 0 is the calling thread, not the whole process
+            os.sched_setaffinity(0, {cpu})
+            return True
+        if sys.platform == "win32":
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            return bool(
+                kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), 1 << cpu)
+            )
+    except (OSError, ValueError):
+        pass
+    return False
+
+
+def raise_current_thread_priority() -> bool:
+    """Give the calling thread a slightly higher scheduling priority.
+
+    Needs CAP_SYS_NICE (or root) on Linux; returns False when not permitted.
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            thread_priority_above_normal = 1
+            return bool(
+                kernel32.SetThreadPriority(
+                    kernel32.GetCurrentThread(), thread_priority_above_normal
+                )
+            )
+        if sys.platform == "linux":
+            # Linux nice values are per thread (the TID is a PRIO_PROCESS id)
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -5)
+            return True
+    except (OSError, AttributeError):
+        pass
+    return False
+
+
 def supports_hw_acceleration(backend: int) -> bool:
     """Return True if the capture backend honors CAP_PROP_HW_ACCELERATION."""
     return backend in HW_ACCEL_BACKENDS
@@ -57,11 +204,113 @@ def hw_acceleration_name(value: float) -> str:
     return _HW_ACCEL_NAMES.get(int(value), f"unknown ({int(value)})")
 
 
+def cuda_decode_available() -> bool:
+    """Return True if OpenCV was built with cudacodec and sees a CUDA device."""
+    try:
+        return (
+            hasattr(cv2, "cudacodec") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+        )
+    except (cv2.error, AttributeError):
+        return False
+
+
+# RTSP through GStreamer: decodebin autoplugs the platform's hardware decoder
+# (VAAPI, NVDEC/nvv4l2decoder, V4L2 M2M, D3D11, ...) for H.264 and H.265, and
+# appsink keeps a single frame, dropping older ones, so latency is bounded by
+# the pipeline itself rather than FFmpeg's internal buffering.
+GSTREAMER_RTSP_PIPELINE = (
+    'rtspsrc location="{url}" latency=0 drop-on-latency=true ! decodebin ! '
+    "videoconvert ! video/x-raw,format=BGR ! "
+    "appsink max-buffers=1 drop=true sync=false"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def gstreamer_available() -> bool:
+    """Return True if OpenCV was built with the GStreamer video I/O backend."""
+    for line in cv2.getBuildInformation().splitlines():
+        if line.strip().startswith("GStreamer:"):
+            return "YES" in line
+    return False
+
+
+def build_gstreamer_pipeline(url: str) -> str:
+    """Build the low-latency GStreamer pipeline string for an RTSP URL."""
+    return GSTREAMER_RTSP_PIPELINE.format(url=url.replace('"', '\\"'))
+
+
+class CudaVideoCapture:
+    """VideoCapture look-alike decoding on the GPU via cv2.cudacodec (NVDEC).
+
+    Implements the subset of the VideoCapture API the camera threads use, so
+    the stream loop runs unchanged.  Frames stay in GPU memory until
+    ``retrieve()``, which converts to BGR on the GPU and downloads only the
+    frames that are actually delivered.  With ``download=False`` it returns
+    the ``cv2.cuda.GpuMat`` itself and frames never leave the GPU.
+    """
+
+    def __init__(self, source: str, download: bool = True):
+        self._reader = cv2.cudacodec.createVideoReader(source)
+        self.download = download
+
+    def isOpened(self) -> bool:
+        return self._reader is not None
+
+    def grab(self) -> bool:
+        try:
+            return bool(self._reader.grab())
+        except cv2.error:
+            return False
+
+    def retrieve(self, image=None):
+        try:
+            ok, gpu_frame = self._reader.retrieve()
+        except cv2.error:
+            return False, None
+        if not ok:
+            return False, None
+        if gpu_frame.channels() == 4:
+            gpu_frame = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGRA2BGR)
+        if not self.download:
+            return True, gpu_frame
+        if image is not None and image.shape[:2] == gpu_frame.size()[::-1]:
+            return True, gpu_frame.download(image)
+        return True, gpu_frame.download()
+
+    def read(self, image=None):
+        if not self.grab():
+            return False, None
+        return self.retrieve(image)
+
+    def set(self, prop_id: int, value: float) -> bool:
+        # Resolution/FPS/buffering are fixed by the stream and decoder
+        return False
+
+    def get(self, prop_id: int) -> float:
+        return 0.0
+
+    def release(self):
+        self._reader = None
+
+
 class BaseCameraThread(threading.Thread, ABC):
     DEFAULT_BACKENDS = {
-        "linux": [cv2.CAP_V4L2],
-        "default": [cv2.CAP_DSHOW, cv2.CAP_MSMF],
+        "linux": (cv2.CAP_V4L2,),
+        "default": (cv2.CAP_DSHOW, cv2.CAP_MSMF),
     }
+    # Backends of the platform we run on, resolved once at import
+    PLATFORM_BACKENDS = DEFAULT_BACKENDS[
+        "linux" if sys.platform == "linux" else "default"
+    ]
+    # Whether the capture backends can honor CAP_PROP_BUFFERSIZE=1 (a
+    # refusal is then worth a warning)
+    REQUEST_SINGLE_BUFFER = True
+    # Reconnect backoff: the first retry waits up to RECONNECT_DELAY, the
+    # bound doubling with each retry up to RECONNECT_MAX_DELAY
+    RECONNECT_DELAY = 0.5
+    RECONNECT_MAX_DELAY = 8.0
+    # A flaky camera can fail reads ~10 times a second; warn at most this often
+    READ_ERROR_LOG_INTERVAL = 1.0
 
     def __init__(
         self,
@@ -73,6 +322,13 @@ class BaseCameraThread(threading.Thread, ABC):
         fps: int = 30,
         min_uptime: float = 5.0,
         hw_acceleration: bool = True,
+        sample_every: int = 1,
+        target_fps: Optional[float] = None,
+        reuse_buffers: bool = False,
+        frame_format: str = "bgr",
+        cpu_affinity: Optional[int] = None,
+        output_width: Optional[int] = None,
+        output_height: Optional[int] = None,
     ):
         """
         Base thread for handling a single camera stream
@@ -87,6 +343,23 @@ class BaseCameraThread(threading.Thread, ABC):
             min_uptime: Minimum operational time before reconnecting (seconds)
             hw_acceleration: Request GPU-accelerated decoding on capable
                 backends (FFMPEG/GStreamer/MSMF/MFX); falls back to software
+            sample_every: Decode only every Nth frame; the others are grabbed
+                (demuxed) to keep the stream current but never decoded
+            target_fps: Optional cap on delivered frames per second; frames
+                arriving sooner than 1/target_fps after the last delivered
+                one are grabbed but not decoded
+            reuse_buffers: Decode into a small pool of reused arrays instead
+                of allocating a new one per frame. A buffer is only reused
+                once nothing references the frame in it any more
+            frame_format: "bgr" (default) or "raw" to skip the backend's
+                conversion and deliver the camera's native format (YUYV or
+                MJPEG bytes) where the backend supports CAP_PROP_CONVERT_RGB
+            cpu_affinity: CPU core to pin this thread to (and raise its
+                priority where permitted); None leaves scheduling to the OS
+            output_width: With output_height, scale BGR frames to this size
+                before handing them over, so consumers that only need a
+                smaller image never receive (or copy) the full one
+            output_height: See output_width
         """
 
         super().__init__()
@@ -98,23 +371,59 @@ class BaseCameraThread(threading.Thread, ABC):
         self.fps = fps
         self.min_uptime = min_uptime
         self.hw_acceleration = hw_acceleration
+        self.sample_every = max(1, int(sample_every))
+        self.target_fps = target_fps
+        self.reuse_buffers = reuse_buffers
+        self.frame_format = frame_format
+        self.cpu_affinity = cpu_affinity
+        self.output_size = (
+            (output_width, output_height)
+            if output_width and output_height and frame_format == "bgr"
+            else None
+        )
+
+        # Decode targets, allocated lazily from the first frames so the
+        # negotiated resolution (not the requested one) is used.
+        self._pool = FramePool()
+        # Scaling targets (output_size with reuse_buffers)
+        self._output_pool = FramePool()
 
         self.cap: cv2.VideoCapture | None = None
+        # Backend that last opened this camera; tried first on reconnect
+        self._working_backend: Optional[int] = None
+        # time.monotonic() of the last delivered frame
         self.last_frame_time = 0
+        # Running totals for stats(); plain ints, only this thread writes them
+        self.frames_grabbed = 0
+        self.frames_delivered = 0
+        self.read_errors = 0
+        self._retrieve_ns: deque = deque(maxlen=LATENCY_SAMPLES)
+        # Read errors not yet reported, and when they last were
+        self._unlogged_read_errors = 0
+        self._last_read_error_log = float("-inf")
         self.retry_count = 0
         self.max_retries = 3
         self.logger = logging.getLogger(f"{self.__class__.__name__}-{camera_id}")
 
-    def _try_open_camera(self, backends: list) -> Optional[cv2.VideoCapture]:
-        """A common method for opening a camera with different backends"""
+    def _try_open_camera(self, backends: Sequence[int]) -> Optional[cv2.VideoCapture]:
+        """A common method for opening a camera with different backends.
+
+        The backend that worked last time is tried first: a failed probe
+        (e.g. DSHOW before MSMF on Windows) costs a second or more.
+        """
+        if self._working_backend in backends:
+            backends = [self._working_backend] + [
+                backend for backend in backends if backend != self._working_backend
+            ]
         for backend in backends:
             try:
                 cap = self._create_capture(self._get_open_args(backend), backend)
                 if cap.isOpened():
+                    self._working_backend = backend
                     self._configure_camera(cap)
                     self._log_acceleration(cap, backend)
                     return cap
-            except Exception:
+            except CAPTURE_ERRORS:
                 continue
         return None
 
@@ -131,18 +440,26 @@ class BaseCameraThread(threading.Thread, ABC):
             return
         try:
             mode = hw_acceleration_name(cap.get(cv2.CAP_PROP_HW_ACCELERATION))
-        except Exception:
+        except cv2.error:
             return
-        self.logger.info(f"Camera {self._get_source()} hardware acceleration: {mode}")
+        self.logger.info(
+            "Camera %s hardware acceleration: %s", self._get_source(), mode
+        )
 
     def _configure_camera(self, cap: cv2.VideoCapture):
         """General camera configuration"""
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_width)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
-        cap.set(cv2.CAP_PROP_FPS, self.fps)
-        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-        if hasattr(self, "_additional_config"):
-            self._additional_config(cap)
+        if self.REQUEST_SINGLE_BUFFER and not request_single_buffer(cap):
+            # The stream loop grabs every frame anyway, so the driver queue
+            # is drained continuously; frames are just older than they could be.
+            self.logger.warning(
+                "Camera %s ignored CAP_PROP_BUFFERSIZE=1", self._get_source()
+            )
+        if self.frame_format == "raw":
+            cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+        self._additional_config(cap)
+
+    def _additional_config(self, cap: cv2.VideoCapture):
+        """Source-specific settings applied after the common ones (none here)"""
 
     @abstractmethod
     def _get_open_args(self, backend: int) -> Any:
@@ -154,51 +471,169 @@ class BaseCameraThread(threading.Thread, ABC):
 
     def run(self):
         """Main thread loop for camera processing"""
+        if self.cpu_affinity is not None:
+            self._apply_cpu_affinity()
         while not self.stop_event.is_set() and self.retry_count < self.max_retries:
             source = self._get_source()
             try:
+                # _open_camera() only ever returns an opened capture
                 self.cap = self._open_camera()
-                if not self.cap or not self.cap.isOpened():
+                if self.cap is None:
                     raise RuntimeError(f"Cannot open camera {source}")
 
                 self._process_camera_stream(source)
-            except Exception as e:
+            except CAPTURE_ERRORS as e:
                 self._handle_camera_error(source, e)
             finally:
                 self._release_camera_resources()
 
+    def _apply_cpu_affinity(self):
+        """Pin this thread to its core and raise its priority if allowed."""
+        if not pin_current_thread(self.cpu_affinity):
+            self.logger.warning("Cannot pin thread to CPU %s", self.cpu_affinity)
+        elif not raise_current_thread_priority():
+            self.logger.debug("Thread priority left unchanged (not permitted)")
+
     def _open_camera(self) -> Optional[cv2.VideoCapture]:
         """Открытие камеры с учетом платформы"""
-        backends = self.DEFAULT_BACKENDS.get(
-            "linux" if sys.platform == "linux" else "default"
-        )
-        return self._try_open_camera(backends)
+        return self._try_open_camera(self.PLATFORM_BACKENDS)
 
     def _process_camera_stream(self, source: str):
         """Continuously read and process frames from camera"""
         self.retry_count = 0
-        self.logger.info(f"Camera {source} started")
-        start_time = time.time()
+        self.logger.info("Camera %s started", source)
+        # All timing uses the monotonic clock, read once per iteration: it
+        # is cheaper than time.time() and not thrown off by wall-clock
+        # adjustments (NTP, DST) that could fake or hide min_uptime
+        start_time = time.monotonic()
+        grabbed = 0
+        last_decode = float("-inf")
 
         while not self.stop_event.is_set():
-            ret, frame = self.cap.read()
+            # grab() only demuxes; the expensive decode happens in retrieve(),
+            # which is skipped for frames nobody is going to look at.
+            ret = self.cap.grab()
+            now = time.monotonic()
+            if ret:
+                grabbed += 1
+                self.frames_grabbed += 1
+                if not self._should_decode(grabbed, now, last_decode):
+                    continue
+                started = time.perf_counter_ns()
+                ret, frame = self._retrieve_frame()
+                self._retrieve_ns.append(time.perf_counter_ns() - started)
+                if ret and self.output_size is not None:
+                    frame = self._scale_frame(frame)
             if not ret:
-                if time.time() - start_time < self.min_uptime:
-                    self.logger.warning(f"Camera {source} frame read error")
-                    time.sleep(0.1)
+                self.read_errors += 1
+                if now - start_time < self.min_uptime:
+                    self._log_read_error(source, now)
+                    self.stop_event.wait(0.1)
                     continue
                 break
 
-            self.frame_queue.put((self.camera_id, frame))
-            self.last_frame_time = time.time()
+            put_latest(self.frame_queue, (self.camera_id, frame))
+            self.frames_delivered += 1
+            last_decode = now
+            self.last_frame_time = now
+
+    def stats(self) -> Dict[str, float]:
+        """Frame counters since the thread started and recent decode latency.
+
+        ``retrieve_ms_p50``/``retrieve_ms_p99`` cover the last
+        ``LATENCY_SAMPLES`` retrieve() calls (0.0 before the first one).
+        """
+        samples = sorted(self._retrieve_ns)
+
+        def percentile(fraction: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * fraction))] / 1e6
+
+        return {
+            "frames_grabbed": self.frames_grabbed,
+            "frames_delivered": self.frames_delivered,
+            "read_errors": self.read_errors,
+            "retrieve_ms_p50": percentile(0.5),
+            "retrieve_ms_p99": percentile(0.99),
+        }
+
+    def _log_read_error(self, source: str, now: float):
+        """Warn about a read error, folding repeats into one line per interval."""
+        self._unlogged_read_errors += 1
+        elapsed = now - self._last_read_error_log
+        if elapsed < self.READ_ERROR_LOG_INTERVAL:
+            return
+        if self._unlogged_read_errors == 1:
+            self.logger.warning("Camera %s frame read error", source)
+        else:
+            self.logger.warning(
+                "Camera %s: %d frame read errors in the last %.1fs",
+                source,
+                self._unlogged_read_errors,
+                elapsed,
+            )
+        self._unlogged_read_errors = 0
+        self._last_read_error_log = now
+
+    def _retrieve_frame(self):
+        """Decode the grabbed frame, into a reused buffer if enabled."""
+        if not self.reuse_buffers:
+            return self.cap.retrieve()
+
+        buf = self._pool.acquire()
+        if buf is None:
+            ret, frame = self.cap.retrieve()
+        else:
+            ret, frame = self.cap.retrieve(buf)
+        if ret and frame is not None:
+            self._pool.release(buf, frame)
+        return ret, frame
+
+    def _scale_frame(self, frame):
+        """Scale a decoded frame to ``output_size``, into a reused buffer if enabled."""
+        width, height = self.output_size
+        if frame.shape[:2] == (height, width):
+            return frame
+        buf = self._output_pool.acquire() if self.reuse_buffers else None
+        scaled = cv2.resize(frame, self.output_size, buf, interpolation=cv2.INTER_AREA)
+        if self.reuse_buffers:
+            self._output_pool.release(buf, scaled)
+        return scaled
+
+    def _should_decode(self, grabbed: int, now: float, last_decode: float) -> bool:
+        """Return True if the frame just grabbed should be retrieved (decoded).
+
+        A frame is decoded when it falls on the ``sample_every`` cadence and,
+        with ``target_fps`` set, enough wall time has passed since the last
+        decoded frame.
+        """
+        if grabbed % self.sample_every:
+            return False
+        if self.target_fps:
+            return now - last_decode >= 1.0 / self.target_fps
+        return True
 
     def _handle_camera_error(self, source: str, error: Exception):
         """Handle camera errors and schedule reconnection"""
-        self.logger.error(f"Camera {source} error: {str(error)}")
+        self.logger.error("Camera %s error: %s", source, error)
         self.retry_count += 1
         if self.retry_count < self.max_retries:
-            self.logger.info(f"Reconnecting to {source}...")
-            time.sleep(2.0)
+            delay = self._reconnect_delay()
+            self.logger.info("Reconnecting to %s in %.1fs...", source, delay)
+            # Waiting on stop_event instead of sleeping lets stop() end the
+            # thread mid-backoff.
+            self.stop_event.wait(delay)
+
+    def _reconnect_delay(self) -> float:
+        """Exponential backoff with full jitter for ``retry_count`` (>= 1).
+
+        The delay is drawn uniformly below the exponential bound, so cameras
+        that dropped together (a network blip, a shared NVR restarting)
+        don't all reconnect at the same instants.
+        """
+        delay = self.RECONNECT_DELAY * 2 ** (self.retry_count - 1)
+        return random.uniform(0, min(delay, self.RECONNECT_MAX_DELAY))
 
     def _release_camera_resources(self):
         """Clean up camera resources"""
@@ -208,7 +643,13 @@ class BaseCameraThread(threading.Thread, ABC):
 
 
 class USBCameraThread(BaseCameraThread):
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        v4l2_on_demand: bool = False,
+        fourcc: Optional[str] = "MJPG",
+        **kwargs,
+    ):
         """
         Base thread for handling a single USB camera stream
 
@@ -220,8 +661,17 @@ class USBCameraThread(BaseCameraThread):
             frame_height: Desired frame height
             fps: Target frames per second
             min_uptime: Minimum operational time before reconnecting (seconds)
+            v4l2_on_demand: On Linux, capture through raw V4L2 with a single
+                buffer queued right before each read, so every frame is the
+                newest one (BGR frames only); falls back to OpenCV otherwise.
+                fps and autofocus-off are applied as V4L2 controls
+            fourcc: Pixel format to request from the camera; "MJPG" reaches
+                higher resolutions and frame rates over USB 2.0 than
+                uncompressed YUYV. None keeps the driver's default
         """
         super().__init__(*args, **kwargs)
+        self.v4l2_on_demand = v4l2_on_demand
+        self.fourcc = fourcc
 
     def _get_open_args(self, _) -> Any:
         return self.camera_id
@@ -229,12 +679,104 @@ class USBCameraThread(BaseCameraThread):
     def _get_source(self) -> str:
         return f"USB Camera {self.camera_id}"
 
+    def _configure_camera(self, cap: cv2.VideoCapture):
+        # The pixel format goes first: the sizes and frame rates a camera
+        # offers depend on it
+        if self.fourcc is not None:
+            code = cv2.VideoWriter_fourcc(*self.fourcc)
+            if int(cap.get(cv2.CAP_PROP_FOURCC)) != code:
+                cap.set(cv2.CAP_PROP_FOURCC, code)
+        self._request_mode(cap)
+        super()._configure_camera(cap)
+        # A USB camera without the requested mode silently falls back to
+        # another one (stream resolutions are fixed, so IP cameras skip this)
+        width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+        height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+        requested = (self.frame_width, self.frame_height)
+        if width > 0 and (int(width), int(height)) != requested:
+            self.logger.warning(
+                "Camera %s delivers %dx%d instead of the requested %dx%d",
+                self._get_source(),
+                width,
+                height,
+                self.frame_width,
+                self.frame_height,
+            )
+
+    def _request_mode(self, cap: cv2.VideoCapture):
+        """Set the frame size and FPS where the device reports another value.
+
+        On V4L2 each accepted size or FPS change restarts the capture
+        (buffers are unmapped and renegotiated), and every set is a driver
+        round-trip.  A value of 0 or less means the backend doesn't support
+        the property, so setting it would be wasted too.  Width and height
+        are always set as a pair so backends that apply the size once both
+        are known still get a complete request.
+        """
+        width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+        height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+        if width > 0 and height > 0 and (width, height) != (
+            self.frame_width,
+            self.frame_height,
+        ):
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        if fps > 0 and fps != self.fps:
+            cap.set(cv2.CAP_PROP_FPS, self.fps)
+
     def _additional_config(self, cap: cv2.VideoCapture):
         cap.set(cv2.CAP_PROP_AUTOFOCUS, 0)
 
+    def _open_camera(self) -> Optional[cv2.VideoCapture]:
+        if (
+            self.v4l2_on_demand
+            and sys.platform == "linux"
+            and self.frame_format == "bgr"
+        ):
+            cap = self._open_on_demand_camera()
+            if cap is not None:
+                return cap
+        return super()._open_camera()
+
+    def _open_on_demand_camera(self) -> Optional[OnDemandV4L2Capture]:
+        """Open the camera for Q=1 V4L2 capture, or None to fall back to OpenCV."""
+        try:
+            cap = OnDemandV4L2Capture(
+                self.camera_id,
+                self.frame_width,
+                self.frame_height,
+                self.fourcc or "MJPG",
+                self.fps,
+            )
+        except OSError as e:
+            self.logger.warning(
+                "On-demand V4L2 capture unavailable for %s, using OpenCV: %s",
+                self._get_source(),
+                e,
+            )
+            return None
+        self._additional_config(cap)
+        self.logger.info("Camera %s capturing on demand (V4L2)", self._get_source())
+        return cap
+
 
 class IPCameraThread(BaseCameraThread):
-    def __init__(self, rtsp_url: str, *args, **kwargs):
+    # FFmpeg (and the GStreamer/cudacodec paths) never honor
+    # CAP_PROP_BUFFERSIZE, so it isn't set; FFMPEG_LOW_LATENCY_OPTIONS and
+    # the one-frame appsink limit their buffering instead.
+    REQUEST_SINGLE_BUFFER = False
+
+    def __init__(
+        self,
+        rtsp_url: str,
+        *args,
+        cuda_decode: bool = False,
+        gstreamer: bool = False,
+        gpu_frames: bool = False,
+        rtsp_transport: Optional[str] = "tcp",
+        **kwargs,
+    ):
         """
         Base thread for handling a single IP camera stream
 
@@ -247,9 +789,22 @@ class IPCameraThread(BaseCameraThread):
             frame_height: Desired frame height
             fps: Target frames per second
             min_uptime: Minimum operational time before reconnecting (seconds)
+            cuda_decode: Decode on an NVIDIA GPU via cv2.cudacodec when OpenCV
+                was built with CUDA; falls back to FFMPEG otherwise
+            gstreamer: Open the stream through a GStreamer pipeline with
+                hardware decoding and a one-frame appsink when OpenCV has the
+                GStreamer backend; falls back to FFMPEG otherwise
+            gpu_frames: With cuda_decode, deliver the decoded ``cv2.cuda.GpuMat``
+                instead of downloading it to a host array
+            rtsp_transport: FFmpeg RTSP transport ("tcp", "udp", ...); None
+                keeps FFmpeg's default
         """
         super().__init__(*args, **kwargs)
         self.rtsp_url = rtsp_url
+        self.cuda_decode = cuda_decode
+        self.gstreamer = gstreamer
+        self.gpu_frames = gpu_frames
+        self.rtsp_transport = rtsp_transport
 
     def _get_open_args(self, _) -> Any:
         return self.rtsp_url
@@ -258,6 +813,15 @@ class IPCameraThread(BaseCameraThread):
         return self.rtsp_url
 
     def _open_camera(self) -> Optional[cv2.VideoCapture]:
+        if self.cuda_decode and cuda_decode_available():
+            cap = self._open_cuda_camera()
+            if cap is not None:
+                return cap
+        if self.gstreamer and gstreamer_available():
+            cap = self._open_gstreamer_camera()
+            if cap is not None:
+                return cap
+
         # Prefer FFMPEG with hardware acceleration (best for H.264/H.265 RTSP
         # decoding), then fall back to plain FFMPEG, then auto-detected backend.
         attempts = []
@@ -271,15 +835,20 @@ class IPCameraThread(BaseCameraThread):
         attempts.append((cv2.CAP_FFMPEG, None))
         attempts.append((cv2.CAP_ANY, None))
 
+        options = ffmpeg_low_latency_options(self.rtsp_transport)
         for backend, params in attempts:
             try:
-                if params is not None:
-                    cap = cv2.VideoCapture(self.rtsp_url, backend, params)
-                else:
-                    cap = cv2.VideoCapture(self.rtsp_url, backend)
-            except Exception as e:
+                with ffmpeg_capture_options(options):
+                    if params is not None:
+                        cap = cv2.VideoCapture(self.rtsp_url, backend, params)
+                    else:
+                        cap = cv2.VideoCapture(self.rtsp_url, backend)
+            except CAPTURE_ERRORS as e:
                 self.logger.error(
-                    f"Failed to open IP camera {self.rtsp_url} (backend={backend}): {e}"
+                    "Failed to open IP camera %s (backend=%s): %s",
+                    self.rtsp_url,
+                    backend,
+                    e,
                 )
                 continue
 
@@ -290,3 +859,33 @@ class IPCameraThread(BaseCameraThread):
             if cap is not None:
                 cap.release()
         return None
+
+    def _open_cuda_camera(self) -> Optional[CudaVideoCapture]:
+        """Open the stream on the GPU decoder, or None to fall back to FFMPEG."""
+        try:
+            cap = CudaVideoCapture(self.rtsp_url, download=not self.gpu_frames)
+        except cv2.error as e:
+            self.logger.warning(
+                "CUDA decoding unavailable for %s, using FFMPEG: %s", self.rtsp_url, e
+            )
+            return None
+        self.logger.info("Camera %s hardware acceleration: cudacodec", self.rtsp_url)
+        return cap
+
+    def _open_gstreamer_camera(self) -> Optional[cv2.VideoCapture]:
+        """Open the stream through GStreamer, or None to fall back to FFMPEG."""
+        try:
+            cap = cv2.VideoCapture(
+                build_gstreamer_pipeline(self.rtsp_url), cv2.CAP_GSTREAMER
+            )
+        except CAPTURE_ERRORS as e:
+            self.logger.warning("GStreamer failed for %s: %s", self.rtsp_url, e)
+            return None
+        if cap.isOpened():
+            self.logger.info("Camera %s opened via GStreamer", self.rtsp_url)
+            return cap
+        cap.release()
+        self.logger.warning(
+            "GStreamer could not open %s, falling back to FFMPEG", self.rtsp_url
+        )
+        return None
@@ -107,24 +107,40 @@ def _supports_video_capture(idx: int) -> Optional[bool]:
 _USB_SEGMENT_RE = re.compile(r"^\d+-\d+(?:\.\d+)*$")
 
 
+_V4L_CLASS_DIR = "/sys/class/video4linux"
+
+
+def _scan_video_nodes() -> Optional[Dict[int, str]]:
+    """Return ``{video_index: sysfs_entry_path}`` or None if sysfs is missing.
+
+    One ``os.scandir`` pass (a single ``getdents64``) over the class
+    directory; unlike ``Path.iterdir`` it builds no ``Path`` object per
+    entry, which matters because the monitor rescans every few seconds.
+    """
+    try:
+        entries = os.scandir(_V4L_CLASS_DIR)
+    except OSError:
+        return None
+    nodes: Dict[int, str] = {}
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith("video"):
+                continue
+            try:
+                nodes[int(name[5:])] = entry.path
+            except ValueError:
+                continue
+    return nodes
+
+
 def _video_sysfs_paths() -> Dict[int, str]:
     """Return {video_index: resolved_sysfs_path} for all /dev/videoN devices."""
-    v4l_class = Path("/sys/class/video4linux")
-    result: Dict[int, str] = {}
-    if not v4l_class.is_dir():
+    nodes = _scan_video_nodes()
+    if nodes is None:
         logger.warning("/sys/class/video4linux not found — USB topology unavailable")
-        return result
-    for entry in sorted(v4l_class.iterdir()):
-        name = entry.name
-        if not name.startswith("video"):
-            continue
-        try:
-            idx = int(name.removeprefix("video"))
-        except ValueError:
-            continue
-        resolved = str(entry.resolve())
-        result[idx] = resolved
-    return result
+        return {}
+    return {idx: os.path.realpath(nodes[idx]) for idx in sorted(nodes)}
 
 
 def present_video_devices() -> Optional[Set[int]]:
@@ -142,19 +158,10 @@ def present_video_devices() -> Optional[Set[int]]:
         unavailable (e.g. non-Linux platforms), signalling callers that
         sysfs-based presence detection cannot be used.
     """
-    v4l_class = Path("/sys/class/video4linux")
-    if not v4l_class.is_dir():
+    nodes = _scan_video_nodes()
+    if nodes is None:
         return None
-    present: Set[int] = set()
-    for entry in v4l_class.iterdir():
-        name = entry.name
-        if not name.startswith("video"):
-            continue
-        try:
-            present.add(int(name.removeprefix("video")))
-        except ValueError:
-            continue
-    return present
+    return set(nodes)
 
 
 def present_capture_devices() -> Optional[Set[int]]:
@@ -177,14 +184,49 @@ def present_capture_devices() -> Optional[Set[int]]:
     present = present_video_devices()
     if present is None:
         return None
+    # Forget nodes that disappeared so a re-created index is probed afresh.
+    for idx in list(_capture_cache):
+        if idx not in present:
+            del _capture_cache[idx]
     capture: Set[int] = set()
     for idx in present:
-        supported = _supports_video_capture(idx)
+        supported = _cached_supports_video_capture(idx)
         if supported is None or supported:
             capture.add(idx)
     return capture
 
 
+# {video_index: (device node identity, supports capture)}.  A node's
+# capabilities never change while it exists, so the monitor loop's scan
+# every few seconds only opens nodes it has not seen before.
+_capture_cache: Dict[int, Tuple[Tuple[int, int], bool]] = {}
+
+
+def _device_identity(idx: int) -> Optional[Tuple[int, int]]:
+    """Identify the current ``/dev/videoN`` node (it is re-created on replug)."""
+    try:
+        st = os.stat(f"/dev/video{idx}")
+    except OSError:
+        return None
+    return st.st_ino, st.st_ctime_ns
+
+
+def _cached_supports_video_capture(idx: int) -> Optional[bool]:
+    """:func:`_supports_video_capture`, answered from cache when possible.
+
+    Only definite answers are cached; an unknown (``None``) result is
+    retried on the next scan.
+    """
+    identity = _device_identity(idx)
+    cached = _capture_cache.get(idx)
+    if identity is not None and cached is not None and cached[0] == identity:
+        return cached[1]
+    supported = _supports_video_capture(idx)
+    if identity is not None and supported is not None:
+        _capture_cache[idx] = (identity, supported)
+    return supported
+
+
 def _extract_usb_parent(path: str) -> Tuple[str, int]:
     """From a resolved sysfs path, extract the shared hub ancestor and depth.
 
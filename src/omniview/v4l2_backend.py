@@ -44,6 +44,7 @@ i32 = ctypes.c_int32
 V4L2_BUF_TYPE_VIDEO_CAPTURE = 1
 V4L2_MEMORY_MMAP = 1
 V4L2_FIELD_NONE = 1
+V4L2_CID_FOCUS_AUTO = 0x009A0900 + 12  # V4L2_CID_CAMERA_CLASS_BASE + 12
 
 
 def _fourcc(code: str) -> int:
@@ -118,11 +119,37 @@ class v4l2_buffer(ctypes.Structure):
     ]
 
 
+class v4l2_fract(ctypes.Structure):
+    _fields_ = [("numerator", u32), ("denominator", u32)]
+
+
+class v4l2_captureparm(ctypes.Structure):
+    _fields_ = [
+        ("capability", u32), ("capturemode", u32),
+        ("timeperframe", v4l2_fract), ("extendedmode", u32),
+        ("readbuffers", u32), ("reserved", u32 * 4),
+    ]
+
+
+class v4l2_streamparm(ctypes.Structure):
+    _fields_ = [
+        ("type", u32),
+        ("capture", v4l2_captureparm),
+        ("_fill", u8 * (200 - ctypes.sizeof(v4l2_captureparm))),
+    ]
+
+
+class v4l2_control(ctypes.Structure):
+    _fields_ = [("id", u32), ("value", i32)]
+
+
 # ABI assertions — fail loudly on 32-bit or mismatched headers.
 assert ctypes.sizeof(v4l2_pix_format) == 48
 assert ctypes.sizeof(v4l2_format) == 208
 assert ctypes.sizeof(v4l2_requestbuffers) == 20
 assert ctypes.sizeof(v4l2_buffer) == 88
+assert ctypes.sizeof(v4l2_streamparm) == 204
+assert ctypes.sizeof(v4l2_control) == 8
 
 # ---------------------------------------------------------------------------
 # ioctl helpers
@@ -159,6 +186,8 @@ VIDIOC_QBUF = _IOWR("V", 15, ctypes.sizeof(v4l2_buffer))
 VIDIOC_DQBUF = _IOWR("V", 17, ctypes.sizeof(v4l2_buffer))
 VIDIOC_STREAMON = _IOW("V", 18, ctypes.sizeof(ctypes.c_int))
 VIDIOC_STREAMOFF = _IOW("V", 19, ctypes.sizeof(ctypes.c_int))
+VIDIOC_S_PARM = _IOWR("V", 22, ctypes.sizeof(v4l2_streamparm))
+VIDIOC_S_CTRL = _IOWR("V", 28, ctypes.sizeof(v4l2_control))
 
 
 def _xioctl(fd, request, arg):
@@ -198,6 +227,7 @@ class V4L2Camera:
         self.width = width
         self.height = height
         self.pixelformat: int = 0
+        self.fps: float = 0.0
         self.fd: int = -1
         self.nbuffers = nbuffers
         self.buffers: List[mmap.mmap] = []
@@ -262,17 +292,55 @@ class V4L2Camera:
 
     # -- public API ----------------------------------------------------------
 
-    def start(self, retries: int = 12, retry_delay: float = 0.02) -> None:
+    def set_fps(self, fps: float) -> float:
+        """Request a frame interval of ``1 / fps`` (before ``start()``).
+
+        Returns the frame rate the driver granted, or 0.0 if it doesn't
+        support setting one.
+        """
+        parm = v4l2_streamparm()
+        parm.type = V4L2_BUF_TYPE_VIDEO_CAPTURE
+        parm.capture.timeperframe.numerator = 1000
+        parm.capture.timeperframe.denominator = round(fps * 1000)
+        try:
+            _xioctl(self.fd, VIDIOC_S_PARM, parm)
+        except OSError as e:
+            logger.debug("VIDIOC_S_PARM failed on /dev/video%s: %s", self.idx, e)
+            return 0.0
+        # S_PARM writes back the granted interval.
+        interval = parm.capture.timeperframe
+        if interval.numerator:
+            self.fps = interval.denominator / interval.numerator
+        return self.fps
+
+    def set_control(self, control_id: int, value: int) -> bool:
+        """Set a V4L2 control; False if the camera doesn't have it."""
+        ctrl = v4l2_control(id=control_id, value=value)
+        try:
+            _xioctl(self.fd, VIDIOC_S_CTRL, ctrl)
+        except OSError as e:
+            logger.debug("VIDIOC_S_CTRL failed on /dev/video%s: %s", self.idx, e)
+            return False
+        return True
+
+    def start(
+        self,
+        retries: int = 12,
+        retry_delay: float = 0.02,
+        queue_buffers: bool = True,
+    ) -> None:
         """STREAMON — reserves the isochronous slot on the USB bus.
 
-        STREAMOFF dequeues all buffers, so we re-queue them first.
+        STREAMOFF dequeues all buffers, so we re-queue them first (unless
+        ``queue_buffers`` is False: the caller queues them on demand).
         STREAMON can briefly fail with ENOSPC/EBUSY if the previous slot
         hasn't been freed yet, so we retry for a short while.
         """
         if self.streaming:
             return
-        for i in range(self.nbuffers):
-            self._qbuf(i)
+        if queue_buffers:
+            for i in range(self.nbuffers):
+                self._qbuf(i)
         bt = ctypes.c_int(V4L2_BUF_TYPE_VIDEO_CAPTURE)
         last_exc: Optional[OSError] = None
         for _ in range(retries):
@@ -355,3 +423,110 @@ class V4L2Camera:
             )
             return cv2.cvtColor(yuy2, cv2.COLOR_YUV2BGR_YUYV)
         return None  # unsupported format
+
+
+# ---------------------------------------------------------------------------
+# OnDemandV4L2Capture
+# ---------------------------------------------------------------------------
+
+class OnDemandV4L2Capture:
+    """VideoCapture look-alike that captures each frame on demand (Q=1).
+
+    ``CAP_PROP_BUFFERSIZE=1`` is only a hint to OpenCV's V4L2 backend and
+    the driver usually keeps several buffers queued, so ``read()`` returns
+    the oldest of them: ``(Q - 1)`` frame periods stale.  Here the camera
+    has a single mmap'd buffer that is queued right before waiting for it,
+    so the frame ``grab()`` returns is always the next one the sensor
+    finished.  While no buffer is queued the driver drops frames instead of
+    holding them.
+
+    Implements the subset of the VideoCapture API the camera threads use.
+    """
+
+    def __init__(
+        self,
+        idx: int,
+        width: int = 640,
+        height: int = 480,
+        fourcc: str = "MJPG",
+        fps: Optional[float] = None,
+        timeout: float = 1.0,
+    ) -> None:
+        self.timeout = timeout
+        self._camera: Optional[V4L2Camera] = V4L2Camera(
+            idx, width, height, fourcc, nbuffers=1
+        )
+        self._queued = False
+        # (index, bytesused) of the buffer grab() dequeued, until retrieved
+        self._ready: Optional[tuple] = None
+        try:
+            # The frame interval can't be changed once streaming
+            if fps:
+                self._camera.set_fps(fps)
+            self._camera.start(queue_buffers=False)
+        except OSError:
+            self.release()
+            raise
+
+    def isOpened(self) -> bool:
+        return self._camera is not None
+
+    def grab(self) -> bool:
+        """Queue the empty buffer, wait for it to be filled and dequeue it."""
+        camera = self._camera
+        if camera is None:
+            return False
+        try:
+            if not self._queued:
+                camera._qbuf(0)
+                self._queued = True
+            ready, _, _ = select.select([camera.fd], [], [], self.timeout)
+            if not ready:
+                return False
+            buf = v4l2_buffer()
+            buf.type = V4L2_BUF_TYPE_VIDEO_CAPTURE
+            buf.memory = V4L2_MEMORY_MMAP
+            _xioctl(camera.fd, VIDIOC_DQBUF, buf)
+        except OSError:
+            return False
+        self._queued = False
+        self._ready = (buf.index, buf.bytesused)
+        return True
+
+    def retrieve(self, image=None):
+        # Decoding always produces a new array, so ``image`` is not used
+        if self._ready is None or self._camera is None:
+            return False, None
+        index, bytesused = self._ready
+        self._ready = None
+        frame = self._camera._decode(index, bytesused)
+        return frame is not None, frame
+
+    def read(self, image=None):
+        if not self.grab():
+            return False, None
+        return self.retrieve(image)
+
+    def set(self, prop_id: int, value: float) -> bool:
+        # Format, frame rate and buffering are fixed when the device is opened
+        if prop_id == cv2.CAP_PROP_AUTOFOCUS and self._camera is not None:
+            return self._camera.set_control(V4L2_CID_FOCUS_AUTO, int(value))
+        return False
+
+    def get(self, prop_id: int) -> float:
+        if self._camera is None:
+            return 0.0
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self._camera.width)
+        if prop_id == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self._camera.height)
+        if prop_id == cv2.CAP_PROP_FPS:
+            return self._camera.fps
+        return 0.0
+
+    def release(self):
+        if self._camera is not None:
+            self._camera.close()
+            self._camera = None
+        self._queued = False
+        self._ready = None
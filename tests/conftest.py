@@ -37,7 +37,10 @@ def mock_video_capture():
     cap = MagicMock()
     cap.isOpened.return_value = True
     cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+    cap.grab.return_value = True
+    cap.retrieve.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
     cap.set.return_value = True
+    cap.get.return_value = 0.0
     cap.release.return_value = None
     return cap
 
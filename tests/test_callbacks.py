@@ -0,0 +1,128 @@
+"""Unit-тесты для omniview.callbacks.CallbackDispatcher.
+
+Проверяет асинхронный вызов frame_callback: не более одного вызова на
+камеру одновременно, замена ожидающего кадра более свежим (drop-oldest)
+и изоляция исключений callback.
+"""
+
+import logging
+import threading
+
+import cv2
+import numpy as np
+
+from src.omniview.callbacks import CallbackDispatcher
+from src.omniview.callbacks import umat_callback
+
+
+def _dispatcher(callback, workers=2):
+    return CallbackDispatcher(callback, workers, logging.getLogger("test"))
+
+
+class TestCallbackDispatcher:
+    """Тесты CallbackDispatcher."""
+
+    def test_runs_callback_off_caller_thread(self):
+        """Callback выполняется в рабочем потоке, а не в вызывающем."""
+        ran_on = []
+        done = threading.Event()
+
+        def cb(cam_id, frame):
+            ran_on.append(threading.current_thread())
+            done.set()
+
+        dispatcher = _dispatcher(cb)
+        dispatcher.submit(0, "frame")
+
+        assert done.wait(timeout=1.0)
+        assert ran_on[0] is not threading.current_thread()
+        dispatcher.shutdown(wait=True)
+
+    def test_busy_camera_keeps_only_newest_frame(self):
+        """Пока callback камеры занят, ожидает только последний кадр."""
+        release = threading.Event()
+        started = threading.Event()
+        finished = threading.Event()
+        received = []
+
+        def cb(cam_id, frame):
+            received.append(frame)
+            started.set()
+            release.wait(timeout=2.0)
+            if frame == 4:
+                finished.set()
+
+        dispatcher = _dispatcher(cb)
+        dispatcher.submit(0, 1)
+        assert started.wait(timeout=1.0)
+        for frame in (2, 3, 4):
+            dispatcher.submit(0, frame)
+        release.set()
+
+        assert finished.wait(timeout=1.0)
+        dispatcher.shutdown(wait=True)
+        assert received == [1, 4]
+
+    def test_cameras_run_in_parallel(self):
+        """Медленный callback одной камеры не блокирует другую."""
+        release = threading.Event()
+        other_done = threading.Event()
+
+        def cb(cam_id, frame):
+            if cam_id == 0:
+                release.wait(timeout=2.0)
+            else:
+                other_done.set()
+
+        dispatcher = _dispatcher(cb)
+        dispatcher.submit(0, "slow")
+        dispatcher.submit(1, "fast")
+
+        assert other_done.wait(timeout=1.0)
+        release.set()
+        dispatcher.shutdown(wait=True)
+
+    def test_exception_is_logged_and_worker_continues(self, caplog):
+        """Исключение логируется, следующий кадр камеры всё равно обрабатывается."""
+        received = []
+        done = threading.Event()
+
+        def cb(cam_id, frame):
+            if frame == "bad":
+                raise RuntimeError("boom")
+            received.append(frame)
+            done.set()
+
+        dispatcher = _dispatcher(cb, workers=1)
+        dispatcher.submit(0, "bad")
+        dispatcher.submit(0, "good")
+
+        assert done.wait(timeout=1.0)
+        dispatcher.shutdown(wait=True)
+        assert received == ["good"]
+        assert "boom" in caplog.text
+
+    def test_submit_after_shutdown_is_ignored(self):
+        """После shutdown новые кадры не принимаются."""
+        received = []
+        dispatcher = _dispatcher(lambda cam_id, frame: received.append(frame))
+        dispatcher.shutdown(wait=True)
+
+        dispatcher.submit(0, "late")
+
+        assert received == []
+
+
+class TestUmatCallback:
+    """Тесты umat_callback."""
+
+    def test_wraps_frame_in_umat(self):
+        """Обёртка передаёт callback кадр как cv2.UMat с теми же данными."""
+        received = []
+        callback = umat_callback(lambda cam_id, frame: received.append(frame))
+
+        callback(3, np.full((4, 6, 3), 5, np.uint8))
+
+        assert isinstance(received[0], cv2.UMat)
+        assert received[0].get().shape == (4, 6, 3)
+        assert np.all(received[0].get() == 5)
@@ -0,0 +1,131 @@
+"""Unit-тесты для omniview.display.
+
+Проверяет опрос клавиатуры без сна waitKey (pollKey) и сборку
+мозаики из кадров нескольких камер для одного вызова imshow.
+"""
+
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+import src.omniview.display as display
+
+
+class TestPollKey:
+    """Тесты poll_key."""
+
+    def test_uses_poll_key(self):
+        """Используется неблокирующий cv2.pollKey."""
+        with patch("cv2.pollKey", create=True, return_value=27) as poll, patch(
+            "cv2.waitKey"
+        ) as wait:
+            assert display.poll_key() == 27
+        poll.assert_called_once_with()
+        wait.assert_not_called()
+
+    def test_falls_back_to_wait_key(self, monkeypatch):
+        """В OpenCV без pollKey (< 4.5) остаётся waitKey(1)."""
+        monkeypatch.delattr(cv2, "pollKey", raising=False)
+        with patch("cv2.waitKey", return_value=-1) as wait:
+            assert display.poll_key() == -1
+        wait.assert_called_once_with(1)
+
+
+class TestCreateWindow:
+    """Тесты create_window: окно с OpenGL-отрисовкой, если сборка позволяет."""
+
+    def test_requests_opengl_window(self, monkeypatch):
+        monkeypatch.setattr(display, "_opengl_windows", True)
+        with patch("cv2.namedWindow") as named:
+            display.create_window("cam")
+        named.assert_called_once_with("cam", cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+
+    def test_gives_up_after_unsupported_build(self, monkeypatch):
+        """Без поддержки OpenGL попытка не повторяется для других окон."""
+        monkeypatch.setattr(display, "_opengl_windows", True)
+        with patch("cv2.namedWindow", side_effect=cv2.error("no OpenGL")) as named:
+            display.create_window("a")
+            display.create_window("b")
+        named.assert_called_once()
+
+
+class TestBuildMosaic:
+    """Тесты grid_shape / build_mosaic."""
+
+    def test_grid_shape_is_square_ish(self):
+        assert display.grid_shape(1) == (1, 1)
+        assert display.grid_shape(3) == (2, 2)
+        assert display.grid_shape(5) == (2, 3)
+        assert display.grid_shape(4, cols=4) == (1, 4)
+
+    def test_tiles_frames_in_order(self):
+        """Кадры раскладываются по строкам, пустые ячейки чёрные."""
+        frames = [np.full((4, 6, 3), v, dtype=np.uint8) for v in (1, 2, 3)]
+
+        mosaic = display.build_mosaic(frames, (6, 4))
+
+        assert mosaic.shape == (8, 12, 3)
+        assert np.all(mosaic[:4, :6] == 1)
+        assert np.all(mosaic[:4, 6:] == 2)
+        assert np.all(mosaic[4:, :6] == 3)
+        assert np.all(mosaic[4:, 6:] == 0)
+
+    def test_resizes_mismatched_frames(self):
+        """Кадр другого разрешения приводится к размеру плитки."""
+        frames = [np.zeros((4, 6, 3), np.uint8), np.zeros((8, 12, 3), np.uint8)]
+
+        mosaic = display.build_mosaic(frames, (6, 4))
+
+        assert mosaic.shape == (4, 12, 3)
+
+    def test_resizes_into_tile(self):
+        """Масштабированный кадр пишется прямо в плитку холста."""
+        frames = [np.zeros((4, 6, 3), np.uint8), np.full((8, 12, 3), 7, np.uint8)]
+
+        mosaic = display.build_mosaic(frames, (6, 4))
+
+        assert np.all(mosaic[:, 6:] == 7)
+        assert np.all(mosaic[:, :6] == 0)
+
+    def test_mosaic_reuses_canvas(self):
+        """Холст выделяется один раз и переиспользуется между кадрами."""
+        mosaic = display.Mosaic((6, 4))
+        frames = [np.full((4, 6, 3), 1, np.uint8)] * 2
+
+        first = mosaic.render(frames)
+        second = mosaic.render(frames)
+
+        assert first is second
+
+    def test_mosaic_blanks_tiles_of_removed_cameras(self):
+        """Плитка пропавшей камеры очищается, а не показывает старый кадр."""
+        mosaic = display.Mosaic((6, 4))
+        mosaic.render([np.full((4, 6, 3), 9, np.uint8)] * 4)  # сетка 2x2
+
+        mosaic.render([np.full((4, 6, 3), 9, np.uint8)] * 3)  # та же сетка
+
+        assert np.all(mosaic.tile(2) == 9)
+        assert np.all(mosaic.tile(3) == 0)
+
+
+class TestToBgr:
+    """Тесты to_bgr: показ сырых кадров (frame_format="raw")."""
+
+    def test_bgr_frame_returned_as_is(self):
+        frame = np.zeros((4, 6, 3), np.uint8)
+        assert display.to_bgr(frame) is frame
+
+    def test_converts_yuyv(self):
+        """Упакованный YUYV (H x W x 2) конвертируется в BGR."""
+        yuyv = np.zeros((4, 6, 2), np.uint8)
+        assert display.to_bgr(yuyv).shape == (4, 6, 3)
+
+    def test_decodes_mjpeg_bytes(self):
+        """Сжатый MJPEG-буфер декодируется."""
+        ok, jpeg = cv2.imencode(".jpg", np.zeros((4, 6, 3), np.uint8))
+        assert ok
+        assert display.to_bgr(jpeg.reshape(1, -1)).shape == (4, 6, 3)
+
+    def test_unknown_format_returns_none(self):
+        assert display.to_bgr(np.zeros((4, 6, 4), np.uint8)) is None
@@ -0,0 +1,160 @@
+"""Unit-тесты для omniview.frames.LatestFrameSlots.
+
+Проверяет передачу кадров «только последний»: производитель перезаписывает
+свой слот, потребитель забирает самый свежий кадр каждой камеры, а put()
+никогда не блокируется.
+"""
+
+import queue
+import threading
+
+import numpy as np
+import pytest
+
+from src.omniview.frames import LatestFrameSlots
+from src.omniview.frames import frame_signature
+from src.omniview.frames import put_latest
+
+
+class TestLatestFrameSlots:
+    """Тесты LatestFrameSlots."""
+
+    def test_starts_empty(self):
+        """Новый объект пуст, get_nowait бросает queue.Empty."""
+        slots = LatestFrameSlots()
+
+        assert slots.empty()
+        assert slots.qsize() == 0
+        with pytest.raises(queue.Empty):
+            slots.get_nowait()
+
+    def test_put_overwrites_same_source(self):
+        """Повторный put от той же камеры заменяет непрочитанный кадр."""
+        slots = LatestFrameSlots()
+        slots.put((0, "old"))
+        slots.put((0, "new"))
+
+        assert slots.qsize() == 1
+        assert slots.get_nowait() == (0, "new")
+        assert slots.empty()
+
+    def test_sources_do_not_interfere(self):
+        """У каждой камеры свой слот."""
+        slots = LatestFrameSlots()
+        slots.put_nowait((0, "a"))
+        slots.put_nowait((1, "b"))
+
+        assert slots.qsize() == 2
+        assert {slots.get_nowait(), slots.get_nowait()} == {(0, "a"), (1, "b")}
+
+    def test_drain_returns_frames_with_timestamps(self):
+        """drain() забирает все слоты разом вместе со временем захвата."""
+        slots = LatestFrameSlots()
+        slots.put((0, "a"))
+        slots.put((1, "b"))
+
+        drained = slots.drain()
+
+        assert set(drained) == {0, 1}
+        frame, captured_at = drained[0]
+        assert frame == "a"
+        assert captured_at > 0
+        assert slots.empty()
+
+    def test_put_never_blocks(self):
+        """put() с block=True не ждёт, сколько бы кадров ни пришло."""
+        slots = LatestFrameSlots()
+        done = threading.Event()
+
+        def producer():
+            for i in range(1000):
+                slots.put((0, i), block=True)
+            done.set()
+
+        threading.Thread(target=producer, daemon=True).start()
+
+        assert done.wait(timeout=2.0)
+        assert slots.get_nowait() == (0, 999)
+
+    def test_get_waits_for_frame(self):
+        """get(timeout) просыпается, как только производитель кладёт кадр."""
+        slots = LatestFrameSlots()
+        timer = threading.Timer(0.05, slots.put, args=((1, "late"),))
+        timer.start()
+
+        assert slots.get(timeout=2.0) == (1, "late")
+        timer.join()
+
+    def test_wakes_after_drain(self):
+        """После drain() ожидание снова просыпается от следующего кадра."""
+        slots = LatestFrameSlots()
+        slots.put((0, "a"))
+        slots.put((1, "b"))  # слоты уже не пусты — будить некого
+        slots.drain()
+        timer = threading.Timer(0.05, slots.put, args=((0, "c"),))
+        timer.start()
+
+        assert slots.wait(timeout=2.0) is True
+        timer.join()
+
+    def test_get_timeout_raises_empty(self):
+        """Без кадров get(timeout) бросает queue.Empty по истечении времени."""
+        slots = LatestFrameSlots()
+
+        with pytest.raises(queue.Empty):
+            slots.get(timeout=0.01)
+
+    def test_wait_does_not_consume(self):
+        """wait() только ждёт: кадр остаётся в слоте."""
+        slots = LatestFrameSlots()
+        assert slots.wait(timeout=0.01) is False
+
+        slots.put((0, "a"))
+
+        assert slots.wait(timeout=0.01) is True
+        assert slots.qsize() == 1
+
+
+class TestPutLatest:
+    """Тесты put_latest: запись без блокировки с вытеснением старого кадра."""
+
+    def test_evicts_oldest_when_full(self):
+        """В полной очереди старейший кадр заменяется новым."""
+        q = queue.Queue(maxsize=2)
+        for i in range(4):
+            put_latest(q, (0, i))
+
+        assert [q.get_nowait(), q.get_nowait()] == [(0, 2), (0, 3)]
+
+    def test_plain_put_when_room(self):
+        q = queue.Queue(maxsize=2)
+        put_latest(q, (0, "a"))
+
+        assert q.get_nowait() == (0, "a")
+
+    def test_works_with_latest_frame_slots(self):
+        slots = LatestFrameSlots()
+        put_latest(slots, (0, "a"))
+        put_latest(slots, (0, "b"))
+
+        assert slots.get_nowait() == (0, "b")
+
+
+class TestFrameSignature:
+    """Тесты frame_signature: отпечаток кадра по разреженной выборке."""
+
+    def test_equal_frames_equal_signature(self):
+        a = np.full((480, 640, 3), 7, np.uint8)
+        assert frame_signature(a) == frame_signature(a.copy())
+
+    def test_sampled_change_changes_signature(self):
+        """Изменение пикселя в узле выборки меняет отпечаток."""
+        a = np.zeros((480, 640, 3), np.uint8)
+        b = a.copy()
+        b[160, 320] = 255
+        assert frame_signature(a) != frame_signature(b)
+
+    def test_raw_byte_buffer(self):
+        """Сжатый кадр (1 x N байт) тоже получает отпечаток."""
+        raw = np.arange(1000, dtype=np.uint8).reshape(1, -1)
+        assert frame_signature(raw) == frame_signature(raw.copy())
@@ -0,0 +1,75 @@
+"""Unit-тесты для omniview.hotplug.
+
+Проверяет inotify-наблюдение за узлами /dev/videoN: создание и удаление
+видеоузла сразу вызывает callback, прочие файлы игнорируются.  Вместо
+/dev используется временный каталог.
+"""
+
+import struct
+import sys
+import threading
+
+import pytest
+
+from src.omniview.hotplug import DeviceNodeWatcher
+from src.omniview.hotplug import parse_events
+
+linux_only = pytest.mark.skipif(
+    sys.platform != "linux", reason="inotify есть только в Linux"
+)
+
+
+def _event(mask, name=b""):
+    padded = name + b"\0" * (16 - len(name)) if name else b""
+    return struct.pack("iIII", 1, mask, 0, len(padded)) + padded
+
+
+class TestParseEvents:
+    """Тесты разбора буфера событий inotify."""
+
+    def test_parses_several_events(self):
+        buffer = _event(0x100, b"video0") + _event(0x200, b"media1")
+
+        assert list(parse_events(buffer)) == [(0x100, b"video0"), (0x200, b"media1")]
+
+    def test_event_without_name(self):
+        assert list(parse_events(_event(0x4))) == [(0x4, b"")]
+
+
+@linux_only
+class TestDeviceNodeWatcher:
+    """Тесты DeviceNodeWatcher на временном каталоге."""
+
+    def _watch(self, tmp_path):
+        changed = threading.Event()
+        watcher = DeviceNodeWatcher(changed.set, directory=str(tmp_path))
+        assert watcher.start()
+        return watcher, changed
+
+    def test_node_created_and_removed(self, tmp_path):
+        """Появление и исчезновение videoN вызывает callback."""
+        watcher, changed = self._watch(tmp_path)
+        try:
+            node = tmp_path / "video3"
+            node.touch()
+            assert changed.wait(timeout=2.0)
+
+            changed.clear()
+            node.unlink()
+            assert changed.wait(timeout=2.0)
+        finally:
+            watcher.stop()
+
+    def test_other_nodes_ignored(self, tmp_path):
+        """Файлы без префикса video не будят монитор."""
+        watcher, changed = self._watch(tmp_path)
+        try:
+            (tmp_path / "ttyUSB0").touch()
+            assert not changed.wait(timeout=0.3)
+        finally:
+            watcher.stop()
+
+    def test_missing_directory(self, tmp_path):
+        """Несуществующий каталог — start() возвращает False."""
+        watcher = DeviceNodeWatcher(lambda: None, directory=str(tmp_path / "nope"))
+        assert watcher.start() is False
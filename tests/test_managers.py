@@ -29,10 +29,14 @@ import cv2
 import numpy as np
 import pytest
 
+from src.omniview.frames import LatestFrameSlots
 from src.omniview.managers import BaseCameraManager
+from src.omniview.managers import CameraTable
 from src.omniview.managers import IPCameraManager
 from src.omniview.managers import USBCameraManager
 from src.omniview.multiplex import MultiplexScheduler
+from src.omniview.shared import SharedFrameReader
+from src.omniview.threads import BaseCameraThread
 from src.omniview.threads import IPCameraThread
 from src.omniview.threads import USBCameraThread
 
@@ -130,14 +134,332 @@ class TestUSBCameraManagerInit:
         """Внутренние структуры данных создаются при инициализации."""
         assert isinstance(usb_manager.cameras, dict)
         assert len(usb_manager.cameras) == 0
-        assert isinstance(usb_manager.active_windows, set)
+        assert isinstance(usb_manager.active_windows, dict)
         assert isinstance(usb_manager.lock, type(threading.Lock()))
         assert isinstance(usb_manager.stop_event, threading.Event)
-        assert isinstance(usb_manager.frame_queue, queue.Queue)
+        assert isinstance(usb_manager.frame_queue, LatestFrameSlots)
+
+    def test_frame_queue_keeps_only_latest(self, usb_manager, fake_frame):
+        """В слоте камеры остаётся только последний кадр — без очереди устаревших."""
+        stale = np.full((480, 640, 3), 1, dtype=np.uint8)
+        usb_manager.frame_queue.put((0, stale))
+        usb_manager.frame_queue.put((0, fake_frame))
+
+        assert usb_manager.frame_queue.qsize() == 1
+        dev_id, frame = usb_manager.frame_queue.get_nowait()
+        assert dev_id == 0
+        assert frame is fake_frame
+
+
+class TestFrameFormat:
+    """Тесты frame_format="raw": кадры без конвертации цвета."""
+
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ValueError, match="frame_format"):
+            USBCameraManager(frame_format="rgb")
+
+    def test_raw_frames_pass_through(self):
+        """Сырые MJPEG-байты (1 x N) не отбрасываются проверкой формы."""
+        mgr = USBCameraManager(frame_format="raw")
+        raw = np.zeros((1, 1024), dtype=np.uint8)
+        mgr.frame_queue.put((0, raw))
+
+        assert mgr.process_frames()[0] is raw
+
+    def test_thread_disables_rgb_conversion(self, mock_video_capture):
+        """Поток с frame_format="raw" отключает CAP_PROP_CONVERT_RGB."""
+        mgr = USBCameraManager(frame_format="raw")
+        thread = mgr._create_camera_thread(0, threading.Event())
+
+        thread._configure_camera(mock_video_capture)
+
+        mock_video_capture.set.assert_any_call(cv2.CAP_PROP_CONVERT_RGB, 0)
+
+
+class TestGpuFrames:
+    """Тесты gpu_frames: кадры cv2.cuda.GpuMat без копирования в память CPU."""
+
+    def test_rejects_gui(self):
+        with pytest.raises(ValueError, match="gpu_frames"):
+            IPCameraManager(rtsp_urls=["rtsp://x"], show_gui=True, gpu_frames=True)
+
+    def test_rejects_reuse_buffers(self):
+        """FramePool рассчитан на ndarray — с GpuMat буферы не переиспользуются."""
+        with pytest.raises(ValueError, match="reuse_buffers"):
+            IPCameraManager(
+                rtsp_urls=["rtsp://x"], reuse_buffers=True, gpu_frames=True
+            )
+
+    def test_enables_cuda_decode(self):
+        """gpu_frames включает декодирование через cudacodec в потоках."""
+        mgr = IPCameraManager(rtsp_urls=["rtsp://x"], gpu_frames=True)
+        thread = mgr._create_camera_thread(0, threading.Event())
+
+        assert thread.cuda_decode and thread.gpu_frames
+
+    def test_gpu_frame_accepted(self):
+        """Трёхканальный GpuMat проходит проверку кадра."""
+        mgr = IPCameraManager(rtsp_urls=["rtsp://x"], gpu_frames=True)
+        frame = MagicMock(spec=cv2.cuda.GpuMat)
+        frame.channels.return_value = 3
+
+        assert mgr._is_valid_frame(frame)
+
+
+class TestOutputSize:
+    """Тесты output_width/output_height: уменьшение кадров в потоках захвата."""
+
+    def test_size_must_be_set_together(self):
+        with pytest.raises(ValueError, match="output_width"):
+            USBCameraManager(output_width=320)
+
+    def test_threads_and_grid_use_output_size(self):
+        """Потоки получают размер вывода, плитки мозаики — такого же размера."""
+        mgr = IPCameraManager(
+            rtsp_urls=["rtsp://x"], output_width=320, output_height=240
+        )
+        thread = mgr._create_camera_thread(0, threading.Event())
+
+        assert thread.output_size == (320, 240)
+        assert mgr._mosaic.tile_size == (320, 240)
+
+
+class TestSharedFrames:
+    """Тесты shared_frames: кадры в другой процесс через разделяемую память."""
+
+    def test_frames_published_to_queue(self):
+        """Каждый кадр из очереди камер публикуется в shared_frames."""
+        messages = queue.Queue()
+        mgr = USBCameraManager(shared_frames=messages)
+        frame = np.full((4, 4, 3), 9, dtype=np.uint8)
+        mgr.frame_queue.put((0, frame))
+
+        mgr.process_frames()
+        reader = SharedFrameReader()
+        try:
+            camera_id, received, _ = reader.read(messages.get_nowait())
+            assert camera_id == 0
+            np.testing.assert_array_equal(received, frame)
+        finally:
+            reader.close()
+            mgr._frame_publisher.close()
+
+    def test_disabled_by_default(self):
+        mgr = USBCameraManager()
+        assert mgr._frame_publisher is None
+
+
+class TestSkipStaticFrames:
+    """Тесты skip_static_frames: повторяющиеся кадры не обрабатываются."""
+
+    def _manager(self, callback):
+        mgr = USBCameraManager(
+            frame_callback=callback, callback_workers=0, skip_static_frames=True
+        )
+        mgr.cameras[0] = {
+            "thread": _make_mock_thread(),
+            "stop_event": threading.Event(),
+            "last_frame": None,
+            "last_update": 0,
+            "source": "USB Camera 0",
+        }
+        return mgr
+
+    def test_repeated_frame_skips_callback(self):
+        """Кадр, совпадающий с предыдущим, не передаётся в callback."""
+        callback = MagicMock()
+        mgr = self._manager(callback)
+        first = np.full((480, 640, 3), 3, np.uint8)
+
+        mgr.frame_queue.put((0, first))
+        mgr.process_frames()
+        mgr.frame_queue.put((0, first.copy()))
+        frames = mgr.process_frames()
+
+        callback.assert_called_once()
+        # Для отображения остаётся предыдущий кадр, камера считается живой
+        assert frames[0] is first
+        assert mgr.cameras[0]["last_update"] > 0
+
+    def test_changed_frame_is_delivered(self):
+        callback = MagicMock()
+        mgr = self._manager(callback)
+
+        mgr.frame_queue.put((0, np.zeros((480, 640, 3), np.uint8)))
+        mgr.process_frames()
+        mgr.frame_queue.put((0, np.full((480, 640, 3), 200, np.uint8)))
+        mgr.process_frames()
+
+        assert callback.call_count == 2
+
+    def test_disabled_by_default(self):
+        callback = MagicMock()
+        mgr = USBCameraManager(frame_callback=callback, callback_workers=0)
+        frame = np.zeros((480, 640, 3), np.uint8)
+        for _ in range(2):
+            mgr.frame_queue.put((0, frame))
+            mgr.process_frames()
+
+        assert callback.call_count == 2
 
-    def test_frame_queue_maxsize(self, usb_manager):
-        """Размер очереди зависит от max_cameras."""
-        assert usb_manager.frame_queue.maxsize == usb_manager.max_cameras * 2
+
+class TestWindowTitles:
+    """Тесты кеша заголовков окон (dev_id -> title)."""
+
+    def test_title_built_once_per_window(self, fake_frame):
+        """Заголовок формируется при открытии окна, а не на каждый кадр."""
+        mgr = USBCameraManager(show_gui=True)
+
+        with patch("cv2.imshow"), patch.object(
+            mgr, "_get_window_title", wraps=mgr._get_window_title
+        ) as build:
+            for _ in range(3):
+                mgr._update_gui_windows({0: fake_frame})
+
+        assert build.call_count == 1
+        assert mgr.active_windows == {0: mgr._get_window_title(0)}
+
+    def test_inactive_window_destroyed(self, fake_frame):
+        """Окно камеры без кадров закрывается и удаляется из кеша."""
+        mgr = USBCameraManager(show_gui=True)
+        with patch("cv2.imshow"):
+            mgr._update_gui_windows({0: fake_frame, 1: fake_frame})
+
+        with patch("cv2.imshow"), patch("cv2.destroyWindow") as destroy:
+            mgr._update_gui_windows({0: fake_frame})
+
+        destroy.assert_called_once_with(mgr._get_window_title(1))
+        assert set(mgr.active_windows) == {0}
+
+    def test_shown_frame_not_sent_again(self, fake_frame):
+        """Уже показанный (кэшированный) кадр повторно в imshow не уходит."""
+        mgr = USBCameraManager(show_gui=True)
+
+        with patch("cv2.imshow") as imshow:
+            mgr._update_gui_windows({0: fake_frame})
+            mgr._update_gui_windows({0: fake_frame})
+            mgr._update_gui_windows({0: fake_frame.copy()})
+
+        assert imshow.call_count == 2
+
+    def test_caption_formatted_once_per_camera(self, fake_frame):
+        """Подпись «Camera N» формируется один раз и переиспользуется."""
+        mgr = USBCameraManager(show_gui=True, show_camera_id=True)
+
+        with patch("cv2.imshow"), patch("cv2.putText") as put_text:
+            mgr._update_gui_windows({0: fake_frame})
+            mgr._update_gui_windows({0: fake_frame.copy()})
+
+        labels = [c.args[1] for c in put_text.call_args_list]
+        assert labels == ["Camera 0", "Camera 0"]
+        assert labels[0] is labels[1]
+
+    def test_umat_display_captions_umat_copy(self, fake_frame):
+        """При umat_display=True подпись рисуется на cv2.UMat, а не на кадре."""
+        mgr = USBCameraManager(show_gui=True, show_camera_id=True, umat_display=True)
+        original = fake_frame.copy()
+
+        with patch("cv2.imshow") as imshow:
+            mgr._update_gui_windows({0: fake_frame})
+
+        assert isinstance(imshow.call_args.args[1], cv2.UMat)
+        assert np.array_equal(fake_frame, original)
+
+    def test_title_uses_camera_source(self):
+        """Заголовок берёт источник из таблицы камер, а без камеры — её ID."""
+        mgr = USBCameraManager(show_gui=True)
+        mgr.cameras[0] = {"source": "USB Camera 0"}
+
+        assert mgr._get_window_title(0).endswith(": USB Camera 0")
+        assert mgr._get_window_title(5).endswith(": 5")
+
+
+class TestOpenCVThreads:
+    """Тесты настройки пула потоков OpenCV при запуске."""
+
+    def _start(self, **kwargs):
+        mgr = IPCameraManager(rtsp_urls=[], **kwargs)
+        with patch.object(mgr, "_monitor_cameras"), patch.object(
+            mgr, "_main_loop"
+        ), patch("cv2.setNumThreads") as set_threads:
+            mgr.start()
+        return set_threads
+
+    def test_single_opencv_thread_opt_in(self):
+        """single_opencv_thread=True — OpenCV без собственного пула потоков."""
+        self._start(single_opencv_thread=True).assert_called_once_with(1)
+
+    def test_opencv_pool_untouched_by_default(self):
+        """По умолчанию глобальные настройки OpenCV не меняются."""
+        with patch("cv2.setUseOptimized") as set_optimized:
+            set_threads = self._start()
+        set_threads.assert_not_called()
+        set_optimized.assert_not_called()
+
+
+class TestMainLoopWait:
+    """Тесты ожидания кадров в главном цикле вместо холостого опроса."""
+
+    def test_headless_iteration_waits_for_frames(self):
+        """Без GUI итерация спит до прихода кадра (с таймаутом)."""
+        mgr = USBCameraManager()
+
+        with patch.object(mgr.frame_queue, "wait") as wait:
+            mgr._process_frame_iteration()
+        wait.assert_called_once_with(mgr.HEADLESS_FRAME_WAIT)
+
+    def test_frame_wakes_iteration(self, fake_frame):
+        """Поступивший кадр сразу будит главный цикл."""
+        mgr = USBCameraManager(frame_callback=MagicMock(), callback_workers=0)
+        threading.Timer(0.02, mgr.frame_queue.put, args=((0, fake_frame),)).start()
+
+        start = time.monotonic()
+        mgr._process_frame_iteration()
+
+        assert time.monotonic() - start < mgr.HEADLESS_FRAME_WAIT
+        mgr.frame_callback.assert_called_once()
+
+
+class TestPinThreads:
+    """Тесты pin_threads: потоки захвата на своих ядрах CPU."""
+
+    def test_threads_spread_over_cores(self):
+        """Камера N привязывается к ядру N по модулю числа ядер."""
+        mgr = USBCameraManager(pin_threads=True)
+
+        with patch("os.cpu_count", return_value=4):
+            thread = mgr._create_camera_thread(5, threading.Event())
+        assert thread.cpu_affinity == 1
+
+    def test_not_pinned_by_default(self):
+        mgr = USBCameraManager()
+        assert mgr._create_camera_thread(0, threading.Event()).cpu_affinity is None
+
+
+class TestCameraTable:
+    """Тесты CameraTable: снимок камер для чтения без блокировки."""
+
+    def test_snapshot_follows_mutations(self):
+        """Снимок пересобирается при добавлении и удалении камер."""
+        table = CameraTable()
+        assert table.snapshot() == ()
+
+        table[0] = {"source": "a"}
+        table[1] = {"source": "b"}
+        assert table.snapshot() == ((0, {"source": "a"}), (1, {"source": "b"}))
+
+        del table[0]
+        table.pop(1)
+        assert table.snapshot() == ()
+
+    def test_snapshot_is_reused_between_reads(self):
+        """Без изменений повторное чтение не создаёт новую копию."""
+        table = CameraTable()
+        table[0] = {}
+        assert table.snapshot() is table.snapshot()
+
+    def test_manager_uses_camera_table(self, usb_manager):
+        assert isinstance(usb_manager.cameras, CameraTable)
 
 
 class TestIPCameraManagerInit:
@@ -262,6 +584,32 @@ class TestProcessFrames:
         assert 0 in result
         assert result[0].shape == (480, 640, 3)
 
+    def test_latest_frame_without_blocking(self, usb_manager, fake_frame):
+        """latest_frame отдаёт последний обработанный кадр, не дожидаясь нового."""
+        usb_manager.cameras[0] = {
+            "thread": _make_mock_thread(),
+            "stop_event": threading.Event(),
+            "last_frame": None,
+            "last_update": 0,
+            "source": "USB Camera 0",
+        }
+        assert usb_manager.latest_frame(0) is None
+
+        usb_manager.frame_queue.put((0, fake_frame))
+        usb_manager.process_frames()
+
+        assert usb_manager.latest_frame(0) is fake_frame
+        assert usb_manager.latest_frame(0) is fake_frame
+        assert usb_manager.latest_frame(7) is None
+
+    def test_camera_stats_per_thread(self, usb_manager):
+        """camera_stats собирает stats() потоков всех камер."""
+        thread = _make_mock_thread()
+        thread.stats.return_value = {"frames_grabbed": 3}
+        usb_manager.cameras[0] = {"thread": thread, "last_frame": None}
+
+        assert usb_manager.camera_stats() == {0: {"frames_grabbed": 3}}
+
     def test_filters_none_frames(self, usb_manager):
         """Кадры со значением None отбрасываются."""
         usb_manager.cameras[0] = {
@@ -292,6 +640,32 @@ class TestProcessFrames:
         result = usb_manager.process_frames()
         assert 0 not in result
 
+    def test_shape_checked_once_per_camera(self, usb_manager, fake_frame):
+        """Форма проверяется только у первого кадра камеры."""
+        with patch.object(
+            usb_manager, "_is_valid_frame", wraps=usb_manager._is_valid_frame
+        ) as check:
+            for _ in range(3):
+                usb_manager.frame_queue.put((0, fake_frame))
+                assert 0 in usb_manager.process_frames()
+        assert check.call_count == 1
+
+    def test_shape_rechecked_after_camera_removed(self, usb_manager, fake_frame):
+        """После удаления камеры её следующий кадр снова проверяется."""
+        usb_manager.cameras[0] = {
+            "thread": _make_mock_thread(),
+            "stop_event": threading.Event(),
+            "last_frame": None,
+            "last_update": 0,
+            "source": "USB Camera 0",
+        }
+        usb_manager.frame_queue.put((0, fake_frame))
+        usb_manager.process_frames()
+
+        usb_manager._remove_camera(0)
+
+        assert 0 not in usb_manager._validated_cameras
+
     def test_processes_multiple_cameras(self, usb_manager, fake_frame):
         """Кадры от нескольких камер обрабатываются корректно."""
         for i in range(3):
@@ -335,7 +709,9 @@ class TestUpdateCameraState:
     def test_calls_callback_with_correct_args(self, fake_frame):
         """Callback вызывается с (camera_id, frame)."""
         callback = MagicMock()
-        mgr = USBCameraManager(show_gui=False, frame_callback=callback)
+        mgr = USBCameraManager(
+            show_gui=False, frame_callback=callback, callback_workers=0
+        )
         mgr.cameras[5] = {
             "thread": _make_mock_thread(),
             "stop_event": threading.Event(),
@@ -472,6 +848,104 @@ class TestUpdateCameraConnections:
         assert 0 in usb_manager.cameras
 
 
+class TestMonitorWakeUp:
+    """Тесты пробуждения потока мониторинга (без time.sleep)."""
+
+    def test_notify_wakes_monitor_immediately(self, ip_manager):
+        """notify_device_change() запускает пересканирование без ожидания таймера."""
+        scans = []
+        scanned = threading.Event()
+
+        def fake_devices():
+            scans.append(time.time())
+            if len(scans) == 2:
+                scanned.set()
+            return []
+
+        with patch.object(ip_manager, "_get_available_devices", fake_devices):
+            monitor = threading.Thread(target=ip_manager._monitor_cameras)
+            monitor.start()
+            time.sleep(0.05)
+            ip_manager.notify_device_change()
+            assert scanned.wait(timeout=1.0)
+            ip_manager.stop_event.set()
+            ip_manager.notify_device_change()
+            monitor.join(timeout=1.0)
+
+        assert not monitor.is_alive()
+
+    def test_stop_interrupts_monitor_wait(self, ip_manager):
+        """stop() не ждёт окончания 3-секундного интервала мониторинга."""
+        with patch.object(ip_manager, "_get_available_devices", return_value=[]):
+            monitor = threading.Thread(target=ip_manager._monitor_cameras)
+            monitor.start()
+            time.sleep(0.05)
+
+            started = time.time()
+            ip_manager.stop()
+            monitor.join(timeout=1.0)
+
+        assert not monitor.is_alive()
+        assert time.time() - started < 1.0
+
+    def _run_ip_monitor(self, ip_manager, ticks):
+        """Прогнать монитор IP-камер ticks раз без реального ожидания."""
+        calls = []
+
+        def fake_wait(timeout):
+            calls.append(timeout)
+            if len(calls) >= ticks:
+                ip_manager.stop_event.set()
+            return False
+
+        with patch.object(ip_manager, "_wait_for_device_change", fake_wait):
+            ip_manager._monitor_cameras()
+        return calls
+
+    def test_ip_monitor_waits_for_notification(self, ip_manager):
+        """Список URL неизменен: монитор ждёт уведомления без таймера."""
+        with patch.object(
+            ip_manager, "_get_available_devices", return_value=[]
+        ) as devices:
+            waits = self._run_ip_monitor(ip_manager, ticks=1)
+
+        devices.assert_called_once()
+        assert waits == [None]
+
+    def test_ip_monitor_leaves_dead_thread_down(self, ip_manager):
+        """Поток, исчерпавший попытки переподключения, не перезапускается."""
+        dead = _make_mock_thread(alive=False)
+        with patch.object(
+            ip_manager, "_create_camera_thread", return_value=_make_mock_thread()
+        ):
+            ip_manager.cameras[0] = {
+                "thread": dead,
+                "stop_event": threading.Event(),
+                "last_frame": None,
+                "last_update": 0,
+                "source": "rtsp://192.168.1.10/stream",
+            }
+            with patch.object(ip_manager, "_get_available_devices", return_value=[0]):
+                self._run_ip_monitor(ip_manager, ticks=2)
+
+        assert ip_manager.cameras[0]["thread"] is dead
+
+    def test_device_watcher_started_and_stopped(self):
+        """start() подключает inotify-наблюдатель к notify_device_change."""
+        mgr = USBCameraManager()
+
+        with patch("src.omniview.managers.DeviceNodeWatcher") as watcher_cls, patch(
+            "src.omniview.managers.BaseCameraManager.start"
+        ):
+            watcher_cls.return_value.start.return_value = True
+            mgr.start()
+            watcher_cls.assert_called_once_with(mgr.notify_device_change)
+
+            mgr.stop()
+        watcher_cls.return_value.stop.assert_called_once()
+        assert mgr._device_watcher is None
+
+
 # ──────────────────────────────────────────────
 #  Проверка условия выхода
 # ──────────────────────────────────────────────
@@ -487,22 +961,169 @@ class TestCheckExitCondition:
     def test_returns_false_on_non_exit_key(self):
         """Нажатие не-exit-клавиши не вызывает выход."""
         mgr = USBCameraManager(show_gui=True)
-        with patch("cv2.waitKey", return_value=ord("a")):
+        with patch("src.omniview.managers.poll_key", return_value=ord("a")):
             assert mgr._check_exit_condition() is False
 
     def test_returns_true_on_q_key(self):
         """Нажатие 'q' вызывает выход."""
         mgr = USBCameraManager(show_gui=True)
-        with patch("cv2.waitKey", return_value=ord("q")):
+        with patch("src.omniview.managers.poll_key", return_value=ord("q")):
             assert mgr._check_exit_condition() is True
 
     def test_returns_true_on_esc_key(self):
         """Нажатие Esc вызывает выход."""
         mgr = USBCameraManager(show_gui=True)
-        with patch("cv2.waitKey", return_value=27):
+        with patch("src.omniview.managers.poll_key", return_value=27):
             assert mgr._check_exit_condition() is True
 
 
+class TestGridView:
+    """Тесты grid_view: все камеры в одном окне."""
+
+    def test_single_imshow_for_all_cameras(self, fake_frame):
+        """В режиме мозаики imshow вызывается один раз за итерацию."""
+        mgr = USBCameraManager(show_gui=True, grid_view=True)
+        frames = {i: fake_frame.copy() for i in range(3)}
+
+        with patch("cv2.imshow") as imshow:
+            mgr._update_gui_windows(frames)
+
+        imshow.assert_called_once()
+        title, mosaic = imshow.call_args[0]
+        assert title == mgr.GRID_WINDOW_TITLE
+        assert mosaic.shape == (960, 1280, 3)
+        assert mgr.active_windows == {None: mgr.GRID_WINDOW_TITLE}
+
+    def test_unchanged_frames_not_rendered_again(self, fake_frame):
+        """Мозаика из тех же кадров повторно не собирается и не показывается."""
+        mgr = USBCameraManager(show_gui=True, grid_view=True)
+        frames = {i: fake_frame.copy() for i in range(2)}
+
+        with patch("cv2.imshow") as imshow:
+            mgr._update_gui_windows(frames)
+            mgr._update_gui_windows(dict(frames))
+            mgr._update_gui_windows({0: frames[0]})
+
+        assert imshow.call_count == 2
+
+    def test_no_frames_shows_nothing(self):
+        """Без кадров окно не обновляется."""
+        mgr = USBCameraManager(show_gui=True, grid_view=True)
+
+        with patch("cv2.imshow") as imshow:
+            mgr._update_gui_windows({})
+
+        imshow.assert_not_called()
+
+
+class TestUSBDeviceProbe:
+    """Тесты _get_available_devices для USB (fallback без sysfs)."""
+
+    @pytest.fixture(autouse=True)
+    def _no_sysfs(self):
+        with patch(
+            "src.omniview.managers.present_capture_devices", return_value=None
+        ):
+            yield
+
+    def test_live_cameras_are_not_reprobed(self):
+        """Камеры с живым потоком не открываются повторно при сканировании."""
+        mgr = USBCameraManager(show_gui=False, max_cameras=3)
+        mgr.cameras[1] = {
+            "thread": _make_mock_thread(alive=True),
+            "stop_event": threading.Event(),
+            "last_frame": None,
+            "last_update": 0,
+            "source": "USB Camera 1",
+        }
+
+        with patch.object(mgr, "_probe_camera", return_value=False) as probe:
+            devices = mgr._get_available_devices()
+
+        assert devices == [1]
+        probed = sorted(c.args[0] for c in probe.call_args_list)
+        assert probed == [0, 2]
+
+    def test_indices_probed_concurrently(self):
+        """Вне V4L2 индексы опрашиваются параллельно, а не по очереди."""
+        mgr = USBCameraManager(show_gui=False, max_cameras=4)
+        barrier = threading.Barrier(4, timeout=2.0)
+
+        def probe(index, backend):
+            barrier.wait()  # сработает, только если все 4 пробы идут одновременно
+            return index % 2 == 0
+
+        with patch.object(
+            BaseCameraThread, "PLATFORM_BACKENDS", (cv2.CAP_DSHOW,)
+        ), patch.object(mgr, "_probe_camera", side_effect=probe):
+            devices = mgr._get_available_devices()
+
+        assert devices == [0, 2]
+
+    def test_v4l2_indices_probed_serially(self):
+        """На V4L2 пробы идут по очереди (параллельные открытия на хабе дают ENOSPC)."""
+        mgr = USBCameraManager(show_gui=False, max_cameras=3)
+        active = []
+
+        def probe(index, backend):
+            assert not active, "пробы перекрываются"
+            active.append(index)
+            time.sleep(0.01)
+            active.remove(index)
+            return index != 1
+
+        with patch.object(
+            BaseCameraThread, "PLATFORM_BACKENDS", (cv2.CAP_V4L2,)
+        ), patch.object(mgr, "_probe_camera", side_effect=probe) as mock:
+            devices = mgr._get_available_devices()
+
+        assert devices == [0, 2]
+        assert [c.args[0] for c in mock.call_args_list] == [0, 1, 2]
+        assert mgr._probe_pool is None
+
+    def test_probe_pool_reused_and_shut_down(self):
+        """Пул проб создаётся один раз, переиспользуется и закрывается в stop()."""
+        mgr = USBCameraManager(show_gui=False, max_cameras=2)
+
+        with patch.object(
+            BaseCameraThread, "PLATFORM_BACKENDS", (cv2.CAP_DSHOW,)
+        ), patch.object(mgr, "_probe_camera", return_value=False):
+            mgr._get_available_devices()
+            pool = mgr._probe_pool
+            mgr._get_available_devices()
+
+        assert pool is not None and mgr._probe_pool is pool
+        mgr.stop()
+        assert mgr._probe_pool is None
+
+    def test_no_probe_pool_after_stop(self):
+        """Скан после stop() не пересоздаёт пул проб (потоки не утекают)."""
+        mgr = USBCameraManager(show_gui=False, max_cameras=2)
+        mgr.stop()
+
+        with patch.object(
+            BaseCameraThread, "PLATFORM_BACKENDS", (cv2.CAP_DSHOW,)
+        ), patch.object(mgr, "_probe_camera", return_value=True) as probe:
+            devices = mgr._get_available_devices()
+
+        assert devices == []
+        assert mgr._probe_pool is None
+        probe.assert_not_called()
+
+    def test_sysfs_listing_skips_probing(self):
+        """При наличии sysfs камеры не открываются, индексы берутся из него."""
+        mgr = USBCameraManager(show_gui=False, max_cameras=4)
+
+        with patch(
+            "src.omniview.managers.present_capture_devices",
+            return_value={0, 3, 11},
+        ), patch.object(mgr, "_probe_camera") as probe:
+            devices = mgr._get_available_devices()
+
+        assert devices == [0, 3]
+        probe.assert_not_called()
+
+
 # ──────────────────────────────────────────────
 #  IPCameraManager: обнаружение устройств
 # ──────────────────────────────────────────────
@@ -674,7 +1295,7 @@ class TestCallbackIntegration:
         def cb(cam_id, frame):
             received.append((cam_id, frame.shape))
 
-        mgr = USBCameraManager(show_gui=False, frame_callback=cb)
+        mgr = USBCameraManager(show_gui=False, frame_callback=cb, callback_workers=0)
 
         for i in range(3):
             mgr.cameras[i] = {
@@ -699,7 +1320,7 @@ class TestCallbackIntegration:
         def cb(cam_id, frame):
             received_frames[cam_id] = frame.copy()
 
-        mgr = USBCameraManager(show_gui=False, frame_callback=cb)
+        mgr = USBCameraManager(show_gui=False, frame_callback=cb, callback_workers=0)
 
         # Кадр с уникальным содержимым
         unique_frame = np.full((480, 640, 3), 42, dtype=np.uint8)
@@ -716,13 +1337,42 @@ class TestCallbackIntegration:
         assert 0 in received_frames
         assert np.all(received_frames[0] == 42)
 
-    def test_callback_exception_does_not_crash_manager(self, fake_frame):
+    def test_umat_frames_hands_callback_umat(self):
+        """При umat_frames=True callback получает cv2.UMat, а кэш — ndarray."""
+        received = {}
+
+        def cb(cam_id, frame):
+            received[cam_id] = frame
+
+        mgr = USBCameraManager(
+            show_gui=False, frame_callback=cb, callback_workers=0, umat_frames=True
+        )
+        frame = np.full((480, 640, 3), 7, dtype=np.uint8)
+        mgr.cameras[0] = {
+            "thread": _make_mock_thread(),
+            "stop_event": threading.Event(),
+            "last_frame": None,
+            "last_update": 0,
+            "source": "USB Camera 0",
+        }
+        mgr.frame_queue.put((0, frame))
+        mgr.process_frames()
+
+        assert isinstance(received[0], cv2.UMat)
+        assert np.all(received[0].get() == 7)
+        assert mgr.cameras[0]["last_frame"] is frame
+
+    def test_callback_exception_does_not_crash_manager(self, fake_frame, caplog):
         """Исключение в callback не должно ронять менеджер."""
+        called = threading.Event()
 
         def bad_cb(cam_id, frame):
+            called.set()
             raise ValueError("callback error")
 
-        mgr = USBCameraManager(show_gui=False, frame_callback=bad_cb)
+        mgr = USBCameraManager(
+            show_gui=False, frame_callback=bad_cb, callback_workers=2
+        )
         mgr.cameras[0] = {
             "thread": _make_mock_thread(),
             "stop_event": threading.Event(),
@@ -732,13 +1382,46 @@ class TestCallbackIntegration:
         }
         mgr.frame_queue.put((0, fake_frame))
 
-        # process_frames вызывает _update_camera_state → callback
-        # Callback бросает исключение, но это не должно прерывать работу.
-        # Однако в текущей реализации исключение НЕ перехватывается в _update_camera_state,
-        # поэтому оно пробросится. Проверяем, что исключение выбрасывается.
+        # Callback выполняется в пуле потоков: исключение логируется,
+        # а process_frames завершается нормально.
+        result = mgr.process_frames()
+        assert 0 in result
+        assert called.wait(timeout=1.0)
+        mgr._callback_dispatcher.shutdown(wait=True)
+        assert "callback error" in caplog.text
+
+    def test_inline_callback_exception_propagates(self, fake_frame):
+        """По умолчанию (callback_workers=0) callback вызывается синхронно."""
+
+        def bad_cb(cam_id, frame):
+            raise ValueError("callback error")
+
+        mgr = USBCameraManager(show_gui=False, frame_callback=bad_cb)
+        assert mgr._callback_dispatcher is None
+        mgr.frame_queue.put((0, fake_frame))
+
         with pytest.raises(ValueError, match="callback error"):
             mgr.process_frames()
 
+    def test_slow_callback_does_not_block_main_loop(self, fake_frame):
+        """Медленный callback не задерживает process_frames."""
+        release = threading.Event()
+
+        def slow_cb(cam_id, frame):
+            release.wait(timeout=2.0)
+
+        mgr = USBCameraManager(
+            show_gui=False, frame_callback=slow_cb, callback_workers=2
+        )
+        mgr.frame_queue.put((0, fake_frame))
+
+        started = time.time()
+        mgr.process_frames()
+        assert time.time() - started < 0.5
+
+        release.set()
+        mgr._callback_dispatcher.shutdown(wait=True)
+
 
 # ──────────────────────────────────────────────
 #  Последовательный режим: _sequential_main_loop
@@ -893,30 +1576,52 @@ class TestRemoveCameraThreadSafety:
             "source": source,
         }
 
-    def test_destroys_window_on_main_thread(self):
-        """На главном потоке окно удаляется (поведение сохранено)."""
+    def test_window_closed_by_main_loop(self):
+        """Окно удалённой камеры закрывается пакетно в главном цикле."""
         mgr = USBCameraManager(show_gui=True)
         mgr.cameras[0] = self._camera_entry()
         title = mgr._get_window_title(0)
-        mgr.active_windows.add(title)
+        mgr.active_windows[0] = title
 
-        with patch("cv2.destroyWindow") as destroy, patch("cv2.waitKey"):
+        with patch("cv2.destroyWindow") as destroy, patch("cv2.pollKey"):
             mgr._remove_camera(0)
+            destroy.assert_not_called()
+            assert 0 not in mgr.cameras
+
+            with patch.object(mgr, "process_frames", return_value={}):
+                mgr._process_frame_iteration()
 
         destroy.assert_called_once_with(title)
-        assert title not in mgr.active_windows
-        assert 0 not in mgr.cameras
+        assert 0 not in mgr.active_windows
+
+    def test_single_key_poll_for_many_removals(self):
+        """Сколько бы камер ни пропало, клавиши опрашиваются раз за итерацию."""
+        mgr = USBCameraManager(show_gui=True)
+        for i in range(3):
+            mgr.cameras[i] = self._camera_entry(f"USB Camera {i}")
+            mgr.active_windows[i] = mgr._get_window_title(i)
+
+        with patch("cv2.destroyWindow") as destroy, patch(
+            "cv2.pollKey", return_value=-1
+        ) as wait_key:
+            for i in range(3):
+                mgr._remove_camera(i)
+            with patch.object(mgr, "process_frames", return_value={}):
+                mgr._process_frame_iteration()
+
+        assert destroy.call_count == 3
+        assert wait_key.call_count == 1
 
     def test_skips_gui_off_main_thread(self):
         """В фоновом потоке HighGUI не вызывается, но камера всё равно удаляется."""
         mgr = USBCameraManager(show_gui=True)
         mgr.cameras[0] = self._camera_entry()
-        mgr.active_windows.add(mgr._get_window_title(0))
+        mgr.active_windows[0] = mgr._get_window_title(0)
 
         destroy_calls = {}
 
         def worker():
-            with patch("cv2.destroyWindow") as destroy, patch("cv2.waitKey"):
+            with patch("cv2.destroyWindow") as destroy, patch("cv2.pollKey"):
                 mgr._remove_camera(0)
                 destroy_calls["count"] = destroy.call_count
 
@@ -0,0 +1,71 @@
+"""Unit-тесты для omniview.pool.FramePool.
+
+Проверяет пул буферов кадров со счётчиком ссылок: буфер выдаётся повторно
+только когда на кадр в нём больше никто не ссылается.
+"""
+
+import numpy as np
+
+from src.omniview.pool import FramePool
+
+
+def _frame():
+    return np.zeros((4, 4, 3), dtype=np.uint8)
+
+
+class TestFramePool:
+    """Тесты FramePool."""
+
+    def test_empty_pool_has_no_buffer(self):
+        assert FramePool().acquire() is None
+
+    def test_free_buffer_is_reused(self):
+        """Буфер без внешних ссылок выдаётся снова."""
+        pool = FramePool()
+        pool.release(None, _frame())
+
+        assert pool.acquire() is not None
+
+    def test_referenced_buffer_is_busy(self):
+        """Пока кадр где-то хранится, буфер не выдаётся."""
+        pool = FramePool()
+        frame = _frame()
+        pool.release(None, frame)
+
+        assert pool.acquire() is None
+        del frame
+        assert pool.acquire() is not None
+
+    def test_view_keeps_buffer_busy(self):
+        """Срез кадра (view) тоже удерживает буфер."""
+        pool = FramePool()
+        frame = _frame()
+        pool.release(None, frame)
+        view = frame[1:3]
+        del frame
+
+        assert pool.acquire() is None
+        del view
+        assert pool.acquire() is not None
+
+    def test_size_limit(self):
+        """Новые кадры сверх размера пула в него не попадают."""
+        pool = FramePool(size=2)
+        held = [_frame() for _ in range(3)]
+        for frame in held:
+            pool.release(None, frame)
+
+        assert len(pool) == 2
+
+    def test_reallocated_frame_replaces_buffer(self):
+        """Если OpenCV выделил новый массив, он заменяет буфер в пуле."""
+        pool = FramePool()
+        pool.release(None, _frame())
+        buf = pool.acquire()
+        bigger = np.zeros((8, 8, 3), dtype=np.uint8)
+
+        pool.release(buf, bigger)
+        del buf, bigger
+
+        assert len(pool) == 1
+        assert pool.acquire().shape == (8, 8, 3)
@@ -0,0 +1,123 @@
+"""Unit-тесты для omniview.shared.
+
+Проверяет передачу кадров через разделяемую память: публикатор копирует
+кадр в слот SharedMemory и отправляет в очередь лишь короткий дескриптор,
+читатель восстанавливает кадр по нему без копирования и pickle.
+"""
+
+import os
+import queue
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from src.omniview.shared import SharedFramePublisher
+from src.omniview.shared import SharedFrameReader
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Отдельный процесс-потребитель со своим resource_tracker
+_READER_SCRIPT = """
+import sys
+from src.omniview.shared import SharedFrameReader
+reader = SharedFrameReader()
+_, frame, _ = reader.read(eval(sys.argv[1]))
+print(int(frame[0, 0, 0]))
+del frame
+reader.close()
+"""
+
+
+@pytest.fixture
+def channel():
+    messages = queue.Queue()
+    publisher = SharedFramePublisher(messages)
+    reader = SharedFrameReader()
+    yield messages, publisher, reader
+    reader.close()
+    publisher.close()
+
+
+class TestSharedFrames:
+    """Тесты SharedFramePublisher / SharedFrameReader."""
+
+    def test_roundtrip(self, channel):
+        """Читатель получает тот же кадр, камеру и время захвата."""
+        messages, publisher, reader = channel
+        frame = np.random.randint(0, 255, (48, 64, 3), dtype=np.uint8)
+
+        publisher.publish(3, frame, timestamp=12.5)
+        camera_id, received, timestamp = reader.read(messages.get_nowait())
+
+        assert camera_id == 3
+        assert timestamp == 12.5
+        np.testing.assert_array_equal(received, frame)
+
+    def test_message_is_small(self, channel):
+        """В очередь уходит дескриптор, а не массив."""
+        messages, publisher, _ = channel
+        publisher.publish(0, np.zeros((480, 640, 3), dtype=np.uint8))
+
+        message = messages.get_nowait()
+        assert not any(isinstance(part, np.ndarray) for part in message)
+
+    def test_slots_alternate(self, channel):
+        """Соседние кадры пишутся в разные слоты, предыдущий не затирается."""
+        messages, publisher, reader = channel
+        publisher.publish(0, np.full((4, 4, 3), 1, dtype=np.uint8))
+        publisher.publish(0, np.full((4, 4, 3), 2, dtype=np.uint8))
+
+        _, first, _ = reader.read(messages.get_nowait())
+        _, second, _ = reader.read(messages.get_nowait())
+
+        assert first[0, 0, 0] == 1
+        assert second[0, 0, 0] == 2
+
+    def test_region_grows_for_larger_frame(self, channel):
+        """Кадр крупнее слота (смена разрешения) переносится в новую область."""
+        messages, publisher, reader = channel
+        publisher.publish(0, np.zeros((4, 4, 3), dtype=np.uint8))
+        small = messages.get_nowait()
+        big_frame = np.full((8, 8, 3), 7, dtype=np.uint8)
+        publisher.publish(0, big_frame)
+        big = messages.get_nowait()
+
+        assert big[1] != small[1]
+        np.testing.assert_array_equal(reader.read(big)[1], big_frame)
+
+    def test_full_queue_drops_message(self):
+        """Переполненная очередь не блокирует публикатора."""
+        messages = queue.Queue(maxsize=1)
+        publisher = SharedFramePublisher(messages)
+        try:
+            publisher.publish(0, np.zeros((2, 2, 3), dtype=np.uint8))
+            publisher.publish(0, np.zeros((2, 2, 3), dtype=np.uint8))
+        finally:
+            publisher.close()
+
+        assert messages.qsize() == 1
+
+    def test_region_survives_reader_process_exit(self, channel):
+        """Завершение процесса-читателя не удаляет память публикатора."""
+        messages, publisher, reader = channel
+        publisher.publish(0, np.full((4, 4, 3), 5, dtype=np.uint8))
+        message = messages.get_nowait()
+
+        result = subprocess.run(
+            [sys.executable, "-c", _READER_SCRIPT, repr(message)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.stdout.strip() == "5", result.stderr
+        time.sleep(0.5)  # resource_tracker читателя завершается асинхронно
+
+        frame = np.full((4, 4, 3), 6, dtype=np.uint8)
+        publisher.publish(0, frame)
+        publisher.publish(0, frame)
+        for _ in range(2):
+            np.testing.assert_array_equal(reader.read(messages.get_nowait())[1], frame)
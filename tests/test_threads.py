@@ -11,6 +11,7 @@ Unit-тесты для модуля omniview.threads
   - Освобождение ресурсов (_release_camera_resources)
 """
 
+import os
 import queue
 import threading
 import time
@@ -22,11 +23,17 @@ import cv2
 import numpy as np
 import pytest
 
+from src.omniview.threads import FFMPEG_LOW_LATENCY_OPTIONS
 from src.omniview.threads import BaseCameraThread
 from src.omniview.threads import IPCameraThread
 from src.omniview.threads import USBCameraThread
+from src.omniview.threads import ffmpeg_capture_options
+from src.omniview.threads import ffmpeg_low_latency_options
+from src.omniview.threads import build_gstreamer_pipeline
 from src.omniview.threads import build_hw_accel_params
+from src.omniview.threads import cuda_decode_available
 from src.omniview.threads import hw_acceleration_name
+from src.omniview.threads import pin_current_thread
 from src.omniview.threads import supports_hw_acceleration
 
 # ──────────────────────────────────────────────
@@ -153,6 +160,12 @@ class TestCameraConfiguration:
         self, stop_event, frame_queue, mock_video_capture
     ):
         """_configure_camera должен устанавливать 4 свойства VideoCapture."""
+        current = {
+            cv2.CAP_PROP_FRAME_WIDTH: 640.0,
+            cv2.CAP_PROP_FRAME_HEIGHT: 480.0,
+            cv2.CAP_PROP_FPS: 30.0,
+        }
+        mock_video_capture.get.side_effect = lambda prop: current.get(prop, 0.0)
         thread = USBCameraThread(
             camera_id=0,
             frame_queue=frame_queue,
@@ -173,6 +186,112 @@ class TestCameraConfiguration:
         ]
         mock_video_capture.set.assert_has_calls(expected_calls, any_order=False)
 
+    def test_configure_skips_properties_already_in_effect(
+        self, stop_event, frame_queue, mock_video_capture
+    ):
+        """Совпадающие с текущими размер и FPS повторно не выставляются."""
+        current = {
+            cv2.CAP_PROP_FRAME_WIDTH: 640.0,
+            cv2.CAP_PROP_FRAME_HEIGHT: 480.0,
+            cv2.CAP_PROP_FPS: 30.0,
+        }
+        mock_video_capture.get.side_effect = lambda prop: current.get(prop, -1.0)
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event, fps=60
+        )
+        thread._configure_camera(mock_video_capture)
+
+        props = [c.args[0] for c in mock_video_capture.set.call_args_list]
+        assert cv2.CAP_PROP_FRAME_WIDTH not in props
+        assert cv2.CAP_PROP_FRAME_HEIGHT not in props
+        assert props.count(cv2.CAP_PROP_FPS) == 1
+
+    def test_configure_skips_unsupported_properties(
+        self, stop_event, frame_queue, mock_video_capture
+    ):
+        """Свойства, которые бэкенд не поддерживает (get <= 0), не выставляются."""
+        mock_video_capture.get.return_value = -1.0
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+        thread._configure_camera(mock_video_capture)
+
+        props = [c.args[0] for c in mock_video_capture.set.call_args_list]
+        assert cv2.CAP_PROP_FRAME_WIDTH not in props
+        assert cv2.CAP_PROP_FPS not in props
+
+    def test_ip_stream_mode_not_set(
+        self, stop_event, frame_queue, mock_video_capture
+    ):
+        """У IP-потока размер и FPS задаёт камера — set не вызывается."""
+        mock_video_capture.get.return_value = 25.0
+        thread = IPCameraThread(
+            rtsp_url="rtsp://x",
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+        )
+        thread._configure_camera(mock_video_capture)
+
+        mock_video_capture.set.assert_not_called()
+
+    def test_configure_sets_size_as_pair(
+        self, stop_event, frame_queue, mock_video_capture
+    ):
+        """Если отличается только ширина, выставляются и ширина, и высота."""
+        current = {cv2.CAP_PROP_FRAME_WIDTH: 320.0, cv2.CAP_PROP_FRAME_HEIGHT: 480.0}
+        mock_video_capture.get.side_effect = lambda prop: current.get(prop, -1.0)
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+        thread._configure_camera(mock_video_capture)
+
+        mock_video_capture.set.assert_any_call(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        mock_video_capture.set.assert_any_call(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+
+    def test_usb_requests_mjpg_first(self, stop_event, frame_queue, mock_video_capture):
+        """USB-камера сначала переключается на MJPG, затем задаются размер и FPS."""
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+        thread._configure_camera(mock_video_capture)
+
+        first = mock_video_capture.set.call_args_list[0]
+        assert first == call(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+
+    def test_warns_when_size_not_granted(
+        self, stop_event, frame_queue, mock_video_capture, caplog
+    ):
+        """Если камера отдаёт другое разрешение, это видно в логе."""
+        current = {cv2.CAP_PROP_FRAME_WIDTH: 320.0, cv2.CAP_PROP_FRAME_HEIGHT: 240.0}
+        mock_video_capture.get.side_effect = lambda prop: current.get(prop, -1.0)
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event, fourcc=None
+        )
+        with caplog.at_level("WARNING"):
+            thread._configure_camera(mock_video_capture)
+
+        assert "320x240 instead of the requested 640x480" in caplog.text
+        props = [c.args[0] for c in mock_video_capture.set.call_args_list]
+        assert cv2.CAP_PROP_FOURCC not in props
+
+    def test_ip_stream_size_not_warned(
+        self, stop_event, frame_queue, mock_video_capture, caplog
+    ):
+        """Разрешение IP-потока задаёт камера: 1920x1080 не даёт предупреждения."""
+        current = {cv2.CAP_PROP_FRAME_WIDTH: 1920.0, cv2.CAP_PROP_FRAME_HEIGHT: 1080.0}
+        mock_video_capture.get.side_effect = lambda prop: current.get(prop, -1.0)
+        thread = IPCameraThread(
+            rtsp_url="rtsp://x",
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+        )
+        with caplog.at_level("WARNING"):
+            thread._configure_camera(mock_video_capture)
+
+        assert caplog.text == ""
+
     def test_usb_additional_config_disables_autofocus(
         self, stop_event, frame_queue, mock_video_capture
     ):
@@ -183,15 +302,137 @@ class TestCameraConfiguration:
         thread._additional_config(mock_video_capture)
         mock_video_capture.set.assert_called_once_with(cv2.CAP_PROP_AUTOFOCUS, 0)
 
-    def test_ip_thread_has_no_additional_config(self, stop_event, frame_queue):
-        """IP-камера не должна иметь метод _additional_config."""
+    def test_ip_thread_has_no_additional_config(
+        self, stop_event, frame_queue, mock_video_capture
+    ):
+        """У IP-камеры _additional_config ничего не настраивает."""
+        thread = IPCameraThread(
+            rtsp_url="rtsp://x",
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+        )
+        thread._additional_config(mock_video_capture)
+        mock_video_capture.set.assert_not_called()
+
+    def test_warns_when_buffersize_ignored(
+        self, stop_event, frame_queue, mock_video_capture, caplog
+    ):
+        """Если бэкенд отверг BUFFERSIZE=1 — пишется предупреждение."""
+        mock_video_capture.set.return_value = False
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+        with caplog.at_level("WARNING"):
+            thread._configure_camera(mock_video_capture)
+        assert "CAP_PROP_BUFFERSIZE" in caplog.text
+
+    def test_ip_does_not_warn_on_buffersize(
+        self, stop_event, frame_queue, mock_video_capture, caplog
+    ):
+        """FFmpeg никогда не поддерживает BUFFERSIZE — для IP без предупреждения."""
+        mock_video_capture.set.return_value = False
+        thread = IPCameraThread(
+            rtsp_url="rtsp://x",
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+        )
+        with caplog.at_level("WARNING"):
+            thread._configure_camera(mock_video_capture)
+        assert "CAP_PROP_BUFFERSIZE" not in caplog.text
+        assert call(cv2.CAP_PROP_BUFFERSIZE, 1) not in mock_video_capture.set.mock_calls
+
+
+class TestFFmpegLowLatencyOptions:
+    """Тесты OPENCV_FFMPEG_CAPTURE_OPTIONS для RTSP."""
+
+    def test_sets_options_before_open(self, stop_event, frame_queue, monkeypatch):
+        """Опции FFmpeg действуют при создании VideoCapture, а после — снимаются."""
+        monkeypatch.delenv("OPENCV_FFMPEG_CAPTURE_OPTIONS", raising=False)
+        environ_before = dict(os.environ)
+        seen = []
+
+        def fake_capture(*args):
+            seen.append(os.environ.get("OPENCV_FFMPEG_CAPTURE_OPTIONS"))
+            cap = MagicMock()
+            cap.isOpened.return_value = True
+            return cap
+
         thread = IPCameraThread(
             rtsp_url="rtsp://x",
             camera_id=0,
             frame_queue=frame_queue,
             stop_event=stop_event,
         )
-        assert not hasattr(thread, "_additional_config")
+        with patch("cv2.VideoCapture", side_effect=fake_capture):
+            thread._open_camera()
+
+        assert seen == [ffmpeg_low_latency_options("tcp")]
+        assert dict(os.environ) == environ_before
+
+    def test_rtsp_over_tcp(self):
+        """По умолчанию RTSP идёт через TCP, задержка демультиплексора ограничена."""
+        options = dict(
+            item.split(";") for item in ffmpeg_low_latency_options().split("|")
+        )
+        assert options["rtsp_transport"] == "tcp"
+        assert options["fflags"] == "nobuffer"
+        assert int(options["max_delay"]) <= 500000
+
+    def test_short_stream_probing(self):
+        """Анализ потока при открытии ограничен (по умолчанию FFmpeg ждёт до 5 с)."""
+        options = dict(
+            item.split(";") for item in FFMPEG_LOW_LATENCY_OPTIONS.split("|")
+        )
+        assert int(options["probesize"]) <= 32768
+        assert int(options["analyzeduration"]) <= 500000
+
+    def test_transport_is_configurable(self, stop_event, frame_queue, monkeypatch):
+        """rtsp_transport="udp" / None — для камер, отдающих RTP только по UDP."""
+        monkeypatch.setattr(os, "environ", {})
+        seen = []
+
+        def fake_capture(*args):
+            seen.append(os.environ.get("OPENCV_FFMPEG_CAPTURE_OPTIONS"))
+            return MagicMock(**{"isOpened.return_value": True})
+
+        for transport in ("udp", None):
+            thread = IPCameraThread(
+                rtsp_url="rtsp://x",
+                camera_id=0,
+                frame_queue=frame_queue,
+                stop_event=stop_event,
+                rtsp_transport=transport,
+            )
+            with patch("cv2.VideoCapture", side_effect=fake_capture):
+                thread._open_camera()
+
+        assert seen[0].startswith("rtsp_transport;udp|")
+        assert "rtsp_transport" not in seen[1]
+
+    def test_user_options_are_kept(self, monkeypatch):
+        """Заданные пользователем опции не перезаписываются."""
+        monkeypatch.setattr(
+            os, "environ", {"OPENCV_FFMPEG_CAPTURE_OPTIONS": "rtsp_transport;udp"}
+        )
+
+        with ffmpeg_capture_options(ffmpeg_low_latency_options()):
+            assert os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] == "rtsp_transport;udp"
+
+        assert os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] == "rtsp_transport;udp"
+
+    def test_overlapping_opens_share_options(self, monkeypatch):
+        """Одинаковые опции не ждут друг друга; переменная снимается в конце."""
+        monkeypatch.setattr(os, "environ", {})
+        options = ffmpeg_low_latency_options()
+
+        with ffmpeg_capture_options(options):
+            with ffmpeg_capture_options(options):
+                assert os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] == options
+            assert os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] == options
+
+        assert "OPENCV_FFMPEG_CAPTURE_OPTIONS" not in os.environ
 
 
 # ──────────────────────────────────────────────
@@ -221,6 +462,7 @@ class TestTryOpenCamera:
 
         open_cap = MagicMock()
         open_cap.isOpened.return_value = True
+        open_cap.get.return_value = 0.0
 
         thread = USBCameraThread(
             camera_id=0, frame_queue=frame_queue, stop_event=stop_event
@@ -245,6 +487,7 @@ class TestTryOpenCamera:
         """Исключение при открытии бэкенда не прерывает перебор."""
         open_cap = MagicMock()
         open_cap.isOpened.return_value = True
+        open_cap.get.return_value = 0.0
 
         thread = USBCameraThread(
             camera_id=0, frame_queue=frame_queue, stop_event=stop_event
@@ -255,6 +498,27 @@ class TestTryOpenCamera:
             cap = thread._try_open_camera([cv2.CAP_V4L2, cv2.CAP_DSHOW])
             assert cap is open_cap
 
+    def test_reconnect_tries_working_backend_first(self, stop_event, frame_queue):
+        """При переподключении сначала пробуется сработавший ранее бэкенд."""
+        closed_cap = MagicMock()
+        closed_cap.isOpened.return_value = False
+        open_cap = MagicMock()
+        open_cap.isOpened.return_value = True
+        open_cap.get.return_value = 0.0
+
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+        backends = [cv2.CAP_DSHOW, cv2.CAP_MSMF]
+        with patch("cv2.VideoCapture", side_effect=[closed_cap, open_cap]):
+            thread._try_open_camera(backends)
+        with patch("cv2.VideoCapture", return_value=open_cap) as capture:
+            thread._try_open_camera(backends)
+
+        assert thread._working_backend == cv2.CAP_MSMF
+        capture.assert_called_once()
+        assert capture.call_args.args[1] == cv2.CAP_MSMF
+
 
 # ──────────────────────────────────────────────
 #  IP-камера: _open_camera с RTSP
@@ -299,16 +563,247 @@ class TestIPCameraOpen:
             frame_queue=frame_queue,
             stop_event=stop_event,
         )
-        with patch("cv2.VideoCapture", side_effect=Exception("network error")):
+        with patch("cv2.VideoCapture", side_effect=cv2.error("network error")):
             cap = thread._open_camera()
             assert cap is None
 
 
+class TestCpuAffinity:
+    """Тесты привязки потока захвата к ядру CPU."""
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_getaffinity"), reason="нужен sched_setaffinity"
+    )
+    def test_pins_only_calling_thread(self):
+        """Привязывается только вызывающий поток, а не весь процесс."""
+        before = os.sched_getaffinity(0)
+        cpu = min(before)
+        seen = {}
+
+        def worker():
+            seen["pinned"] = pin_current_thread(cpu)
+            seen["affinity"] = os.sched_getaffinity(0)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+        assert seen == {"pinned": True, "affinity": {cpu}}
+        assert os.sched_getaffinity(0) == before
+
+    def test_run_applies_affinity(self, stop_event, frame_queue):
+        """run() привязывает поток, если задан cpu_affinity."""
+        thread = USBCameraThread(
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+            cpu_affinity=0,
+        )
+        stop_event.set()
+
+        with patch.object(thread, "_apply_cpu_affinity") as apply:
+            thread.run()
+        apply.assert_called_once()
+
+    def test_no_affinity_by_default(self, stop_event, frame_queue):
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+        stop_event.set()
+
+        with patch.object(thread, "_apply_cpu_affinity") as apply:
+            thread.run()
+        apply.assert_not_called()
+
+
+class TestCudaDecode:
+    """Тесты декодирования RTSP на GPU через cv2.cudacodec."""
+
+    def _thread(self, stop_event, frame_queue):
+        return IPCameraThread(
+            rtsp_url="rtsp://192.168.1.1/live",
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+            cuda_decode=True,
+        )
+
+    def test_uses_cuda_reader_when_available(self, stop_event, frame_queue):
+        """При наличии CUDA поток открывается через cudacodec, не FFMPEG."""
+        thread = self._thread(stop_event, frame_queue)
+        cuda_cap = MagicMock()
+        with patch(
+            "src.omniview.threads.cuda_decode_available", return_value=True
+        ), patch(
+            "src.omniview.threads.CudaVideoCapture", return_value=cuda_cap
+        ), patch("cv2.VideoCapture") as video_capture:
+            assert thread._open_camera() is cuda_cap
+        video_capture.assert_not_called()
+
+    def test_falls_back_to_ffmpeg_without_cuda(
+        self, stop_event, frame_queue, mock_video_capture
+    ):
+        """Без CUDA используется обычный FFMPEG-путь."""
+        thread = self._thread(stop_event, frame_queue)
+        with patch(
+            "src.omniview.threads.cuda_decode_available", return_value=False
+        ), patch("cv2.VideoCapture", return_value=mock_video_capture):
+            assert thread._open_camera() is mock_video_capture
+
+    def test_falls_back_when_cuda_reader_fails(
+        self, stop_event, frame_queue, mock_video_capture
+    ):
+        """Ошибка cudacodec (например, неподдерживаемый кодек) — откат на FFMPEG."""
+        thread = self._thread(stop_event, frame_queue)
+        with patch(
+            "src.omniview.threads.cuda_decode_available", return_value=True
+        ), patch(
+            "src.omniview.threads.CudaVideoCapture", side_effect=cv2.error("nvdec")
+        ), patch("cv2.VideoCapture", return_value=mock_video_capture):
+            assert thread._open_camera() is mock_video_capture
+
+    def test_gpu_frames_not_downloaded(self, stop_event, frame_queue):
+        """При gpu_frames=True ридер отдаёт GpuMat без download()."""
+        thread = self._thread(stop_event, frame_queue)
+        thread.gpu_frames = True
+        with patch("src.omniview.threads.CudaVideoCapture") as cuda_capture:
+            thread._open_cuda_camera()
+        cuda_capture.assert_called_once_with(thread.rtsp_url, download=False)
+
+    def test_cuda_not_available_in_cpu_build(self):
+        """В сборке OpenCV без CUDA декодирование на GPU недоступно."""
+        with patch("cv2.cuda.getCudaEnabledDeviceCount", return_value=0):
+            assert cuda_decode_available() is False
+
+
+class TestGStreamerPipeline:
+    """Тесты открытия RTSP через GStreamer-конвейер."""
+
+    def _thread(self, stop_event, frame_queue):
+        return IPCameraThread(
+            rtsp_url="rtsp://192.168.1.1/live",
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+            gstreamer=True,
+        )
+
+    def test_pipeline_has_single_frame_appsink(self):
+        """Конвейер содержит URL и appsink с буфером в один кадр."""
+        pipeline = build_gstreamer_pipeline("rtsp://cam/live")
+        assert 'location="rtsp://cam/live"' in pipeline
+        assert "appsink max-buffers=1 drop=true" in pipeline
+
+    def test_opens_with_gstreamer_backend(
+        self, stop_event, frame_queue, mock_video_capture
+    ):
+        """При наличии GStreamer поток открывается через CAP_GSTREAMER."""
+        thread = self._thread(stop_event, frame_queue)
+        with patch(
+            "src.omniview.threads.gstreamer_available", return_value=True
+        ), patch("cv2.VideoCapture", return_value=mock_video_capture) as vc:
+            assert thread._open_camera() is mock_video_capture
+        source, backend = vc.call_args[0]
+        assert source == build_gstreamer_pipeline(thread.rtsp_url)
+        assert backend == cv2.CAP_GSTREAMER
+
+    def test_falls_back_to_ffmpeg_without_gstreamer(
+        self, stop_event, frame_queue, mock_video_capture
+    ):
+        """Сборка без GStreamer — используется FFMPEG."""
+        thread = self._thread(stop_event, frame_queue)
+        with patch(
+            "src.omniview.threads.gstreamer_available", return_value=False
+        ), patch("cv2.VideoCapture", return_value=mock_video_capture) as vc:
+            thread._open_camera()
+        assert vc.call_args_list[0][0][1] == cv2.CAP_FFMPEG
+
+
 # ──────────────────────────────────────────────
 #  Освобождение ресурсов
 # ──────────────────────────────────────────────
 
 
+class TestV4L2OnDemand:
+    """Тесты захвата по запросу через V4L2 (один буфер, Q=1)."""
+
+    def _thread(self, stop_event, frame_queue, monkeypatch):
+        monkeypatch.setattr("sys.platform", "linux")
+        return USBCameraThread(
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+            v4l2_on_demand=True,
+        )
+
+    def test_opens_on_demand_capture(self, stop_event, frame_queue, monkeypatch):
+        """При v4l2_on_demand камера открывается напрямую через V4L2."""
+        thread = self._thread(stop_event, frame_queue, monkeypatch)
+        v4l2_cap = MagicMock()
+        with patch(
+            "src.omniview.threads.OnDemandV4L2Capture", return_value=v4l2_cap
+        ) as on_demand, patch("cv2.VideoCapture") as video_capture:
+            assert thread._open_camera() is v4l2_cap
+        on_demand.assert_called_once_with(0, 640, 480, "MJPG", 30)
+        v4l2_cap.set.assert_called_once_with(cv2.CAP_PROP_AUTOFOCUS, 0)
+        video_capture.assert_not_called()
+
+    def test_falls_back_to_opencv(
+        self, stop_event, frame_queue, monkeypatch, mock_video_capture
+    ):
+        """Ошибка открытия V4L2 — откат на cv2.VideoCapture."""
+        thread = self._thread(stop_event, frame_queue, monkeypatch)
+        with patch(
+            "src.omniview.threads.OnDemandV4L2Capture", side_effect=OSError("busy")
+        ), patch("cv2.VideoCapture", return_value=mock_video_capture):
+            assert thread._open_camera() is mock_video_capture
+
+    def test_buffer_queued_right_before_wait(self):
+        """Пустой буфер ставится в очередь непосредственно перед select()."""
+        from src.omniview import v4l2_backend
+
+        events = []
+        camera = MagicMock(fd=5)
+        camera._qbuf.side_effect = lambda index: events.append("qbuf")
+        camera._decode.return_value = np.zeros((480, 640, 3), np.uint8)
+
+        def fake_select(*args):
+            events.append("select")
+            return [5], [], []
+
+        with patch.object(v4l2_backend, "V4L2Camera", return_value=camera), patch(
+            "select.select", side_effect=fake_select
+        ), patch.object(v4l2_backend, "_xioctl"):
+            cap = v4l2_backend.OnDemandV4L2Capture(0)
+            camera.start.assert_called_once_with(queue_buffers=False)
+            assert events == []
+
+            ret, frame = cap.read()
+            cap.read()
+
+        assert ret and frame.shape == (480, 640, 3)
+        assert events == ["qbuf", "select", "qbuf", "select"]
+
+    def test_fps_and_autofocus_applied_as_controls(self):
+        """FPS задаётся через S_PARM до STREAMON, автофокус — через S_CTRL."""
+        from src.omniview import v4l2_backend
+
+        events = []
+        camera = MagicMock(fd=5, fps=15.0)
+        camera.set_fps.side_effect = lambda fps: events.append(("fps", fps))
+        camera.start.side_effect = lambda **kwargs: events.append("start")
+
+        with patch.object(v4l2_backend, "V4L2Camera", return_value=camera):
+            cap = v4l2_backend.OnDemandV4L2Capture(0, fps=30)
+            cap.set(cv2.CAP_PROP_AUTOFOCUS, 0)
+
+        assert events == [("fps", 30), "start"]
+        camera.set_control.assert_called_once_with(
+            v4l2_backend.V4L2_CID_FOCUS_AUTO, 0
+        )
+        assert cap.get(cv2.CAP_PROP_FPS) == 15.0
+
+
 class TestReleaseResources:
     """Тесты _release_camera_resources."""
 
@@ -360,43 +855,82 @@ class TestHandleCameraError:
         )
         assert thread.retry_count == 0
 
-        with patch("time.sleep"):
+        with patch.object(stop_event, "wait"):
             thread._handle_camera_error("USB Camera 0", RuntimeError("fail"))
         assert thread.retry_count == 1
 
-    def test_does_not_sleep_on_last_retry(self, stop_event, frame_queue):
-        """На последней попытке sleep не вызывается (нет смысла ждать)."""
+    def test_does_not_wait_on_last_retry(self, stop_event, frame_queue):
+        """На последней попытке ожидания нет (нет смысла ждать)."""
         thread = USBCameraThread(
             camera_id=0, frame_queue=frame_queue, stop_event=stop_event
         )
         thread.retry_count = 2  # max_retries - 1
 
-        with patch("time.sleep") as mock_sleep:
+        with patch.object(stop_event, "wait") as mock_wait:
             thread._handle_camera_error("USB Camera 0", RuntimeError("fail"))
-        mock_sleep.assert_not_called()
+        mock_wait.assert_not_called()
         assert thread.retry_count == 3
 
-    def test_sleeps_between_retries(self, stop_event, frame_queue):
-        """Между попытками есть задержка 2 секунды."""
+    def test_backoff_doubles_between_retries(self, stop_event, frame_queue):
+        """Верхняя граница задержки перед переподключением растёт экспоненциально."""
         thread = USBCameraThread(
             camera_id=0, frame_queue=frame_queue, stop_event=stop_event
         )
-        thread.retry_count = 0
+        thread.max_retries = 10
 
-        with patch("time.sleep") as mock_sleep:
-            thread._handle_camera_error("USB Camera 0", RuntimeError("fail"))
-        mock_sleep.assert_called_once_with(2.0)
+        with patch.object(stop_event, "wait") as mock_wait, patch(
+            "random.uniform", side_effect=lambda low, high: high
+        ):
+            for _ in range(3):
+                thread._handle_camera_error("USB Camera 0", RuntimeError("fail"))
+        delays = [c.args[0] for c in mock_wait.call_args_list]
+        assert delays == [0.5, 1.0, 2.0]
 
-    def test_no_sleep_when_max_retries_is_zero(self, stop_event, frame_queue):
-        """При max_retries=0 _handle_camera_error не вызывает sleep."""
+    def test_backoff_is_capped(self, stop_event, frame_queue):
+        """Задержка не превышает RECONNECT_MAX_DELAY."""
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+        thread.retry_count = 20
+
+        with patch("random.uniform", side_effect=lambda low, high: high):
+            assert thread._reconnect_delay() == thread.RECONNECT_MAX_DELAY
+
+    def test_backoff_is_jittered(self, stop_event, frame_queue):
+        """Задержка случайна в пределах [0, граница]: камеры не переподключаются разом."""
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+        thread.retry_count = 3  # граница 2 с
+
+        delays = {thread._reconnect_delay() for _ in range(20)}
+
+        assert all(0 <= delay <= 2.0 for delay in delays)
+        assert len(delays) > 1
+
+    def test_backoff_interrupted_by_stop(self, stop_event, frame_queue):
+        """stop_event прерывает ожидание переподключения."""
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+        thread.max_retries = 10
+        thread.retry_count = 6  # задержка 8 с
+        stop_event.set()
+
+        start = time.monotonic()
+        thread._handle_camera_error("USB Camera 0", RuntimeError("fail"))
+        assert time.monotonic() - start < 1.0
+
+    def test_no_wait_when_max_retries_is_zero(self, stop_event, frame_queue):
+        """При max_retries=0 _handle_camera_error не ждёт."""
         thread = USBCameraThread(
             camera_id=0, frame_queue=frame_queue, stop_event=stop_event
         )
         thread.max_retries = 0
 
-        with patch("time.sleep") as mock_sleep:
+        with patch.object(stop_event, "wait") as mock_wait:
             thread._handle_camera_error("USB Camera 0", RuntimeError("fail"))
-            mock_sleep.assert_not_called()
+            mock_wait.assert_not_called()
 
     def test_run_skips_open_camera_when_max_retries_is_zero(
         self, stop_event, frame_queue
@@ -437,7 +971,8 @@ class TestProcessCameraStream:
             return True, fake_frame.copy()
 
         cap = MagicMock()
-        cap.read.side_effect = mock_read
+        cap.grab.return_value = True
+        cap.retrieve.side_effect = mock_read
         thread.cap = cap
 
         thread._process_camera_stream("USB Camera 0")
@@ -454,7 +989,7 @@ class TestProcessCameraStream:
         )
 
         cap = MagicMock()
-        cap.read.return_value = (False, None)
+        cap.grab.return_value = False
         thread.cap = cap
 
         # Не должен зависнуть — выходит из цикла при ret == False
@@ -472,12 +1007,298 @@ class TestProcessCameraStream:
         thread.retry_count = 2
 
         cap = MagicMock()
-        cap.read.return_value = (False, None)
+        cap.grab.return_value = False
         thread.cap = cap
 
         thread._process_camera_stream("USB Camera 0")
         assert thread.retry_count == 0
 
+    def test_read_error_during_min_uptime_waits_on_stop_event(
+        self, stop_event, frame_queue
+    ):
+        """Ошибка чтения в течение min_uptime ждёт на stop_event, а не спит."""
+        thread = USBCameraThread(
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+            min_uptime=60.0,
+        )
+
+        cap = MagicMock()
+        cap.grab.return_value = False
+        thread.cap = cap
+
+        with patch.object(
+            stop_event, "wait", side_effect=lambda timeout: stop_event.set()
+        ) as mock_wait:
+            thread._process_camera_stream("USB Camera 0")
+
+        mock_wait.assert_called_once_with(0.1)
+
+    def test_read_errors_logged_once_per_interval(
+        self, stop_event, frame_queue, caplog
+    ):
+        """Серия ошибок чтения — одно предупреждение за интервал."""
+        thread = USBCameraThread(
+            camera_id=0,
+            frame_queue=frame_queue,
+            stop_event=stop_event,
+            min_uptime=60.0,
+        )
+        thread.cap = MagicMock()
+        thread.cap.grab.return_value = False
+        waits = 0
+
+        def wait(timeout):
+            nonlocal waits
+            waits += 1
+            if waits == 5:
+                stop_event.set()
+
+        with patch.object(stop_event, "wait", side_effect=wait), caplog.at_level(
+            "WARNING"
+        ):
+            thread._process_camera_stream("USB Camera 0")
+
+        assert thread.read_errors == 5
+        assert caplog.text.count("read error") == 1
+
+
+class TestSelectiveDecoding:
+    """Тесты grab()/retrieve(): пропущенные кадры не декодируются."""
+
+    @staticmethod
+    def _stream_cap(stop_event, fake_frame, grabs):
+        """Мок, который отдаёт `grabs` кадров и затем останавливает поток."""
+        count = 0
+
+        def grab():
+            nonlocal count
+            count += 1
+            if count >= grabs:
+                stop_event.set()
+            return True
+
+        cap = MagicMock()
+        cap.grab.side_effect = grab
+        cap.retrieve.return_value = (True, fake_frame)
+        return cap
+
+    def test_decodes_every_frame_by_default(self, stop_event, fake_frame):
+        """По умолчанию каждый захваченный кадр декодируется."""
+        q = queue.Queue()
+        thread = USBCameraThread(camera_id=0, frame_queue=q, stop_event=stop_event)
+        thread.cap = self._stream_cap(stop_event, fake_frame, grabs=4)
+
+        thread._process_camera_stream("USB Camera 0")
+
+        assert thread.cap.retrieve.call_count == 4
+        assert q.qsize() == 4
+
+    def test_stats_count_grabbed_and_delivered(self, stop_event, fake_frame):
+        """stats() считает захваченные и отданные кадры и задержку retrieve."""
+        q = queue.Queue()
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=q, stop_event=stop_event, sample_every=2
+        )
+        assert thread.stats()["retrieve_ms_p99"] == 0.0
+        thread.cap = self._stream_cap(stop_event, fake_frame, grabs=4)
+
+        thread._process_camera_stream("USB Camera 0")
+
+        stats = thread.stats()
+        assert stats["frames_grabbed"] == 4
+        assert stats["frames_delivered"] == 2
+        assert stats["read_errors"] == 0
+        assert 0.0 <= stats["retrieve_ms_p50"] <= stats["retrieve_ms_p99"]
+
+    def test_sample_every_skips_decode(self, stop_event, fake_frame):
+        """sample_every=3 — декодируется только каждый третий кадр."""
+        q = queue.Queue()
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=q, stop_event=stop_event, sample_every=3
+        )
+        thread.cap = self._stream_cap(stop_event, fake_frame, grabs=9)
+
+        thread._process_camera_stream("USB Camera 0")
+
+        assert thread.cap.grab.call_count == 9
+        assert thread.cap.retrieve.call_count == 3
+        assert q.qsize() == 3
+
+    def test_target_fps_throttles_decode(self, stop_event, fake_frame):
+        """target_fps ограничивает частоту декодирования по времени."""
+        q = queue.Queue()
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=q, stop_event=stop_event, target_fps=1.0
+        )
+        thread.cap = self._stream_cap(stop_event, fake_frame, grabs=5)
+
+        thread._process_camera_stream("USB Camera 0")
+
+        # Все 5 кадров захвачены быстрее секунды — декодирован только первый.
+        assert thread.cap.retrieve.call_count == 1
+
+    def test_target_fps_uses_monotonic_clock(self, stop_event, fake_frame):
+        """Темп декодирования считается по time.monotonic, а не time.time."""
+        q = queue.Queue()
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=q, stop_event=stop_event, target_fps=1.0
+        )
+        thread.cap = self._stream_cap(stop_event, fake_frame, grabs=3)
+
+        # Первое значение — начало потока, затем по одному на кадр
+        with patch("time.monotonic", side_effect=[0.0, 10.0, 11.0, 11.5]):
+            thread._process_camera_stream("USB Camera 0")
+
+        assert thread.cap.retrieve.call_count == 2
+
+
+class TestFullQueue:
+    """Тесты записи кадров в ограниченную очередь."""
+
+    def test_capture_never_blocks_on_full_queue(self, stop_event, fake_frame):
+        """Поток захвата не блокируется на полной очереди и кладёт свежий кадр."""
+        q = queue.Queue(maxsize=1)
+        thread = USBCameraThread(camera_id=0, frame_queue=q, stop_event=stop_event)
+        thread.cap = TestSelectiveDecoding._stream_cap(stop_event, fake_frame, 5)
+        frames = [np.full((2, 2, 3), i, dtype=np.uint8) for i in range(5)]
+        thread.cap.retrieve.side_effect = [(True, f) for f in frames]
+
+        worker = threading.Thread(
+            target=thread._process_camera_stream, args=("USB Camera 0",)
+        )
+        worker.start()
+        worker.join(timeout=2.0)
+
+        assert not worker.is_alive()
+        assert q.get_nowait()[1] is frames[-1]
+
+
+class TestOutputScaling:
+    """Тесты уменьшения кадров в потоке захвата (output_width/output_height)."""
+
+    def _thread(self, stop_event, **kwargs):
+        return USBCameraThread(
+            camera_id=0,
+            frame_queue=queue.Queue(),
+            stop_event=stop_event,
+            output_width=320,
+            output_height=240,
+            **kwargs,
+        )
+
+    def test_delivers_scaled_frame(self, stop_event, fake_frame):
+        """В очередь попадает уменьшенный кадр."""
+        thread = self._thread(stop_event)
+
+        def retrieve():
+            stop_event.set()
+            return True, fake_frame
+
+        thread.cap = MagicMock()
+        thread.cap.grab.return_value = True
+        thread.cap.retrieve.side_effect = retrieve
+
+        thread._process_camera_stream("USB Camera 0")
+
+        _, frame = thread.frame_queue.get_nowait()
+        assert frame.shape == (240, 320, 3)
+
+    def test_reuses_scaling_buffer(self, stop_event, fake_frame):
+        """С reuse_buffers уменьшенный кадр пишется в освободившийся буфер."""
+        thread = self._thread(stop_event, reuse_buffers=True)
+
+        first = thread._scale_frame(fake_frame)
+        first_id = id(first)
+        del first
+        second = thread._scale_frame(fake_frame)
+
+        assert id(second) == first_id
+
+    def test_raw_frames_not_scaled(self, stop_event):
+        """Сырые кадры (YUYV/MJPEG) не масштабируются."""
+        thread = self._thread(stop_event, frame_format="raw")
+        assert thread.output_size is None
+
+
+class TestBufferReuse:
+    """Тесты reuse_buffers: декодирование в пул переиспользуемых буферов."""
+
+    @staticmethod
+    def _retrieve(shape=(4, 4, 3)):
+        """Мок retrieve(): пишет в переданный буфер или создаёт новый."""
+
+        def retrieve(dst=None):
+            if dst is None or dst.shape != shape:
+                return True, np.zeros(shape, dtype=np.uint8)
+            return True, dst
+
+        return retrieve
+
+    def test_disabled_by_default(self, stop_event):
+        """По умолчанию retrieve() вызывается без буфера."""
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=queue.Queue(), stop_event=stop_event
+        )
+        thread.cap = MagicMock()
+        thread.cap.retrieve.return_value = (True, None)
+
+        thread._retrieve_frame()
+
+        thread.cap.retrieve.assert_called_once_with()
+
+    def test_reuses_released_buffer(self, stop_event):
+        """Буфер, на кадр в котором больше нет ссылок, используется повторно."""
+        thread = USBCameraThread(
+            camera_id=0,
+            frame_queue=queue.Queue(),
+            stop_event=stop_event,
+            reuse_buffers=True,
+        )
+        thread.cap = MagicMock()
+        thread.cap.retrieve.side_effect = self._retrieve()
+
+        first_id = id(thread._retrieve_frame()[1])
+        second = thread._retrieve_frame()[1]
+
+        assert id(second) == first_id
+        assert len(thread._pool) == 1
+
+    def test_held_frame_not_overwritten(self, stop_event):
+        """Кадр, который кто-то держит, не перезаписывается следующим."""
+        thread = USBCameraThread(
+            camera_id=0,
+            frame_queue=queue.Queue(),
+            stop_event=stop_event,
+            reuse_buffers=True,
+        )
+        thread.cap = MagicMock()
+        thread.cap.retrieve.side_effect = self._retrieve()
+
+        held = [thread._retrieve_frame()[1] for _ in range(3)]
+
+        assert len({id(f) for f in held}) == 3
+
+    def test_adopts_reallocated_frame(self, stop_event):
+        """При смене разрешения буфер заменяется новым массивом."""
+        thread = USBCameraThread(
+            camera_id=0,
+            frame_queue=queue.Queue(),
+            stop_event=stop_event,
+            reuse_buffers=True,
+        )
+        thread.cap = MagicMock()
+        thread.cap.retrieve.side_effect = self._retrieve()
+        thread._retrieve_frame()
+
+        thread.cap.retrieve.side_effect = self._retrieve(shape=(8, 8, 3))
+        _, frame = thread._retrieve_frame()
+
+        assert frame.shape == (8, 8, 3)
+        assert len(thread._pool) == 1
+        assert thread._pool.acquire() is None  # занят кадром `frame`
+
 
 # ──────────────────────────────────────────────
 #  Жизненный цикл потока (run)
@@ -504,8 +1325,8 @@ class TestThreadRunLifecycle:
             camera_id=0, frame_queue=frame_queue, stop_event=stop_event
         )
 
-        with patch.object(thread, "_open_camera", return_value=None), patch(
-            "time.sleep"
+        with patch.object(thread, "_open_camera", return_value=None), patch.object(
+            stop_event, "wait"
         ):
             thread.run()
 
@@ -529,16 +1350,27 @@ class TestThreadRunLifecycle:
                 return None
             return mock_video_capture
 
-        mock_video_capture.read.side_effect = RuntimeError("read failed")
+        mock_video_capture.grab.side_effect = RuntimeError("read failed")
 
-        with patch.object(thread, "_open_camera", side_effect=side_effect_open), patch(
-            "time.sleep"
-        ):
+        with patch.object(
+            thread, "_open_camera", side_effect=side_effect_open
+        ), patch.object(stop_event, "wait"):
             thread.run()
 
         # После выхода cap должен быть None (ресурсы освобождены)
         assert thread.cap is None
 
+    def test_run_does_not_swallow_programming_errors(self, stop_event, frame_queue):
+        """Ошибки, не связанные с захватом, не маскируются переподключением."""
+        thread = USBCameraThread(
+            camera_id=0, frame_queue=frame_queue, stop_event=stop_event
+        )
+
+        with patch.object(thread, "_open_camera", side_effect=TypeError("bug")):
+            with pytest.raises(TypeError):
+                thread.run()
+        assert thread.retry_count == 0
+
 
 # ──────────────────────────────────────────────
 #  DEFAULT_BACKENDS
@@ -583,7 +1415,8 @@ class TestFrameQueueBehavior:
             return True, fake_frame.copy()
 
         cap = MagicMock()
-        cap.read.side_effect = mock_read
+        cap.grab.return_value = True
+        cap.retrieve.side_effect = mock_read
         thread.cap = cap
         thread.min_uptime = 0.0
 
@@ -612,7 +1445,8 @@ class TestFrameQueueBehavior:
             return True, fake_frame.copy()
 
         cap = MagicMock()
-        cap.read.side_effect = mock_read
+        cap.grab.return_value = True
+        cap.retrieve.side_effect = mock_read
         thread.cap = cap
         thread.min_uptime = 0.0
 
@@ -15,12 +15,7 @@ class TestPresentVideoDevices:
 
     def _patch_sysfs(self, monkeypatch, target: Path):
         """Заставить present_video_devices читать наш каталог вместо sysfs."""
-        real_path = Path
-        monkeypatch.setattr(
-            usb_topology,
-            "Path",
-            lambda p: target if p == "/sys/class/video4linux" else real_path(p),
-        )
+        monkeypatch.setattr(usb_topology, "_V4L_CLASS_DIR", str(target))
 
     def test_returns_present_video_indices(self, tmp_path, monkeypatch):
         """Возвращает индексы videoN, игнорируя прочие узлы."""
@@ -52,6 +47,18 @@ class TestPresentVideoDevices:
 
         assert usb_topology.present_video_devices() is None
 
+    def test_sysfs_paths_resolve_symlinks(self, tmp_path, monkeypatch):
+        """_video_sysfs_paths разрешает симлинки sysfs в реальные пути."""
+        device = tmp_path / "devices" / "usb3" / "3-1" / "video4linux" / "video2"
+        device.mkdir(parents=True)
+        v4l = tmp_path / "video4linux"
+        v4l.mkdir()
+        (v4l / "video2").symlink_to(device)
+
+        self._patch_sysfs(monkeypatch, v4l)
+
+        assert usb_topology._video_sysfs_paths() == {2: str(device)}
+
 
 class TestPresentCaptureDevices:
     """Тесты present_capture_devices (фильтрация metadata-узлов V4L2)."""
@@ -83,3 +90,43 @@ class TestPresentCaptureDevices:
         """Если sysfs недоступен (None) — пробрасывает None."""
         monkeypatch.setattr(usb_topology, "present_video_devices", lambda: None)
         assert usb_topology.present_capture_devices() is None
+
+    def test_capability_cached_per_device_node(self, monkeypatch):
+        """QUERYCAP выполняется один раз на узел, пока узел не пересоздан."""
+        monkeypatch.setattr(usb_topology, "_capture_cache", {})
+        monkeypatch.setattr(usb_topology, "present_video_devices", lambda: {0, 1})
+        identity = {0: (10, 1), 1: (11, 1)}
+        monkeypatch.setattr(usb_topology, "_device_identity", identity.get)
+        probed = []
+
+        def querycap(idx):
+            probed.append(idx)
+            return idx == 0
+
+        monkeypatch.setattr(usb_topology, "_supports_video_capture", querycap)
+
+        assert usb_topology.present_capture_devices() == {0}
+        assert usb_topology.present_capture_devices() == {0}
+        assert sorted(probed) == [0, 1]
+
+        # Переподключение: узел video0 пересоздан — способность проверяется снова.
+        identity[0] = (12, 2)
+        assert usb_topology.present_capture_devices() == {0}
+        assert sorted(probed) == [0, 0, 1]
+
+    def test_unknown_capability_not_cached(self, monkeypatch):
+        """Неопределённый результат (None) не кэшируется и перепроверяется."""
+        monkeypatch.setattr(usb_topology, "_capture_cache", {})
+        monkeypatch.setattr(usb_topology, "present_video_devices", lambda: {0})
+        monkeypatch.setattr(usb_topology, "_device_identity", lambda idx: (1, 1))
+        probed = []
+
+        def querycap(idx):
+            probed.append(idx)
+            return None
+
+        monkeypatch.setattr(usb_topology, "_supports_video_capture", querycap)
+
+        usb_topology.present_capture_devices()
+        usb_topology.present_capture_devices()
+        assert probed == [0, 0]